@@ -30,3 +30,22 @@ METADATA_PATH = DATA_DIR / "metadata.json"
 # Set VAR_DIR=/app/var in Railway dashboard environment variables.
 _VAR_DIR = Path(os.getenv("VAR_DIR", str(DATA_DIR)))
 DATABASE_URL = f"sqlite:///{_VAR_DIR / 'conversations.db'}"
+
+# Host-local SQLite file for the optional cross-worker explore cache (L2) and the shared
+# invalidation generation. Must live on local disk — every uvicorn worker on the box opens it.
+SHARED_CACHE_PATH = Path(os.getenv("SHARED_CACHE_PATH", str(_VAR_DIR / "shared_cache.db")))
+
+# Host-local SQLite file for the optional on-disk tier of the LLM output cache
+# (app/services/llm_cache.py) — enabled with LLM_CACHE_PERSIST=true.
+LLM_CACHE_PATH = Path(os.getenv("LLM_CACHE_PATH", str(_VAR_DIR / "llm_cache.db")))
+
+# Read-only search snapshot written by scripts/ingest.py next to the files above:
+# a FAISS index loadable with IO_FLAG_MMAP plus columnar metadata (app/services/index_snapshot.py).
+# Every uvicorn worker maps the same files, so they share page cache instead of
+# each holding a private copy of the index and every bio.
+SNAPSHOT_DIR = Path(os.getenv("SNAPSHOT_DIR", str(DATA_DIR / "snapshot")))
+
+# Index type of the server snapshot — flat | hnsw | ivf | sq8 | fp16 | pq
+# (app/services/index_factory.py). faiss.index itself is always the exact flat index;
+# scripts/ingest.py --index-type overrides this per run.
+INDEX_TYPE = os.getenv("INDEX_TYPE", "flat").lower()
@@ -4,8 +4,11 @@ FastAPI application entry point.
 Startup sequence (lifespan):
 1. Create/migrate DB tables
 2. Seed Expert table from experts.csv if empty
-3. Load FAISS index from disk → app.state.faiss_index
-4. Load metadata JSON → app.state.metadata
+3. Load the search snapshot → app.state.search_snapshot: FAISS index, metadata,
+   username → position map and exact vectors from one ingest generation
+   (memory-mapped when present — app/services/index_snapshot.py; else faiss.index +
+   metadata.json). Readers take this one reference — app/services/search_snapshot.py
+4. Build expert catalog snapshot → app.state.catalog
 5. Yield (server is ready)
 6. Shutdown: nothing to clean up for in-memory FAISS
 
@@ -16,12 +19,10 @@ Production: Railway injects the actual Vercel URL.
 """
 import asyncio
 import csv
-import json
 import os
 from contextlib import asynccontextmanager
 
 import app.models  # noqa: F401 — registers ORM models with Base metadata
-import faiss
 import sentry_sdk
 import structlog
 from dotenv import load_dotenv
@@ -35,6 +36,7 @@ from app.database import Base, SessionLocal, engine
 from app.event_queue import _event_queue
 from app.models import Expert
 from app.routers import admin, browse, chat, email_capture, events, feedback, health, explore, newsletter, suggest
+from app.services.search_snapshot import install_search_snapshot, load_search_snapshot
 
 # Load .env for local development — no-op in production (Railway injects env vars)
 load_dotenv()
@@ -331,6 +333,12 @@ async def lifespan(app: FastAPI):
         sync_all_expert_tags(_db)
     log.info("startup: expert_tags table populated")
 
+    # Materialized feedback counters for the ranking paths — full rebuild, same as expert_tags
+    from app.services.feedback_stats import rebuild_feedback_stats  # noqa: PLC0415
+    with SessionLocal() as _db:
+        rebuild_feedback_stats(_db)
+    log.info("startup: expert_feedback_stats table populated")
+
     # Phase 11: settings table — created by Base.metadata.create_all() above on fresh DBs;
     # on existing DBs create_all() adds missing tables idempotently without modifying existing ones.
     log.info("startup: settings table created/verified")
@@ -350,27 +358,26 @@ async def lifespan(app: FastAPI):
             "Run scripts/ingest.py before starting the server."
         )
 
-    app.state.faiss_index = faiss.read_index(str(FAISS_INDEX_PATH))
-    log.info("startup: FAISS index loaded", vectors=app.state.faiss_index.ntotal)
-
     if not METADATA_PATH.exists():
         raise RuntimeError(f"Metadata not found at {METADATA_PATH}.")
 
-    with open(METADATA_PATH, "r", encoding="utf-8") as f:
-        app.state.metadata = json.load(f)
-    log.info("startup: metadata loaded", records=len(app.state.metadata))
-
-    # Phase 14: username → FAISS positional index mapping (covers the 536 embedded experts)
-    _username_to_pos: dict[str, int] = {}
-    for _pos, _row in enumerate(app.state.metadata):
-        _uname = _row.get("Username") or _row.get("username") or ""
-        if _uname:
-            _username_to_pos[_uname] = _pos
-    app.state.username_to_faiss_pos = _username_to_pos
+    # Index + metadata + username → FAISS position map (Phase 14) from one generation;
+    # retrieval records and coarse codes are precompiled before it is installed
+    _search_snapshot = load_search_snapshot()
+    install_search_snapshot(app.state, _search_snapshot)
     log.info(
-        "startup: username-to-FAISS-position mapping built",
-        count=len(_username_to_pos),
+        "startup: search snapshot loaded",
+        generation=_search_snapshot.generation,
+        vectors=_search_snapshot.ntotal,
+        records=len(_search_snapshot.metadata),
+        usernames=len(_search_snapshot.username_to_faiss_pos),
     )
+
+    # Columnar expert catalog snapshot for run_explore Stage 1 — rebuilt lazily on invalidation
+    from app.services.catalog import build_catalog, install_catalog  # noqa: PLC0415
+    with SessionLocal() as _db:
+        install_catalog(app.state, build_catalog(_db, _search_snapshot))
+    log.info("startup: expert catalog snapshot built", experts=len(app.state.catalog))
     # Phase 14: category auto-classification (one-time startup migration)
     from app.routers.admin import _auto_categorize as _categorize  # noqa: PLC0415
     from sqlalchemy import select as _select  # noqa: PLC0415
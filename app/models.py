@@ -6,7 +6,7 @@ Email is required — the chat endpoint enforces this at request validation time
 """
 import datetime
 
-from sqlalchemy import Boolean, DateTime, Float, Index, String, Text
+from sqlalchemy import Boolean, DateTime, Float, Index, LargeBinary, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -89,6 +89,64 @@ class Feedback(Base):
     )
 
 
+class ExpertFeedbackStats(Base):
+    """
+    Materialized per-expert vote counters derived from the feedback table.
+    Keyed by the profile URL stored in Feedback.expert_ids (profile_url_utm or profile_url).
+    Incremented in the same transaction as each POST /api/feedback insert and rebuilt
+    from the feedback table on demand — see app/services/feedback_stats.py.
+    """
+
+    __tablename__ = "expert_feedback_stats"
+
+    profile_url: Mapped[str] = mapped_column(String(500), primary_key=True)
+    up: Mapped[int] = mapped_column(nullable=False, default=0)
+    down: Mapped[int] = mapped_column(nullable=False, default=0)
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow, nullable=False
+    )
+
+
+class QueryEmbedding(Base):
+    """
+    Persistent query-embedding store — the on-disk tier behind embed_query()'s in-memory LRU.
+    One row per (normalized query text, embedding model, output dim); the vector is stored
+    as a float32 blob, already L2-normalized. Survives restarts and deploys, and is
+    pre-filled from popular past queries by scripts/warm_embeddings.py.
+    See app/services/embedding_store.py.
+    """
+
+    __tablename__ = "query_embeddings"
+
+    text: Mapped[str] = mapped_column(Text, primary_key=True)
+    model: Mapped[str] = mapped_column(String(100), primary_key=True)
+    dim: Mapped[int] = mapped_column(primary_key=True)
+    vector: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime, default=datetime.datetime.utcnow, nullable=False
+    )
+
+
+class ExpertEmbedding(Base):
+    """
+    Persistent expert-embedding store — lets scripts/ingest.py skip the Gemini API for
+    experts whose embedding text did not change since the last rebuild.
+    One row per (sha256 of expert_to_text() output, embedding model, output dim); the
+    vector is stored as a float32 blob, already L2-normalized. Rows no longer referenced
+    by a successful ingest are pruned. See app/services/expert_embedding_store.py.
+    """
+
+    __tablename__ = "expert_embeddings"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    model: Mapped[str] = mapped_column(String(100), primary_key=True)
+    dim: Mapped[int] = mapped_column(primary_key=True)
+    vector: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime, default=datetime.datetime.utcnow, nullable=False
+    )
+
+
 class Expert(Base):
     """
     Expert profiles — seeded from experts.csv on first startup, then managed via admin API.
@@ -226,6 +284,7 @@ class AppSetting(Base):
         SIMILARITY_THRESHOLD      — float 0.0-1.0, env fallback: SIMILARITY_THRESHOLD or "0.60"
         STRONG_RESULT_MIN         — int 1-10, env fallback: STRONG_RESULT_MIN or "3"
         FEEDBACK_BOOST_CAP        — float 0.0-0.50, env fallback: FEEDBACK_BOOST_CAP or "0.20"
+        HYDE_MODE                 — "serial" | "speculative", env fallback: HYDE_MODE or "serial"
     """
 
     __tablename__ = "settings"
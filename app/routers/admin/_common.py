@@ -13,7 +13,6 @@ import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-import faiss
 import jwt
 from jwt.exceptions import InvalidTokenError
 from fastapi import APIRouter, Depends, HTTPException, Request, Security
@@ -26,7 +25,7 @@ from sqlalchemy.orm import Session
 
 import structlog
 
-from app.config import FAISS_INDEX_PATH, METADATA_PATH
+from app.config import METADATA_PATH
 from app.database import get_db, SessionLocal
 from app.limiter import limiter
 from app.models import AdminUser, Conversation, Expert, LeadClick
@@ -65,12 +64,27 @@ def _run_tag_job() -> None:
         _ingest["log"] += r.stdout + r.stderr
         if r.returncode != 0:
             raise RuntimeError(f"tag_experts.py exited {r.returncode}:\n{r.stderr}")
+
+        # tag_experts.py rewrites tags + findability scores in a separate process
+        from app.services.explore_cache import invalidate_explore_cache  # noqa: PLC0415
+        invalidate_explore_cache()
         _ingest["status"] = "done"
     except Exception as exc:
         _ingest["status"] = "error"
         _ingest["error"] = str(exc)
 
 
+def _reload_search_snapshot(app):
+    """Load the current on-disk search snapshot generation and install it (ingest, rollback)."""
+    from app.services.search_snapshot import (  # noqa: PLC0415
+        install_search_snapshot,
+        load_search_snapshot,
+    )
+    search_snapshot = load_search_snapshot()
+    install_search_snapshot(app.state, search_snapshot)
+    return search_snapshot
+
+
 def _run_ingest_job(app) -> None:
     """Background thread: run tag_experts.py + ingest.py then hot-reload FAISS+metadata."""
     global _ingest
@@ -100,10 +114,9 @@ def _run_ingest_job(app) -> None:
         if r2.returncode != 0:
             raise RuntimeError(f"ingest.py exited {r2.returncode}:\n{r2.stderr}")
 
-        # Step 3: hot-reload app.state
-        app.state.faiss_index = faiss.read_index(str(FAISS_INDEX_PATH))
-        with open(METADATA_PATH, "r", encoding="utf-8") as f:
-            app.state.metadata = json.load(f)
+        # Step 3: hot-reload — load the generation ingest.py just wrote, then swap it
+        # in with one assignment (in-flight requests keep the snapshot they started with)
+        search_snapshot = _reload_search_snapshot(app)
 
         # Phase 14: rebuild FTS5 index after bulk tag update
         from sqlalchemy import text as _fts_text  # noqa: PLC0415
@@ -112,15 +125,6 @@ def _run_ingest_job(app) -> None:
             _fts_db.commit()
         log.info("fts5.rebuild_complete")
 
-        # Phase 14: refresh username-to-FAISS-position mapping after hot-reload
-        _new_mapping: dict[str, int] = {}
-        for _pos, _row in enumerate(app.state.metadata):
-            _uname = _row.get("Username") or _row.get("username") or ""
-            if _uname:
-                _new_mapping[_uname] = _pos
-        app.state.username_to_faiss_pos = _new_mapping
-        log.info("fts5.username_mapping_refreshed", count=len(_new_mapping))
-
         # Phase 56: rebuild expert_tags after ingest
         from app.services.tag_sync import sync_all_expert_tags  # noqa: PLC0415
         with SessionLocal() as _tag_db:
@@ -132,7 +136,7 @@ def _run_ingest_job(app) -> None:
         log.info("explore_cache.invalidated_after_ingest")
 
         _ingest["last_rebuild_at"] = time.time()
-        _ingest["expert_count_at_rebuild"] = len(app.state.metadata)
+        _ingest["expert_count_at_rebuild"] = len(search_snapshot.metadata)
         _ingest["status"] = "done"
     except Exception as exc:
         _ingest["status"] = "error"
@@ -108,8 +108,9 @@ def compare_configs(body: CompareRequest, request: Request, db: Session = Depend
     if unknown:
         raise HTTPException(status_code=400, detail=f"Unknown config(s): {unknown}. Valid: {list(_LAB_CONFIGS.keys())}")
 
-    faiss_index = request.app.state.faiss_index
-    metadata = request.app.state.metadata
+    search_snapshot = request.app.state.search_snapshot
+    faiss_index = search_snapshot.faiss_index
+    metadata = search_snapshot.metadata
     app_state = request.app.state
 
     config_flag_pairs = [(name, {**_LAB_CONFIGS[name]}) for name in body.configs]
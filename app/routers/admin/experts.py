@@ -155,6 +155,7 @@ def classify_expert(username: str, body: ClassifyBody, db: Session = Depends(get
         raise HTTPException(status_code=404, detail=f"Expert '{username}' not found")
     expert.category = body.category
     db.commit()
+    invalidate_explore_cache()
     return {"ok": True}
 
 
@@ -177,6 +178,7 @@ def auto_classify_experts(db: Session = Depends(get_db)):
 
     if classified:
         db.commit()
+        invalidate_explore_cache()
 
     return {"classified": classified, "categories": categories}
 
@@ -194,6 +196,7 @@ def assign_industry_tags(db: Session = Depends(get_db)):
             updated += 1
     if updated:
         db.commit()
+        invalidate_explore_cache()
     return {"updated": updated}
 
 
@@ -269,6 +272,7 @@ def _retry_tag_expert_background(expert_id: int) -> None:
             # Phase 56: sync expert_tags after tagging
             sync_expert_tags(db, expert.id, tags, json.loads(expert.industry_tags or "[]"))
             db.commit()
+        invalidate_explore_cache()
     except Exception as e:
         log.error("background_tag_retry.failed", expert_id=expert_id, error=str(e))
 
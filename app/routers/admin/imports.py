@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models import Expert
+from app.services.explore_cache import invalidate_explore_cache
 from app.services.tag_sync import sync_expert_tags
 from app.routers.admin._common import _auto_categorize, _auto_industry_tags, _ingest, _run_ingest_job
 
@@ -119,6 +120,7 @@ async def import_experts_csv(file: UploadFile = File(...), column_mapping: str =
             inserted += 1
 
     db.commit()
+    invalidate_explore_cache()
     return {"inserted": inserted, "updated": updated, "skipped": skipped}
 
 
@@ -399,6 +401,7 @@ async def sync_apply(
     skipped = len(active_db_usernames - csv_usernames) - deleted
 
     db.commit()
+    invalidate_explore_cache()
 
     # ── Trigger FAISS rebuild ─────────────────────────────────────────────────
     rebuilding = False
@@ -497,6 +500,7 @@ async def import_expert_photos(
         for expert, new_photo_url in experts_to_update:
             expert.photo_url = new_photo_url
         db.commit()
+        invalidate_explore_cache()
 
     return {
         "dry_run": dry_run,
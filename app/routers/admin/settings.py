@@ -1,5 +1,6 @@
 """
-Admin settings endpoints: GET /settings, POST /settings, POST /reset-data.
+Admin settings endpoints: GET /settings, POST /settings, POST /reset-data,
+POST /feedback-stats/rebuild.
 """
 import os
 
@@ -11,7 +12,16 @@ from sqlalchemy.orm import Session
 import structlog
 
 from app.database import get_db
-from app.models import Conversation, EmailLead, Feedback, LeadClick, NewsletterSubscriber, UserEvent
+from app.models import (
+    Conversation,
+    EmailLead,
+    ExpertFeedbackStats,
+    Feedback,
+    LeadClick,
+    NewsletterSubscriber,
+    UserEvent,
+)
+from app.services.feedback_stats import rebuild_feedback_stats
 from app.services.search_intelligence import invalidate_settings_cache
 
 log = structlog.get_logger()
@@ -51,6 +61,13 @@ SETTINGS_SCHEMA: dict[str, dict] = {
         "min": 0.0,
         "max": 0.50,
     },
+    "HYDE_MODE": {
+        "type": "choice",
+        "description": "HyDE scheduling: serial (generate the bio only for weak queries) or "
+                       "speculative (generate it alongside the first search, discard it for strong queries)",
+        "env_default": "serial",
+        "choices": ["serial", "speculative"],
+    },
 }
 
 
@@ -85,6 +102,8 @@ def _validate_setting(key: str, value: str) -> None:
                 raise ValueError(f"must be >= {schema['min']}, got {ival}")
             if "max" in schema and ival > schema["max"]:
                 raise ValueError(f"must be <= {schema['max']}, got {ival}")
+        elif stype == "choice" and value.lower().strip() not in schema["choices"]:
+            raise ValueError(f"must be one of {', '.join(schema['choices'])}, got '{value}'")
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=f"Invalid value for '{key}': {exc}") from exc
 
@@ -98,12 +117,14 @@ def _coerce_value(key: str, raw: str):
         return float(raw)
     if stype == "int":
         return int(raw)
+    if stype == "choice":
+        return raw.lower().strip()
     return raw
 
 
 @router.get("/settings")
 def get_settings_endpoint(db: Session = Depends(get_db)):
-    """Return all 5 intelligence settings with current value and source."""
+    """Return all intelligence settings with current value and source."""
     from app.models import AppSetting  # deferred import avoids circular import at startup
 
     db_rows = {row.key: row.value for row in db.scalars(select(AppSetting)).all()}
@@ -130,6 +151,8 @@ def get_settings_endpoint(db: Session = Depends(get_db)):
             entry["min"] = schema["min"]
         if "max" in schema:
             entry["max"] = schema["max"]
+        if "choices" in schema:
+            entry["choices"] = schema["choices"]
         result.append(entry)
     return {"settings": result}
 
@@ -167,10 +190,17 @@ def update_setting(body: SettingUpdate, db: Session = Depends(get_db)):
 def reset_data(db: Session = Depends(get_db)):
     """Truncate all search/usage data tables."""
     counts = {}
-    for model in [Feedback, Conversation, EmailLead, NewsletterSubscriber, UserEvent, LeadClick]:
+    for model in [Feedback, ExpertFeedbackStats, Conversation, EmailLead, NewsletterSubscriber, UserEvent, LeadClick]:
         count = db.query(model).count()
         db.query(model).delete()
         counts[model.__tablename__] = count
     db.commit()
     log.info("admin.reset_data", deleted=counts)
     return {"ok": True, "deleted": counts}
+
+
+@router.post("/feedback-stats/rebuild")
+def rebuild_feedback_stats_endpoint(db: Session = Depends(get_db)):
+    """Recompute the expert_feedback_stats counters from the full feedback table."""
+    urls = rebuild_feedback_stats(db)
+    return {"ok": True, "urls": urls}
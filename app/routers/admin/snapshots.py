@@ -0,0 +1,82 @@
+"""Search snapshot generations — inspect the live one, roll back to an earlier ingest."""
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel
+
+from app.routers.admin._common import (
+    _ingest,
+    _ingest_lock,
+    _reload_search_snapshot,
+    log,
+)
+from app.services.blocking import run_blocking
+from app.services.explore_cache import invalidate_explore_cache
+from app.services.index_snapshot import (
+    SNAPSHOT_DIR,
+    generation_name,
+    list_generations,
+    read_current_generation,
+    read_manifest,
+    set_current_generation,
+)
+
+router = APIRouter()
+
+
+class RollbackBody(BaseModel):
+    generation: int | None = None  # default: the newest generation older than the live one
+
+
+@router.get("/search-snapshot")
+def get_search_snapshot(request: Request):
+    """The live search snapshot plus every generation kept on disk."""
+    generations = []
+    for generation in list_generations():
+        manifest = read_manifest(SNAPSHOT_DIR / generation_name(generation))
+        generations.append({"generation": generation, "rows": manifest["rows"], "index": manifest.get("index")})
+    return {
+        "live": request.app.state.search_snapshot.describe(),
+        "current": read_current_generation(),
+        "generations": generations,
+    }
+
+
+def _rollback(app, target: int):
+    previous = read_current_generation()
+    set_current_generation(target)
+    try:
+        return _reload_search_snapshot(app)
+    except Exception:
+        if previous is not None:
+            set_current_generation(previous)  # keep CURRENT on what is still being served
+        raise
+
+
+@router.post("/search-snapshot/rollback")
+async def rollback_search_snapshot(request: Request, body: RollbackBody | None = None):
+    """
+    Point CURRENT at an earlier generation and hot-swap it in.
+
+    409 while an ingest is running (it would install its own generation afterwards).
+    """
+    live = request.app.state.search_snapshot
+    async with _ingest_lock:
+        if _ingest["status"] == "running":
+            raise HTTPException(status_code=409, detail="Ingest job running — retry when it finishes")
+        available = list_generations()
+        if body is not None and body.generation is not None:
+            target = body.generation
+            if target not in available:
+                raise HTTPException(status_code=404, detail=f"Snapshot generation {target} not found")
+        else:
+            older = [g for g in available if g < live.generation]
+            if not older:
+                raise HTTPException(status_code=409, detail="No earlier snapshot generation to roll back to")
+            target = older[-1]
+        try:
+            snapshot = await run_blocking(_rollback, request.app, target)
+        except (RuntimeError, ValueError) as exc:
+            raise HTTPException(status_code=500, detail=f"Rollback failed: {exc}") from exc
+
+    invalidate_explore_cache()  # cached rankings were scored against the other generation
+    log.info("search_snapshot.rolled_back", from_generation=live.generation, to_generation=snapshot.generation)
+    return {"status": "ok", "previous": live.generation, "live": snapshot.describe()}
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models import Expert, ExpertTag, TagCatalog
+from app.services.explore_cache import invalidate_explore_cache
 from app.services.tag_sync import sync_expert_tags
 
 router = APIRouter()
@@ -102,6 +103,7 @@ def bulk_assign_tags(body: BulkAssignBody, db: Session = Depends(get_db)):
         updated += 1
 
     db.commit()
+    invalidate_explore_cache(rebuild_catalog=False)  # tag index patched on commit
     return {"ok": True, "updated": updated, "total_experts": len(experts)}
 
 
@@ -125,6 +127,7 @@ def remove_manual_tag(username: str, tag: str, db: Session = Depends(get_db)):
     industry_tags = json.loads(expert.industry_tags or "[]")
     sync_expert_tags(db, expert.id, ai_tags, industry_tags, new_list)
     db.commit()
+    invalidate_explore_cache(rebuild_catalog=False)  # tag index patched on commit
     return {"ok": True}
 
 
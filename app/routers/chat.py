@@ -3,9 +3,18 @@ POST /api/chat — SSE streaming expert recommendation endpoint.
 
 SSE event stream format:
     data: {"event": "status", "status": "thinking"}\n\n
+    data: {"event": "candidates", "experts": [{..., "score": 0.71}, ...]}\n\n
+    data: {"event": "narrative", "delta": "..."}\n\n                 (repeated)
+    data: {"event": "expert", "index": 0, "expert": {...}}\n\n        (per validated expert)
+    data: {"event": "why_them", "index": 0, "delta": "..."}\n\n      (repeated)
     data: {"event": "result", "type": "...", "narrative": "...", "experts": [...]}\n\n
     data: {"event": "done"}\n\n
 
+The streamed narrative / expert / why_them events are previews; "result" is the
+authoritative response (same payload as before streaming existed). If generation
+is retried after partial output, a {"event": "reset"} event tells the client to
+discard what it has shown so far.
+
 On error during generation:
     data: {"event": "error", "message": "..."}\n\n
     data: {"event": "done"}\n\n
@@ -28,12 +37,19 @@ from pydantic import BaseModel, EmailStr, Field
 
 from app.database import SessionLocal
 from app.models import Conversation
-from app.services.llm import generate_response
-from app.services.search_intelligence import retrieve_with_intelligence
+from app.services.blocking import run_blocking
+from app.services.llm import astream_response
+from app.services.search_intelligence import aretrieve_with_intelligence
 
 log = structlog.get_logger()
 router = APIRouter()
 
+# Retrieval must not hang a chat request. aretrieve_with_intelligence() fits its
+# Gemini stages (query embed ≤4s, HyDE bio ≤5s, bio embed) into this budget minus
+# the margin, skipping HyDE when it would not fit; the outer wait_for is a backstop.
+CHAT_RETRIEVAL_TIMEOUT_S = 12.0
+_RETRIEVAL_MARGIN_S = 1.0  # FAISS searches, settings and feedback reads after the last Gemini call
+
 
 class HistoryItem(BaseModel):
     role: str
@@ -57,36 +73,30 @@ async def _stream_chat(body: ChatRequest, request: Request):
 
     Event sequence:
     1. status=thinking (immediate — before any LLM call)
-    2. result (complete JSON payload after generation)
-    3. done (signals stream end to client)
+    2. candidates (as soon as retrieval finishes)
+    3. narrative / expert / why_them deltas (while Gemini streams its answer)
+    4. result (complete JSON payload after generation)
+    5. done (signals stream end to client)
     """
     # Event 1: thinking — emit immediately so frontend shows loading state
     yield _sse({"event": "status", "status": "thinking"})
 
-    # Run retrieval + generation in a thread pool to avoid blocking the event loop
-    # (embed_query and generate_content are synchronous calls)
-    loop = asyncio.get_event_loop()
-
+    # Async pipeline: Gemini calls (embeddings, HyDE, generation) are awaited on
+    # client.aio; only FAISS and SQLite work runs on the bounded blocking pool, so chat
+    # concurrency does not consume the default executor explore runs on.
     try:
-        # Retrieve candidates (sync — run in thread pool)
-        # DB session created and closed within executor to avoid holding connections
         history_dicts = [{"role": h.role, "content": h.content} for h in body.history]
 
-        def _retrieve():
-            db = SessionLocal()
-            try:
-                return retrieve_with_intelligence(
-                    query=body.query,
-                    faiss_index=request.app.state.faiss_index,
-                    metadata=request.app.state.metadata,
-                    db=db,
-                )
-            finally:
-                db.close()
-
+        # wait_for cancels the retrieval (and its in-flight Gemini requests) on timeout
+        search_snapshot = request.app.state.search_snapshot  # index + metadata of one generation
         candidates, intelligence = await asyncio.wait_for(
-            loop.run_in_executor(None, _retrieve),
-            timeout=12.0,  # 5s HyDE LLM + 2s embed + safety margin; overall request must not hang
+            aretrieve_with_intelligence(
+                query=body.query,
+                faiss_index=search_snapshot.faiss_index,
+                metadata=search_snapshot.metadata,
+                timeout=CHAT_RETRIEVAL_TIMEOUT_S - _RETRIEVAL_MARGIN_S,
+            ),
+            timeout=CHAT_RETRIEVAL_TIMEOUT_S,
         )
         log.info(
             "chat.retrieved",
@@ -105,15 +115,33 @@ async def _stream_chat(body: ChatRequest, request: Request):
             if top_k else None
         )
 
-        # Generate response (sync — run in thread pool; has internal retry logic)
-        llm_response = await loop.run_in_executor(
-            None,
-            lambda: generate_response(
-                query=body.query,
-                candidates=candidates,
-                history=history_dicts,
-            ),
-        )
+        # Event 2: candidates — first useful content, before any generation latency
+        yield _sse({
+            "event": "candidates",
+            "experts": [
+                {
+                    "name": c.name,
+                    "title": c.title,
+                    "company": c.company,
+                    "hourly_rate": c.hourly_rate,
+                    "profile_url": c.profile_url,
+                    "score": round(c.score, 4),
+                }
+                for c in candidates
+            ],
+        })
+
+        # Event 3: stream the response (client.aio; retries back off with asyncio.sleep)
+        llm_response = None
+        async for kind, payload in astream_response(
+            query=body.query,
+            candidates=candidates,
+            history=history_dicts,
+        ):
+            if kind == "result":
+                llm_response = payload
+            else:
+                yield _sse({"event": kind, **payload})
         log.info("chat.generated", type=llm_response.type, expert_count=len(llm_response.experts))
 
         # Build experts payload (shared for DB log and SSE event)
@@ -153,8 +181,9 @@ async def _stream_chat(body: ChatRequest, request: Request):
             finally:
                 db.close()
 
-        conversation_id = await loop.run_in_executor(None, _log_conversation)
+        conversation_id = await run_blocking(_log_conversation)
         log.info("chat.logged", conversation_id=conversation_id)
+        # Event 4: result — authoritative payload (the streamed events were previews)
         yield _sse({
             "event": "result",
             "type": llm_response.type,
@@ -169,7 +198,7 @@ async def _stream_chat(body: ChatRequest, request: Request):
         yield _sse({"event": "error", "message": "Failed to generate response. Please try again."})
 
     finally:
-        # Event 3: done — always emitted to signal stream end
+        # Event 5: done — always emitted to signal stream end
         yield _sse({"event": "done"})
 
 
@@ -2,24 +2,65 @@
 Thin FastAPI router for GET /api/explore.
 
 Delegates all search logic to app.services.explorer.run_explore().
-Offloads the synchronous pipeline (SQLAlchemy + FAISS + FTS5 + numpy)
+Offloads the synchronous pipeline (catalog + FAISS + FTS5 + numpy)
 to a thread pool via run_in_executor, keeping the FastAPI event loop unblocked.
 
-Phase 71.02: Results cached for 5 minutes (300s TTL, max 200 entries).
+Phase 71.02: Results cached for 5 minutes (LRU with entry and byte budgets, canonical
+keys — see app/services/explore_cache.py).
 Seeded queries (seed > 0) bypass the cache — they are randomized per request.
+Degraded responses (vector stage skipped to stay within the latency budget) are not cached.
 Cache is invalidated on expert add, delete, bulk delete, and ingest completion.
+
+Cursor pages: each response carries a ranking snapshot id. Requests that send it
+back page the stored ranking (app/services/explore_snapshots.py) without re-running
+the pipeline, and the following page is pre-built in the background.
+
+GET /api/explore/stream: progressive first page as Server-Sent Events — a keyword
+(BM25 + findability) page as soon as the pre-filter and FTS5 stages finish, then the
+fused semantic ranking once the query embedding is ready:
+    data: {"event": "keyword", <ExploreResponse fields>}\n\n   (cold text queries only)
+    data: {"event": "final", <ExploreResponse fields>}\n\n
+    data: {"event": "done"}\n\n
+
+Single-flight: concurrent identical requests that miss the cache share one pipeline
+run (app/services/single_flight.py) — a trending query costs one embed_query call
+and one executor slot instead of one per request.
 """
 
 import asyncio
+import os
 
-from fastapi import APIRouter, Query, Request
+import structlog
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 from app.database import SessionLocal
-from app.services.explore_cache import get_cached, set_cached
-from app.services.explorer import ExploreResponse, run_explore
+from app.services.explore_cache import (
+    cache_generation,
+    explore_cache_key,
+    get_cached,
+    normalize_industry_tags,
+    normalize_query,
+    normalize_tags,
+    set_cached,
+)
+from app.services.explorer import (
+    ExploreResponse,
+    prefetch_page,
+    run_explore,
+    stream_explore,
+)
+from app.services.single_flight import AsyncSingleFlight
 
+# Pre-build the next cursor page of a snapshot in the background after serving one
+EXPLORE_PREFETCH_NEXT_PAGE = os.getenv("EXPLORE_PREFETCH_NEXT_PAGE", "true").lower() == "true"
+
+log = structlog.get_logger()
 router = APIRouter()
 
+# In-flight explore computations keyed by canonical request (event-loop local)
+_explore_flight = AsyncSingleFlight()
+
 
 @router.get("/api/explore", response_model=ExploreResponse)
 async def explore(
@@ -33,29 +74,40 @@ async def explore(
     usernames: str = Query(default=""),  # comma-separated; returns only these experts (saved view)
     cursor: int = Query(default=0, ge=0),
     seed: int = Query(default=0, ge=0),  # 0 = deterministic findability sort; >0 = seeded random
-) -> ExploreResponse:
+    snapshot: str = Query(default="", max_length=64),  # ranking snapshot id from a previous page
+) -> Response:
     """
-    Hybrid search: SQLAlchemy pre-filter → FAISS IDSelectorBatch → FTS5 BM25 → fused rank.
+    Hybrid search: catalog pre-filter → filter-aware FAISS → FTS5 BM25 → fused rank.
     When query is empty, returns experts sorted by findability_score (pure filter mode).
     Rate range: inclusive on both ends. Tags: comma-separated, AND logic (expert must have ALL).
 
     Results are cached for 5 minutes for deterministic (seed=0) queries. Seeded queries
-    are randomized and always bypass the cache.
+    are randomized and always bypass the cache. Requests carrying a snapshot id page the
+    stored ranking directly and also bypass the cache.
+
+    The body is serialized by ExploreResponse.to_json() (orjson + cached card fragments)
+    and returned as a raw Response — response_model documents the schema only, so cards
+    are not validated a second time.
     """
-    tag_list = [t.strip() for t in tags.split(",") if t.strip()]
-    industry_tag_list = [t.strip() for t in industry_tags.split(",") if t.strip()]
+    # Canonical request: same normalization as the cache key, so a hit is exactly what
+    # the pipeline would compute for this request
+    query = normalize_query(query)
+    tag_list = normalize_tags(tags.split(","))
+    industry_tag_list = normalize_industry_tags(industry_tags.split(","))
     username_list = [u.strip() for u in usernames.split(",") if u.strip()]
 
-    # Only cache deterministic (non-seeded) results
-    if seed == 0:
-        cache_key = (
-            f"{query}|{rate_min}|{rate_max}|{sorted(tag_list)}"
-            f"|{sorted(industry_tag_list)}|{limit}|{cursor}|{seed}"
-            f"|{sorted(username_list) if username_list else ''}"
-        )
-        cached = get_cached(cache_key)
+    # Canonical key — identical requests coalesce onto one in-flight computation
+    request_key = explore_cache_key(
+        query, rate_min, rate_max, tag_list, industry_tag_list,
+        limit, cursor, seed, username_list,
+    )
+
+    # Only cache deterministic (non-seeded) results; snapshot pages are already cheap
+    use_cache = seed == 0 and not snapshot
+    if use_cache:
+        cached = get_cached(request_key)
         if cached is not None:
-            return cached
+            return Response(content=cached, media_type="application/json")
 
     app_state = request.app.state
     loop = asyncio.get_event_loop()
@@ -63,7 +115,7 @@ async def explore(
     def _run():
         db = SessionLocal()
         try:
-            return run_explore(
+            result = run_explore(
                 query=query,
                 rate_min=rate_min,
                 rate_max=rate_max,
@@ -75,14 +127,112 @@ async def explore(
                 app_state=app_state,
                 seed=seed if seed > 0 else None,
                 usernames=username_list if username_list else None,
+                snapshot_id=snapshot or None,
             )
+            return result, result.to_json()  # serialize off the event loop too
+        finally:
+            db.close()
+
+    async def _compute() -> bytes:
+        generation = cache_generation() if use_cache else None  # shared L2 generation, read before computing
+        result, body = await loop.run_in_executor(None, _run)
+
+        # Cache only deterministic, full-quality results — the serialized body, ready to send.
+        # Degraded (keyword-only) results are not cached, so the next identical request
+        # picks up the hybrid ranking as soon as the embedding has landed.
+        if use_cache and not result.degraded:
+            set_cached(request_key, body, generation)
+
+        if EXPLORE_PREFETCH_NEXT_PAGE and result.snapshot and result.cursor is not None:
+            loop.run_in_executor(None, _prefetch, result.snapshot, result.cursor, limit)
+        return body
+
+    body = await _explore_flight.do((request_key, snapshot), _compute)
+    return Response(content=body, media_type="application/json")
+
+
+def _sse_event(event: str, body: bytes) -> bytes:
+    """Frame a serialized ExploreResponse as one SSE data line tagged with its event name."""
+    return b'data: {"event":"' + event.encode() + b'",' + body[1:] + b"\n\n"
+
+
+_SSE_DONE = b'data: {"event":"done"}\n\n'
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # Disable nginx buffering (Railway uses nginx proxy)
+}
+
+
+@router.get("/api/explore/stream")
+async def explore_stream(
+    request: Request,
+    query: str = Query(default="", max_length=500),
+    rate_min: float = Query(default=0.0, ge=0),
+    rate_max: float = Query(default=10000.0, le=10000),
+    tags: str = Query(default=""),
+    industry_tags: str = Query(default=""),
+    limit: int = Query(default=20, ge=1, le=100),
+) -> StreamingResponse:
+    """
+    Progressive first page of a search: keyword results first, semantic re-rank second.
+
+    Same parameters and normalization as GET /api/explore (first page, seed=0). A cached
+    response is streamed as the only "final" event; otherwise the final body is cached
+    like a regular /api/explore first page, so later pages and repeats hit the cache.
+    Later pages are fetched from GET /api/explore with the final event's snapshot id.
+    """
+    query = normalize_query(query)
+    tag_list = normalize_tags(tags.split(","))
+    industry_tag_list = normalize_industry_tags(industry_tags.split(","))
+    request_key = explore_cache_key(
+        query, rate_min, rate_max, tag_list, industry_tag_list, limit, 0, 0, [],
+    )
+
+    cached = get_cached(request_key)
+    if cached is not None:
+        return StreamingResponse(
+            iter([_sse_event("final", cached), _SSE_DONE]),
+            media_type="text/event-stream",
+            headers=_SSE_HEADERS,
+        )
+
+    generation = cache_generation()  # shared L2 generation, read before computing
+    app_state = request.app.state
+
+    def _events():
+        # Sync generator — Starlette advances it on the thread pool, one event at a time
+        db = SessionLocal()
+        try:
+            for phase, result in stream_explore(
+                query=query,
+                rate_min=rate_min,
+                rate_max=rate_max,
+                tags=tag_list,
+                industry_tags=industry_tag_list,
+                limit=limit,
+                db=db,
+                app_state=app_state,
+            ):
+                body = result.to_json()
+                if phase == "final" and not result.degraded:
+                    set_cached(request_key, body, generation)
+                yield _sse_event(phase, body)
+        except Exception as exc:
+            log.error("explore.stream_failed", error=str(exc))
+            yield b'data: {"event":"error","message":"Search failed"}\n\n'
         finally:
             db.close()
+        yield _SSE_DONE
 
-    result = await loop.run_in_executor(None, _run)
+    return StreamingResponse(_events(), media_type="text/event-stream", headers=_SSE_HEADERS)
 
-    # Cache only deterministic results
-    if seed == 0:
-        set_cached(cache_key, result)
 
-    return result
+def _prefetch(snapshot_id: str, cursor: int, limit: int) -> None:
+    """Background worker: pre-build the next page of a ranking snapshot."""
+    db = SessionLocal()
+    try:
+        prefetch_page(snapshot_id, cursor, limit, db)
+    except Exception as exc:
+        log.warning("explore.prefetch_failed", error=str(exc))
+    finally:
+        db.close()
@@ -7,6 +7,9 @@ the user submits the DownvoteModal form.
 
 Switching votes: frontend sends a new POST — backend inserts a new row.
 Latest record per conversation_id is authoritative for analytics.
+
+Each vote also increments the expert_feedback_stats counters in the same
+transaction — the ranking paths read those instead of scanning this table.
 """
 import json
 from typing import Literal
@@ -18,6 +21,7 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models import Feedback
+from app.services.feedback_stats import record_vote
 
 log = structlog.get_logger()
 router = APIRouter()
@@ -47,6 +51,7 @@ def submit_feedback(body: FeedbackRequest, db: Session = Depends(get_db)):
         comment=body.comment,
     )
     db.add(record)
+    record_vote(db, body.vote, body.expert_ids)
     db.commit()
     log.info("feedback.recorded", conversation_id=body.conversation_id, vote=body.vote)
     return {"status": "ok"}
@@ -6,7 +6,8 @@ GET /api/health       → {"status": "ok", "index_size": <int>}
                         A non-zero index_size confirms the FAISS index loaded.
 
 GET /api/admin/health → {"status", "db", "expert_count", "db_latency_ms",
-                          "faiss_vectors", "uptime_s", "version"}
+                          "faiss_vectors", "faiss_index_type", "coarse_search",
+                          "search_generation", "uptime_s", "version", "caches"}
                         Requires admin JWT — full diagnostics for admin UI.
 """
 import time
@@ -16,6 +17,13 @@ from sqlalchemy import text
 
 from app.database import SessionLocal
 from app.routers.admin._common import _require_admin
+from app.services.card_cache import card_cache_stats
+from app.services.embedder import embed_cache_stats
+from app.services.coarse_search import COARSE_SEARCH
+from app.services.explore_cache import explore_cache_stats
+from app.services.index_factory import describe_index
+from app.services.llm import generation_cache_stats
+from app.services.search_intelligence import hyde_cache_stats
 
 router = APIRouter()
 
@@ -27,10 +35,9 @@ _start_time = time.time()
 @router.get("/api/health")
 async def health(request: Request) -> dict:
     """Public — Railway healthcheck. Fast, no auth."""
-    index = request.app.state.faiss_index
     return {
         "status": "ok",
-        "index_size": index.ntotal,
+        "index_size": request.app.state.search_snapshot.ntotal,
     }
 
 
@@ -52,7 +59,8 @@ async def admin_health(
     except Exception as exc:
         db_status = f"error: {exc}"
 
-    index = request.app.state.faiss_index
+    search_snapshot = request.app.state.search_snapshot
+    index = search_snapshot.faiss_index
     uptime_s = round(time.time() - _start_time)
 
     return {
@@ -61,6 +69,16 @@ async def admin_health(
         "expert_count": expert_count,
         "db_latency_ms": db_latency_ms,
         "faiss_vectors": index.ntotal,
+        "faiss_index_type": describe_index(index),
+        "search_generation": search_snapshot.generation,
+        "coarse_search": COARSE_SEARCH,
         "uptime_s": uptime_s,
         "version": "v5.4",
+        "caches": {
+            "explore": explore_cache_stats(),
+            "cards": card_cache_stats(),
+            "embeddings": embed_cache_stats(),
+            "hyde_bios": hyde_cache_stats(),
+            "generations": generation_cache_stats(),
+        },
     }
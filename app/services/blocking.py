@@ -0,0 +1,24 @@
+"""
+Bounded thread pool for the blocking steps of async request paths.
+
+The async chat pipeline awaits Gemini calls on the event loop (client.aio) and
+only hands FAISS searches and SQLite sessions to this pool. Its own fixed-size
+pool keeps chat concurrency from draining the default executor that explore,
+browse and suggest run on.
+"""
+import asyncio
+import functools
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+BLOCKING_POOL_WORKERS = int(os.getenv("BLOCKING_POOL_WORKERS", "8"))
+
+_pool = ThreadPoolExecutor(max_workers=BLOCKING_POOL_WORKERS, thread_name_prefix="blocking")
+
+
+async def run_blocking(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking function on the bounded pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_pool, functools.partial(fn, *args, **kwargs))
@@ -0,0 +1,57 @@
+"""
+Per-expert ExpertCard fragment cache for /api/explore.
+
+The static part of a card (identity, rate, profile/photo URLs, tags, findability,
+category) only changes when the expert row changes, yet every explore page used
+to json.loads the tags, rebuild the photo URL, construct a validated ExpertCard
+and let FastAPI re-validate and serialize it with the stdlib json module.
+
+A CardFragment holds those static fields once, plus their pre-serialized JSON
+(orjson, without the surrounding braces). Per request only the score fields and
+match_reason are serialized and spliced in — see ExpertCard.to_json() in
+explorer.py.
+
+Keyed by (expert id, row version). The row version is the catalog generation
+(app/services/catalog.py), bumped by invalidate_explore_cache() after every
+expert mutation, so a mutation retires all fragments at once; stale entries
+age out of the LRU.
+
+Module-level LRUCache (app/services/lru_cache.py), same as explore_cache.py;
+counters appear under "caches" in GET /api/admin/health.
+"""
+from dataclasses import dataclass
+from typing import Any
+
+from app.services.lru_cache import LRUCache
+
+CARD_CACHE_MAX_SIZE = 4096  # a few generations of a ~1.6k-expert catalog
+
+
+@dataclass(frozen=True)
+class CardFragment:
+    """Static ExpertCard fields and their pre-serialized JSON body (no braces)."""
+    fields: dict[str, Any]
+    json: bytes
+
+
+_cache = LRUCache(max_entries=CARD_CACHE_MAX_SIZE, sizeof=lambda fragment: len(fragment.json))
+
+
+def get_fragments(keys: list[tuple[int, int]]) -> dict[tuple[int, int], CardFragment]:
+    """Return the cached fragments for the given (expert_id, version) keys; misses are omitted."""
+    found: dict[tuple[int, int], CardFragment] = {}
+    for key in keys:
+        fragment = _cache.get(key)
+        if fragment is not None:
+            found[key] = fragment
+    return found
+
+
+def put_fragment(key: tuple[int, int], fragment: CardFragment) -> None:
+    """Store a fragment, evicting the least recently used entry at capacity."""
+    _cache.set(key, fragment)
+
+
+def card_cache_stats() -> dict:
+    """Hit/miss/eviction counters and current size of the card fragment cache."""
+    return _cache.stats()
@@ -0,0 +1,241 @@
+"""
+In-memory columnar expert catalog snapshot for the explore pipeline.
+
+run_explore() used to run select(Expert) on every request and hydrate full ORM
+objects (bio included) for every expert in the rate range, even when only one
+page of cards was returned. The catalog holds the handful of columns Stage 1
+needs as NumPy arrays keyed by a dense row index (experts ordered by id), so
+rate/active filtering, max_rate and total become vectorized mask operations and
+ORM rows are loaded only for the final page.
+
+Skill/industry tag filtering runs against the catalog's bitmap tag index
+(app/services/tag_index.py), which tag_sync patches incrementally after commit.
+
+Lifecycle:
+  - Built at startup (main.py lifespan) → app.state.catalog
+  - Marked stale by invalidate_catalog() — called from invalidate_explore_cache(),
+    i.e. after every expert mutation and after ingest hot-reload
+  - Rebuilt lazily by get_catalog() on the next explore request after invalidation
+
+The column arrays are read-only once built: a rebuild produces a new ExpertCatalog
+and swaps the app.state reference, so in-flight requests keep the one they started
+with. Only the tag index is patched in place, copy-on-write per bitmap.
+
+faiss_pos / faiss_row are positions in one SearchSnapshot, which the catalog keeps
+(search_snapshot); explore searches that snapshot, never app.state's live one, so
+positions always resolve against the index they came from. Installing a new search
+snapshot makes get_catalog() rebuild.
+"""
+import threading
+from dataclasses import dataclass, field
+
+import numpy as np
+import structlog
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import Expert, ExpertTag
+from app.services.search_snapshot import SearchSnapshot
+from app.services.tag_index import TagBitmapIndex, TagKey
+
+log = structlog.get_logger()
+
+# ── Generation counter ───────────────────────────────────────────────────────
+# Bumped on every invalidation. A catalog built at an older generation is stale.
+_generation = 0
+_generation_lock = threading.Lock()
+_build_lock = threading.Lock()
+
+# The catalog currently installed in app.state — target of incremental tag updates.
+_live_catalog: "ExpertCatalog | None" = None
+
+
+def invalidate_catalog() -> None:
+    """Mark the current catalog snapshot stale. Call after any expert mutation."""
+    global _generation
+    with _generation_lock:
+        _generation += 1
+
+
+def current_generation() -> int:
+    """Return the current catalog generation number."""
+    return _generation
+
+
+# ── Snapshot ─────────────────────────────────────────────────────────────────
+
+@dataclass
+class ExpertCatalog:
+    """
+    Column arrays over all experts, aligned by dense row index (id ascending).
+
+    findability_score uses NaN for NULL. faiss_pos is -1 for experts that are not
+    in the FAISS index; faiss_row is the inverse mapping (FAISS position → row).
+    Both refer to search_snapshot.
+    """
+    generation: int
+    search_snapshot: SearchSnapshot
+    ids: np.ndarray                # int64
+    usernames: list[str]
+    hourly_rate: np.ndarray        # float64
+    findability_score: np.ndarray  # float64, NaN = NULL
+    is_active: np.ndarray          # bool
+    faiss_pos: np.ndarray          # int64, -1 = not embedded
+    faiss_row: np.ndarray          # int64, indexed by FAISS position, -1 = not in catalog
+    profile_urls: list[str]        # profile_url_utm or profile_url (feedback lookup key)
+    tag_index: TagBitmapIndex      # (tag, tag_type) → packed row bitmap
+    id_to_row: dict[int, int] = field(repr=False)
+    url_to_rows: dict[str, list[int]] = field(repr=False)  # profile_urls inverse (feedback boost)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def findability(self, row: int) -> float | None:
+        """Return the findability_score for a row, or None when NULL."""
+        value = self.findability_score[row]
+        return None if np.isnan(value) else float(value)
+
+
+def build_catalog(
+    db: Session,
+    search_snapshot: SearchSnapshot,
+    generation: int | None = None,
+) -> ExpertCatalog:
+    """
+    Build a catalog snapshot from the experts table, aligned with a search snapshot.
+
+    Selects only the columns the explore pipeline filters and ranks on — never bio.
+    """
+    if generation is None:
+        generation = current_generation()
+    username_to_faiss_pos = search_snapshot.username_to_faiss_pos
+    faiss_ntotal = search_snapshot.ntotal
+
+    rows = db.execute(
+        select(
+            Expert.id,
+            Expert.username,
+            Expert.hourly_rate,
+            Expert.findability_score,
+            Expert.is_active,
+            Expert.profile_url,
+            Expert.profile_url_utm,
+        ).order_by(Expert.id)
+    ).all()
+
+    n = len(rows)
+    ids = np.empty(n, dtype=np.int64)
+    hourly_rate = np.empty(n, dtype=np.float64)
+    findability = np.empty(n, dtype=np.float64)
+    is_active = np.empty(n, dtype=bool)
+    faiss_pos = np.full(n, -1, dtype=np.int64)
+    faiss_row = np.full(faiss_ntotal, -1, dtype=np.int64)
+    usernames: list[str] = []
+    profile_urls: list[str] = []
+
+    for i, r in enumerate(rows):
+        ids[i] = r.id
+        hourly_rate[i] = r.hourly_rate or 0.0
+        findability[i] = np.nan if r.findability_score is None else r.findability_score
+        is_active[i] = bool(r.is_active)
+        pos = username_to_faiss_pos.get(r.username)
+        if pos is not None and 0 <= pos < faiss_ntotal:
+            faiss_pos[i] = pos
+            faiss_row[pos] = i
+        usernames.append(r.username)
+        profile_urls.append(r.profile_url_utm or r.profile_url)
+
+    id_to_row = {int(expert_id): i for i, expert_id in enumerate(ids)}
+    url_to_rows: dict[str, list[int]] = {}
+    for i, url in enumerate(profile_urls):
+        if url:
+            url_to_rows.setdefault(url, []).append(i)
+    tag_rows = db.execute(select(ExpertTag.expert_id, ExpertTag.tag, ExpertTag.tag_type)).all()
+    tag_index = TagBitmapIndex.build(
+        n,
+        (
+            (id_to_row[r.expert_id], r.tag, r.tag_type)
+            for r in tag_rows
+            if r.expert_id in id_to_row
+        ),
+    )
+
+    return ExpertCatalog(
+        generation=generation,
+        search_snapshot=search_snapshot,
+        ids=ids,
+        usernames=usernames,
+        hourly_rate=hourly_rate,
+        findability_score=findability,
+        is_active=is_active,
+        faiss_pos=faiss_pos,
+        faiss_row=faiss_row,
+        profile_urls=profile_urls,
+        tag_index=tag_index,
+        id_to_row=id_to_row,
+        url_to_rows=url_to_rows,
+    )
+
+
+def install_catalog(app_state, catalog: ExpertCatalog) -> None:
+    """Install a freshly built catalog into app_state (startup and rebuilds)."""
+    global _live_catalog
+    app_state.catalog = catalog
+    _live_catalog = catalog
+
+
+def get_catalog(app_state, db: Session) -> ExpertCatalog:
+    """
+    Return the current catalog from app_state, rebuilding it first if stale —
+    invalidated, or built against a search snapshot that is no longer live.
+
+    Only one thread rebuilds at a time; concurrent callers wait and then reuse
+    the freshly built snapshot.
+    """
+    catalog: ExpertCatalog | None = getattr(app_state, "catalog", None)
+    if (
+        catalog is not None
+        and catalog.generation == _generation
+        and catalog.search_snapshot is app_state.search_snapshot
+    ):
+        return catalog
+
+    with _build_lock:
+        catalog = getattr(app_state, "catalog", None)
+        generation = _generation
+        search_snapshot = app_state.search_snapshot
+        if catalog is None or catalog.generation != generation or catalog.search_snapshot is not search_snapshot:
+            catalog = build_catalog(db, search_snapshot, generation)
+            install_catalog(app_state, catalog)
+            log.info(
+                "catalog.rebuilt",
+                experts=len(catalog),
+                generation=generation,
+                search_generation=search_snapshot.generation,
+            )
+    return catalog
+
+
+def apply_tag_updates(updates: dict[int, set[TagKey]]) -> None:
+    """
+    Patch the live catalog's tag index with committed per-expert tag sets.
+
+    Called by tag_sync after a session that ran sync_expert_tags() commits.
+    Serialized with rebuilds via the build lock, so an update is never lost to a
+    rebuild that read the table before the commit landed. Experts missing from
+    the snapshot (e.g. just inserted) need a new row — the catalog is marked
+    stale instead.
+    """
+    with _build_lock:
+        catalog = _live_catalog
+        if catalog is None:
+            return
+        missing = False
+        for expert_id, keys in updates.items():
+            row = catalog.id_to_row.get(expert_id)
+            if row is None:
+                missing = True
+                continue
+            catalog.tag_index.replace_row(row, keys)
+    if missing:
+        invalidate_catalog()
@@ -0,0 +1,161 @@
+"""
+Optional two-stage vector search: a coarse pass over compact codes, then an exact
+rerank of the over-fetched candidates with the full OUTPUT_DIM vectors.
+
+COARSE_SEARCH selects the codes (default off — every search is exact):
+
+  mrl128 / mrl256 — Matryoshka prefixes: the first 128 / 256 dims of each vector,
+                    re-normalized. gemini-embedding-001 is trained so that prefixes
+                    stay meaningful embeddings (OUTPUT_DIM itself is one).
+                    6x / 3x fewer bytes scanned than full vectors.
+  binary          — one sign bit per dim in a FAISS IndexBinaryFlat (Hamming
+                    distance): 32x fewer bytes scanned.
+
+search() over-fetches COARSE_OVERFETCH x k candidates from the codes and reranks
+them exactly, so returned scores are true cosine similarities; only which experts
+make the top-k can differ from a full scan. search_subset() (explore) ranks a whole
+filtered subset by code score and reranks its top COARSE_SUBSET_RERANK exactly; the
+tail keeps its code estimate capped below the lowest exact score, since estimates
+(for binary, cos(pi * hamming / d)) are on a different scale from true cosines.
+The codes are the hot working set — the full vectors are only gathered for
+candidates, which matters when they are memory-mapped.
+
+Codes are built once per loaded index (coarse_index_for(), memoized on the identity
+of the index and its exact vectors like retriever.records_for()).
+scripts/bench_index.py --coarse measures the recall loss against the exact flat search.
+"""
+import os
+import threading
+
+import faiss
+import numpy as np
+import structlog
+
+from app.services.vector_search import _flat_vectors
+
+log = structlog.get_logger()
+
+COARSE_MODES = ("off", "mrl128", "mrl256", "binary")
+COARSE_SEARCH = os.getenv("COARSE_SEARCH", "off").lower()
+COARSE_OVERFETCH = int(os.getenv("COARSE_OVERFETCH", "10"))
+COARSE_SUBSET_RERANK = int(os.getenv("COARSE_SUBSET_RERANK", "200"))
+
+# Popcount of every byte value — Hamming distances over packed codes in numpy
+_POPCOUNT = np.array([b.bit_count() for b in range(256)], dtype=np.uint8)
+
+
+class CoarseIndex:
+    """Compact codes for every vector of an index plus the exact vectors to rerank with."""
+
+    def __init__(self, vectors: np.ndarray, mode: str) -> None:
+        if mode not in COARSE_MODES or mode == "off":
+            raise ValueError(f"unknown coarse mode {mode!r}; expected one of {', '.join(COARSE_MODES[1:])}")
+        self.mode = mode
+        self.exact = vectors  # (ntotal, d) — a view of a flat index or a memory-mapped array
+        self.ntotal, self.d = vectors.shape
+        if mode == "binary":
+            self._codes = np.packbits(vectors > 0, axis=1)
+            self._binary = faiss.IndexBinaryFlat(self.d)
+            self._binary.add(self._codes)
+        else:
+            self.dim = int(mode.removeprefix("mrl"))
+            self._prefix = np.ascontiguousarray(vectors[:, :self.dim], dtype=np.float32)
+            faiss.normalize_L2(self._prefix)
+
+    @property
+    def code_bytes(self) -> int:
+        """Size of the codes scanned per search — the hot working set."""
+        return (self._codes if self.mode == "binary" else self._prefix).nbytes
+
+    def _prefix_query(self, query_vec: np.ndarray) -> np.ndarray:
+        q = np.ascontiguousarray(query_vec[0, :self.dim], dtype=np.float32)
+        return q / max(float(np.linalg.norm(q)), 1e-12)
+
+    def _coarse_scores(self, query_vec: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        """Code-estimated cosine of query_vec against the given positions."""
+        if self.mode == "binary":
+            q_code = np.packbits(query_vec[0] > 0)
+            hamming = _POPCOUNT[self._codes[positions] ^ q_code].sum(axis=1, dtype=np.int32)
+            return np.cos(np.pi * hamming / self.d).astype(np.float32)  # sign-random-projection estimate
+        return self._prefix[positions] @ self._prefix_query(query_vec)
+
+    def _candidates(self, query_vec: np.ndarray, fetch: int) -> np.ndarray:
+        if self.mode == "binary":
+            _, found = self._binary.search(np.packbits(query_vec > 0, axis=1), fetch)
+            found = found[0]
+            return found[found >= 0]
+        scores = self._prefix @ self._prefix_query(query_vec)
+        if fetch >= self.ntotal:
+            return np.arange(self.ntotal, dtype=np.int64)
+        return np.argpartition(-scores, fetch - 1)[:fetch].astype(np.int64)
+
+    def search(self, query_vec: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """index.search() equivalent for one (1, d) query: (1, k) exact scores and positions."""
+        fetch = min(self.ntotal, k * COARSE_OVERFETCH)
+        candidates = self._candidates(query_vec, fetch)
+        exact = self.exact[candidates] @ query_vec[0]
+        order = np.argsort(-exact, kind="stable")[:k]
+        return exact[order].astype(np.float32).reshape(1, -1), candidates[order].reshape(1, -1)
+
+    def search_subset(self, query_vec: np.ndarray, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray, str]:
+        """
+        vector_search.search_subset() equivalent: a score for every position, top ones exact.
+
+        The tail beyond the COARSE_SUBSET_RERANK reranked positions keeps its code
+        estimate, capped just below the lowest exact score of the reranked set: an
+        estimate never outranks an exactly scored expert.
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        if positions.size <= COARSE_SUBSET_RERANK:
+            scores = self.exact[positions] @ query_vec[0]
+            return positions, scores.astype(np.float32, copy=False), "direct"
+        scores = self._coarse_scores(query_vec, positions).astype(np.float32, copy=False)
+        top = np.argpartition(-scores, COARSE_SUBSET_RERANK - 1)[:COARSE_SUBSET_RERANK]
+        exact = self.exact[positions[top]] @ query_vec[0]
+        cap = np.nextafter(np.float32(exact.min()), np.float32(-np.inf))  # strictly below — no ties
+        np.minimum(scores, cap, out=scores)
+        scores[top] = exact
+        return positions, scores, "coarse"
+
+
+# Recently built ((source index, exact vectors), coarse index) pairs, newest first —
+# like retriever._compiled: the live search snapshot's and the previous one's. A None
+# (no exact vectors) is remembered only for that exact pair, so passing the vectors
+# later still builds the codes.
+_BUILT_SLOTS = 2
+_built: tuple[tuple[tuple[object, object], CoarseIndex | None], ...] = ()
+_build_lock = threading.Lock()
+
+
+def coarse_index_for(index, exact_vectors: np.ndarray | None = None) -> CoarseIndex | None:
+    """
+    The CoarseIndex for a loaded FAISS index, memoized on the identity of the index
+    and exact_vectors; None when off or when no exact vectors are available.
+
+    exact_vectors are the snapshot's vectors for a non-flat index
+    (SearchSnapshot.faiss_vectors); a flat index supplies its own. Without them any
+    codes already built for the index are returned (retriever.search_vector() only
+    has the index). Loading a search snapshot calls this eagerly so no search pays
+    for building the codes.
+    """
+    global _built
+    if COARSE_SEARCH == "off":
+        return None
+    for (source, vectors), coarse in _built:
+        if source is index and (exact_vectors is None or vectors is exact_vectors):
+            return coarse
+    with _build_lock:
+        for (source, vectors), coarse in _built:
+            if source is index and (exact_vectors is None or vectors is exact_vectors):
+                return coarse
+        vectors = exact_vectors if exact_vectors is not None else _flat_vectors(index)
+        coarse = None
+        if COARSE_SEARCH not in COARSE_MODES:
+            log.warning("coarse_search.unknown_mode", mode=COARSE_SEARCH)
+        elif vectors is None:
+            log.warning("coarse_search.no_exact_vectors", index_type=type(index).__name__)
+        else:
+            coarse = CoarseIndex(vectors, COARSE_SEARCH)
+            log.info("coarse_search.built", mode=COARSE_SEARCH, vectors=coarse.ntotal)
+        _built = (((index, exact_vectors), coarse), *_built[:_BUILT_SLOTS - 1])
+        return coarse
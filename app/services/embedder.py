@@ -2,23 +2,47 @@
 Embedder service — wraps google-genai for query-time embedding.
 
 At build time (ingest.py), embeddings are batch-computed separately.
-At runtime, this module embeds one query at a time for retrieval.
+At runtime, this module embeds one query at a time for retrieval;
+warm_embeddings() batch-embeds popular queries ahead of time
+(scripts/warm_embeddings.py).
 
 Task type asymmetry (IMPORTANT):
   - Indexing: task_type="RETRIEVAL_DOCUMENT"
   - Querying: task_type="RETRIEVAL_QUERY"
 Using the wrong task_type degrades retrieval quality.
 """
+import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
+import structlog
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from app.config import EMBEDDING_MODEL, OUTPUT_DIM
+from app.config import EMBEDDING_MODEL, INGEST_BATCH_SIZE, OUTPUT_DIM
+from app.services.blocking import run_blocking
+from app.services.embedding_store import (
+    load_embeddings,
+    normalize_embedding_text,
+    store_embeddings,
+)
+from app.services.hedging import (
+    CircuitBreaker,
+    LatencyTracker,
+    ahedged_call,
+    aretry_until,
+    hedged_call,
+    retry_until,
+)
+from app.services.lru_cache import LRUCache
+from app.services.micro_batch import MicroBatcher
+from app.services.single_flight import AsyncSingleFlight, SingleFlight
+
+log = structlog.get_logger()
 
 # Load .env for local development — no-op in production and when already loaded
 load_dotenv()
@@ -29,75 +53,314 @@ load_dotenv()
 # Never pass the key as a constructor argument.
 _client: genai.Client | None = None
 
+# ── Latency policy ───────────────────────────────────────────────────────────
+# embed_query never blocks longer than its deadline (EMBED_DEADLINE_S unless the
+# caller passes a tighter timeout). Each API call is hedged: if it has not returned
+# after the rolling p95 latency (EMBED_HEDGE_DEFAULT_MS until enough samples), a
+# duplicate is fired and the first success wins. Failures are retried with jittered
+# backoff only while a retry still fits in the remaining budget — see
+# app/services/hedging.py. Counters and p50/p95/p99 are in GET /api/admin/health.
+EMBED_DEADLINE_S = float(os.getenv("EMBED_DEADLINE_S", "4"))
+EMBED_HTTP_TIMEOUT_MS = int(os.getenv("EMBED_HTTP_TIMEOUT_MS", "10000"))
+EMBED_HEDGE_DEFAULT_MS = 800.0
+EMBED_HEDGE_MIN_MS = 150.0  # never hedge earlier — duplicates cost quota
+EMBED_MAX_ATTEMPTS = 3
+EMBED_RETRY_BASE_S = 0.1
+EMBED_RETRY_MAX_S = 1.0
+
+_latency = LatencyTracker()
+_hedge_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="embed_hedge")
+
+# Circuit breaker around the provider: after EMBED_BREAKER_FAILURES consecutive failed
+# embeddings, API calls are skipped for EMBED_BREAKER_RESET_S and embed_query raises
+# EmbeddingUnavailableError at once — explore falls back to keyword ranking meanwhile.
+EMBED_BREAKER_FAILURES = int(os.getenv("EMBED_BREAKER_FAILURES", "5"))
+EMBED_BREAKER_RESET_S = float(os.getenv("EMBED_BREAKER_RESET_S", "30"))
+
+_breaker = CircuitBreaker(EMBED_BREAKER_FAILURES, EMBED_BREAKER_RESET_S, name="embedding")
+
+# Background embeddings started by embed_query_within() that outlive the caller's budget.
+# At most EMBED_BACKGROUND_MAX may be queued or running; past that a new request is
+# not submitted (it falls back at once) so a slow provider cannot grow an unbounded
+# backlog of threads-to-be.
+EMBED_BACKGROUND_MAX = int(os.getenv("EMBED_BACKGROUND_MAX", "16"))
+
+_background_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="embed_bg")
+_background_slots = threading.BoundedSemaphore(EMBED_BACKGROUND_MAX)
+
+
+class EmbeddingUnavailableError(RuntimeError):
+    """The embedding circuit breaker is open — the provider is failing or too slow."""
+
 
 def _get_client() -> genai.Client:
     global _client
     if _client is None:
-        _client = genai.Client()
+        # Hard per-request timeout so a hung call cannot pin a worker thread
+        _client = genai.Client(http_options=types.HttpOptions(timeout=EMBED_HTTP_TIMEOUT_MS))
     return _client
 
 
-# ── TTL embedding cache (PERF-01) ────────────────────────────────────────────
-# Caches query_text → (embedding_vector, timestamp) to avoid duplicate Google
-# API calls (~500ms each) for repeated identical queries within 60 seconds.
-_embed_cache: dict[str, tuple[list[float], float]] = {}
-_embed_lock = threading.Lock()
-EMBED_CACHE_TTL = 60.0  # seconds
+# ── Two-tier embedding cache (PERF-01) ───────────────────────────────────────
+# Query embeddings are deterministic for a given model and dimension, so they
+# never expire: an in-memory LRU (bounded by entry count) sits in front of the
+# on-disk query_embeddings table (app/services/embedding_store.py), which
+# survives restarts and is pre-filled by scripts/warm_embeddings.py.
+# Both tiers are keyed by the whitespace-normalized text; only a miss in both
+# costs a Google API call (~500ms).
+EMBED_CACHE_MAX_ENTRIES = int(os.getenv("EMBED_CACHE_MAX_ENTRIES", "4096"))
 
+_embed_cache = LRUCache(max_entries=EMBED_CACHE_MAX_ENTRIES)
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=1, max=8),
-    reraise=True,
+# Concurrent cache misses for the same text coalesce onto one store lookup / API call
+_embed_flight = SingleFlight()
+
+# ── Micro-batching ───────────────────────────────────────────────────────────
+# Distinct texts that miss both tiers within EMBED_BATCH_WINDOW_MS of each other
+# (explorer, retriever and HyDE threads under load) go out as one embed_content
+# call of up to INGEST_BATCH_SIZE contents — see app/services/micro_batch.py.
+# 0 disables batching (one API call per miss).
+EMBED_BATCH_WINDOW_MS = float(os.getenv("EMBED_BATCH_WINDOW_MS", "5"))
+
+_embed_batcher = MicroBatcher(
+    lambda texts: _hedged_embed(texts, time.monotonic() + EMBED_DEADLINE_S),
+    window=EMBED_BATCH_WINDOW_MS / 1000,
+    max_batch=INGEST_BATCH_SIZE,
+    name="embed_batch",
 )
-def embed_query(text: str) -> list[float]:
+
+
+def embed_query(text: str, timeout: float | None = None) -> list[float]:
     """
     Embed a single query string for semantic search.
 
-    Uses an in-memory TTL cache (60s) to avoid redundant Google API calls
-    for repeated identical queries. Thread-safe via threading.Lock.
+    Checks the in-memory LRU, then the persistent embedding store, before
+    calling the Google API; a fresh vector is written to both tiers.
+    Thread-safe — concurrent misses for the same text share one API call, and
+    concurrent misses for different texts are batched into one call.
 
     Returns a list of OUTPUT_DIM floats, L2-normalized for cosine similarity
     via FAISS IndexFlatIP.
 
     Args:
         text: The user's natural language query.
+        timeout: Seconds the caller can wait (default EMBED_DEADLINE_S). Hedging and
+            retries stay inside this budget.
 
     Returns:
         list[float] of length OUTPUT_DIM (768).
+
+    Raises:
+        TimeoutError: no embedding within the budget.
+    """
+    deadline = time.monotonic() + (EMBED_DEADLINE_S if timeout is None else timeout)
+    key = normalize_embedding_text(text)
+    cached = _embed_cache.get(key)
+    if cached is not None:
+        return cached
+    return _embed_flight.do(key, lambda: _load_or_embed(key, deadline))
+
+
+def embed_query_within(text: str, budget: float) -> list[float] | None:
+    """
+    Embed a query if that takes at most `budget` seconds; otherwise return None.
+
+    Used by latency-budgeted callers (explore) that have a fallback. The embedding is
+    not abandoned on timeout — it keeps running in the background under the normal
+    EMBED_DEADLINE_S policy and lands in the cache, so the next identical request
+    gets the vector. Returns None at once while the circuit breaker is open or
+    EMBED_BACKGROUND_MAX embeddings are already pending, and also when the
+    embedding fails.
+    """
+    cached = _embed_cache.get(normalize_embedding_text(text))
+    if cached is not None:
+        return cached
+    if _breaker.is_open():
+        return None
+    if not _background_slots.acquire(blocking=False):
+        log.warning("embedder.background_full", pending=EMBED_BACKGROUND_MAX)
+        return None
+    future = _background_pool.submit(embed_query, text)
+    future.add_done_callback(lambda _: _background_slots.release())
+    try:
+        return future.result(timeout=max(0.0, budget))
+    except TimeoutError:
+        log.info("embedder.budget_exceeded", budget_ms=int(budget * 1000))
+        return None
+    except Exception as exc:  # noqa: BLE001 — the caller has a fallback; any embed error degrades, never fails
+        log.warning("embedder.embed_failed", error=str(exc))
+        return None
+
+
+def _load_or_embed(key: str, deadline: float) -> list[float]:
+    """Cache miss: read the persistent store, else call the API and store the vector."""
+    vec = load_embeddings([key]).get(key)
+    if vec is None:
+        if not _breaker.allow():
+            raise EmbeddingUnavailableError("embedding circuit breaker is open")
+        try:
+            vec = retry_until(
+                lambda: _embed_one(key, deadline),
+                deadline,
+                _latency,
+                max_attempts=EMBED_MAX_ATTEMPTS,
+                base_delay=EMBED_RETRY_BASE_S,
+                max_delay=EMBED_RETRY_MAX_S,
+            )
+        except Exception:
+            _breaker.record_failure()
+            raise
+        except BaseException:
+            _breaker.release_probe()  # cancelled / interrupted — no verdict, free the probe
+            raise
+        _breaker.record_success()
+        store_embeddings({key: vec})
+    _embed_cache.set(key, vec)
+    return vec
+
+
+def _embed_one(key: str, deadline: float) -> list[float]:
+    if EMBED_BATCH_WINDOW_MS > 0:
+        return _embed_batcher.submit(key, timeout=max(0.0, deadline - time.monotonic()))
+    return _hedged_embed([key], deadline)[0]
+
+
+def _hedge_after(deadline: float) -> float:
+    """
+    Hedge delay in seconds: rolling p95 of API latency, floored at EMBED_HEDGE_MIN_MS and
+    capped at half the remaining budget so the duplicate still has time to finish.
     """
-    now = time.time()
-
-    # Check cache under lock (fast path for cache hits)
-    with _embed_lock:
-        cached = _embed_cache.get(text)
-        if cached is not None:
-            vec, ts = cached
-            if now - ts < EMBED_CACHE_TTL:
-                return vec
-
-    # Cache miss or stale — call Google API outside the lock
-    result = _get_client().models.embed_content(
-        model=EMBEDDING_MODEL,
-        contents=text,
-        config=types.EmbedContentConfig(
-            task_type="RETRIEVAL_QUERY",
-            output_dimensionality=OUTPUT_DIM,
-        ),
-    )
-    vector = np.array(result.embeddings[0].values, dtype=np.float32).reshape(1, -1)
+    p95 = _latency.p95()
+    hedge_ms = EMBED_HEDGE_DEFAULT_MS if p95 is None else p95 * 1000
+    return min(max(hedge_ms, EMBED_HEDGE_MIN_MS) / 1000, (deadline - time.monotonic()) / 2)
+
+
+def _hedged_embed(texts: list[str], deadline: float) -> list[list[float]]:
+    return hedged_call(lambda: _embed_texts(texts), _hedge_pool, _latency, _hedge_after(deadline), deadline)
+
+
+_EMBED_CONFIG = types.EmbedContentConfig(
+    task_type="RETRIEVAL_QUERY",
+    output_dimensionality=OUTPUT_DIM,
+)
+
+
+def _normalized(result) -> list[list[float]]:
+    matrix = np.array([e.values for e in result.embeddings], dtype=np.float32)
     # Normalize: truncated-dim vectors are NOT pre-normalized by Google.
     import faiss
-    faiss.normalize_L2(vector)
-    result_vec = vector[0].tolist()
-
-    # Store in cache and evict stale entries
-    with _embed_lock:
-        _embed_cache[text] = (result_vec, time.time())
-        # Evict entries older than TTL to prevent unbounded growth
-        now2 = time.time()
-        stale_keys = [k for k, (_, ts) in _embed_cache.items() if now2 - ts > EMBED_CACHE_TTL]
-        for k in stale_keys:
-            del _embed_cache[k]
-
-    return result_vec
+    faiss.normalize_L2(matrix)
+    return matrix.tolist()
+
+
+def _embed_texts(texts: list[str]) -> list[list[float]]:
+    """One embed_content call for up to INGEST_BATCH_SIZE query texts; L2-normalized vectors."""
+    result = _get_client().models.embed_content(model=EMBEDDING_MODEL, contents=texts, config=_EMBED_CONFIG)
+    return _normalized(result)
+
+
+# ── Async path (client.aio) ──────────────────────────────────────────────────
+# Used by the async chat pipeline: the API call is awaited on the event loop, so no
+# thread is held while waiting on Google. Same cache tiers, hedging, deadline-aware
+# retries and circuit breaker as embed_query(); the store lookups run on the bounded
+# blocking pool. Concurrent misses coalesce per text (no micro-batching — there are
+# no threads to park while a batch window fills); texts that are known together up
+# front — the query and its HyDE bio — go through aembed_queries() as one call.
+
+_aembed_flight = AsyncSingleFlight()
+
+
+async def aembed_query(text: str, timeout: float | None = None) -> list[float]:
+    """Async embed_query(): same result and cache, awaited on client.aio."""
+    deadline = time.monotonic() + (EMBED_DEADLINE_S if timeout is None else timeout)
+    key = normalize_embedding_text(text)
+    cached = _embed_cache.get(key)
+    if cached is not None:
+        return cached
+    return await _aembed_flight.do(key, lambda: _aload_or_embed(key, deadline))
+
+
+async def aembed_queries(texts: list[str], timeout: float | None = None) -> list[list[float]]:
+    """
+    Async embeddings for several texts, in input order. Cache and store hits are
+    served locally; every remaining text goes out in ONE embed_content call.
+    """
+    deadline = time.monotonic() + (EMBED_DEADLINE_S if timeout is None else timeout)
+    keys = [normalize_embedding_text(text) for text in texts]
+    vectors = {key: vec for key in keys if (vec := _embed_cache.get(key)) is not None}
+    missing = list(dict.fromkeys(key for key in keys if key not in vectors))
+    if missing:
+        vectors.update(await _aload_or_embed_many(missing, deadline))
+    return [vectors[key] for key in keys]
+
+
+async def _aload_or_embed(key: str, deadline: float) -> list[float]:
+    return (await _aload_or_embed_many([key], deadline))[key]
+
+
+async def _aload_or_embed_many(keys: list[str], deadline: float) -> dict[str, list[float]]:
+    vectors = await run_blocking(load_embeddings, keys)
+    fetch = [key for key in keys if key not in vectors]
+    if fetch:
+        if not _breaker.allow():
+            raise EmbeddingUnavailableError("embedding circuit breaker is open")
+        try:
+            embedded = await aretry_until(
+                lambda: ahedged_call(lambda: _aembed_texts(fetch), _latency, _hedge_after(deadline), deadline),
+                deadline,
+                _latency,
+                max_attempts=EMBED_MAX_ATTEMPTS,
+                base_delay=EMBED_RETRY_BASE_S,
+                max_delay=EMBED_RETRY_MAX_S,
+            )
+        except Exception:
+            _breaker.record_failure()
+            raise
+        except BaseException:
+            _breaker.release_probe()  # cancelled / interrupted — no verdict, free the probe
+            raise
+        _breaker.record_success()
+        fresh = dict(zip(fetch, embedded, strict=True))
+        await run_blocking(store_embeddings, fresh)
+        vectors.update(fresh)
+    for key, vec in vectors.items():
+        _embed_cache.set(key, vec)
+    return vectors
+
+
+async def _aembed_texts(texts: list[str]) -> list[list[float]]:
+    result = await _get_client().aio.models.embed_content(model=EMBEDDING_MODEL, contents=texts, config=_EMBED_CONFIG)
+    return _normalized(result)
+
+
+@retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential(multiplier=1, min=4, max=60),
+    reraise=True,
+)
+def _embed_batch(texts: list[str]) -> list[list[float]]:
+    return _embed_texts(texts)
+
+
+def warm_embeddings(texts: list[str]) -> int:
+    """
+    Pre-embed query texts into the persistent store with batched embed_content calls.
+    Texts already stored (after normalization) are skipped. Returns the number embedded.
+    """
+    pending = list(dict.fromkeys(k for k in map(normalize_embedding_text, texts) if k))
+    stored = load_embeddings(pending)
+    pending = [k for k in pending if k not in stored]
+    for i in range(0, len(pending), INGEST_BATCH_SIZE):
+        batch = pending[i:i + INGEST_BATCH_SIZE]
+        store_embeddings(dict(zip(batch, _embed_batch(batch), strict=True)))
+    return len(pending)
+
+
+def embed_cache_stats() -> dict:
+    """Hit/miss/eviction counters and current size of the in-memory embedding LRU."""
+    stats = _embed_cache.stats()
+    stats["coalesced"] = _embed_flight.coalesced
+    stats["batching"] = _embed_batcher.stats()
+    stats["api"] = _latency.snapshot()
+    stats["breaker"] = _breaker.snapshot()
+    return stats
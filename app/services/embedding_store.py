@@ -0,0 +1,68 @@
+"""
+On-disk query-embedding store — the persistent tier behind embed_query().
+
+Vectors live in the query_embeddings table (app/models.py QueryEmbedding) as
+float32 blobs keyed by (normalized text, EMBEDDING_MODEL, OUTPUT_DIM), so
+changing the model or the output dimension never serves a stale vector.
+Rows survive restarts and deploys; scripts/warm_embeddings.py pre-fills them
+from popular past queries.
+
+Any database error is logged and treated as a miss — the store never fails
+a search, it only saves a Google API round trip when it can.
+"""
+import numpy as np
+import structlog
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import EMBEDDING_MODEL, OUTPUT_DIM
+from app.database import SessionLocal
+from app.models import QueryEmbedding
+
+log = structlog.get_logger()
+
+
+def normalize_embedding_text(text: str) -> str:
+    """Collapse whitespace runs and strip — the text that is embedded and used as the key."""
+    return " ".join(text.split())
+
+
+def load_embeddings(texts: list[str]) -> dict[str, list[float]]:
+    """Return stored vectors for the given normalized texts; misses are omitted."""
+    if not texts:
+        return {}
+    try:
+        with SessionLocal() as db:
+            rows = db.execute(
+                select(QueryEmbedding.text, QueryEmbedding.vector).where(
+                    QueryEmbedding.model == EMBEDDING_MODEL,
+                    QueryEmbedding.dim == OUTPUT_DIM,
+                    QueryEmbedding.text.in_(texts),
+                )
+            ).all()
+    except SQLAlchemyError as exc:
+        log.warning("embedding_store.load_failed", error=str(exc))
+        return {}
+    return {text: np.frombuffer(blob, dtype=np.float32).tolist() for text, blob in rows}
+
+
+def store_embeddings(vectors: dict[str, list[float]]) -> None:
+    """Persist normalized text → vector pairs; existing rows are left untouched."""
+    if not vectors:
+        return
+    rows = [
+        {
+            "text": text,
+            "model": EMBEDDING_MODEL,
+            "dim": OUTPUT_DIM,
+            "vector": np.asarray(vec, dtype=np.float32).tobytes(),
+        }
+        for text, vec in vectors.items()
+    ]
+    try:
+        with SessionLocal() as db:
+            db.execute(sqlite_insert(QueryEmbedding).values(rows).on_conflict_do_nothing())
+            db.commit()
+    except SQLAlchemyError as exc:
+        log.warning("embedding_store.store_failed", error=str(exc), count=len(rows))
@@ -0,0 +1,114 @@
+"""
+On-disk expert-embedding store — lets scripts/ingest.py re-embed only changed experts.
+
+Vectors live in the expert_embeddings table (app/models.py ExpertEmbedding) as
+float32 blobs keyed by (sha256 of the expert's embedding text, EMBEDDING_MODEL,
+OUTPUT_DIM). An expert whose expert_to_text() output is unchanged reuses its stored
+vector; any edit to name, title, company, bio or tags changes the hash, and a
+model or dimension change never serves a stale vector. A rebuild after a delete or
+a single edit therefore calls the API for at most the changed experts and
+assembles the index from stored vectors.
+
+Any database error is logged and treated as a miss — the store never fails an
+ingest, it only saves Gemini API calls when it can.
+"""
+import hashlib
+
+import numpy as np
+import structlog
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import EMBEDDING_MODEL, OUTPUT_DIM
+from app.database import SessionLocal
+from app.models import ExpertEmbedding
+
+log = structlog.get_logger()
+
+_IN_CHUNK = 500  # hashes per IN (...) query — stays under SQLite's bound-parameter limit
+
+
+def content_hash(text: str) -> str:
+    """Key of an expert's embedding text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def load_expert_embeddings(hashes: list[str]) -> dict[str, np.ndarray]:
+    """Return stored float32 vectors for the given content hashes; misses are omitted."""
+    found: dict[str, np.ndarray] = {}
+    try:
+        with SessionLocal() as db:
+            for start in range(0, len(hashes), _IN_CHUNK):
+                rows = db.execute(
+                    select(ExpertEmbedding.content_hash, ExpertEmbedding.vector).where(
+                        ExpertEmbedding.model == EMBEDDING_MODEL,
+                        ExpertEmbedding.dim == OUTPUT_DIM,
+                        ExpertEmbedding.content_hash.in_(hashes[start:start + _IN_CHUNK]),
+                    )
+                ).all()
+                found.update((h, np.frombuffer(blob, dtype=np.float32)) for h, blob in rows)
+    except SQLAlchemyError as exc:
+        log.warning("expert_embedding_store.load_failed", error=str(exc))
+        return {}
+    return found
+
+
+def store_expert_embeddings(vectors: dict[str, np.ndarray], replace: bool = False) -> None:
+    """
+    Persist content hash → L2-normalized vector pairs.
+
+    Existing rows are left untouched unless replace is set (ingest --full), which
+    overwrites their vector and created_at with the fresh embedding.
+    """
+    if not vectors:
+        return
+    rows = [
+        {
+            "content_hash": h,
+            "model": EMBEDDING_MODEL,
+            "dim": OUTPUT_DIM,
+            "vector": np.asarray(vec, dtype=np.float32).tobytes(),
+        }
+        for h, vec in vectors.items()
+    ]
+    try:
+        with SessionLocal() as db:
+            stmt = sqlite_insert(ExpertEmbedding).values(rows)
+            if replace:  # created_at in excluded is the column default of the new row
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["content_hash", "model", "dim"],
+                    set_={"vector": stmt.excluded.vector, "created_at": stmt.excluded.created_at},
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing()
+            db.execute(stmt)
+            db.commit()
+    except SQLAlchemyError as exc:
+        log.warning("expert_embedding_store.store_failed", error=str(exc), count=len(rows))
+
+
+def prune_expert_embeddings(keep: set[str]) -> int:
+    """Delete this model/dim's rows whose hash is not in keep (the live catalog); returns the count."""
+    try:
+        with SessionLocal() as db:
+            stored = db.scalars(
+                select(ExpertEmbedding.content_hash).where(
+                    ExpertEmbedding.model == EMBEDDING_MODEL,
+                    ExpertEmbedding.dim == OUTPUT_DIM,
+                )
+            ).all()
+            stale = [h for h in stored if h not in keep]
+            for start in range(0, len(stale), _IN_CHUNK):
+                db.execute(
+                    delete(ExpertEmbedding).where(
+                        ExpertEmbedding.model == EMBEDDING_MODEL,
+                        ExpertEmbedding.dim == OUTPUT_DIM,
+                        ExpertEmbedding.content_hash.in_(stale[start:start + _IN_CHUNK]),
+                    )
+                )
+            db.commit()
+    except SQLAlchemyError as exc:
+        log.warning("expert_embedding_store.prune_failed", error=str(exc))
+        return 0
+    return len(stale)
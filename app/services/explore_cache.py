@@ -1,45 +1,208 @@
 """
-Explore endpoint TTL cache — module-level thread-safe dict cache.
+Explore endpoint response cache — module-level LRUCache (app/services/lru_cache.py).
 
-Matches the existing project pattern (_embed_cache in embedder.py,
-_settings_cache in search_intelligence.py). Explore results are cached
-with a 5-minute TTL per user decisions (CONTEXT.md). Cache is invalidated
-whenever experts are added, deleted, or re-ingested.
+Stores serialized /api/explore response bodies under canonical keys: the query is
+whitespace-collapsed and lowercased, tag lists are deduplicated and sorted, and
+rates are keyed by their float value — so near-identical requests share an entry.
+The router normalizes the query and tags the same way before running the pipeline,
+so a hit always returns exactly what the request would have computed.
+
+Bounded by entry count and a byte budget, with a per-entry TTL (5 minutes by
+default, per user decisions in CONTEXT.md). Hit/miss/eviction counters are exposed
+via explore_cache_stats() in GET /api/admin/health.
+
+Cache is invalidated whenever experts are added, deleted, or re-ingested —
+invalidation also marks the in-memory expert catalog snapshot stale
+(app/services/catalog.py) so both derived views of the experts table are
+refreshed together, and stops new searches from reusing existing ranking
+snapshots (app/services/explore_snapshots.py).
+
+Multi-worker (EXPLORE_SHARED_CACHE=true): the in-process LRU is L1 and
+app/services/shared_cache.py is a host-wide L2 shared by every uvicorn worker.
+Invalidation bumps the shared generation; each worker polls it (at most every
+SHARED_GENERATION_POLL seconds) and, when another worker bumped it, clears its L1,
+drops its snapshot keys and marks its catalog stale.
 """
+import os
+import sqlite3
 import threading
 import time
 from typing import Any
 
-_cache: dict[str, tuple[Any, float]] = {}
-_cache_lock = threading.Lock()
+import structlog
+
+from app.services.catalog import invalidate_catalog
+from app.services.explore_snapshots import drop_snapshot_keys
+from app.services.lru_cache import LRUCache
+from app.services.shared_cache import SharedCache, get_shared_cache
+
+log = structlog.get_logger()
+
+EXPLORE_CACHE_TTL = float(os.getenv("EXPLORE_CACHE_TTL", "300"))  # 5 minutes (CONTEXT.md)
+EXPLORE_CACHE_MAX_ENTRIES = int(os.getenv("EXPLORE_CACHE_MAX_ENTRIES", "2000"))
+EXPLORE_CACHE_MAX_BYTES = int(os.getenv("EXPLORE_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+_cache = LRUCache(
+    max_entries=EXPLORE_CACHE_MAX_ENTRIES,
+    max_bytes=EXPLORE_CACHE_MAX_BYTES,
+    ttl=EXPLORE_CACHE_TTL,
+)
+
+# Optional cross-worker L2 (app/services/shared_cache.py)
+EXPLORE_SHARED_CACHE = os.getenv("EXPLORE_SHARED_CACHE", "false").lower() == "true"
+SHARED_GENERATION_POLL = 0.5  # seconds — max staleness of L1 after another worker invalidates
+
+_seen_generation: int | None = None
+_last_poll = 0.0
+_generation_lock = threading.Lock()
+
+
+# ── Canonical keys ───────────────────────────────────────────────────────────
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace and lowercase — FTS5 and match reasons are case-insensitive already."""
+    return " ".join(query.split()).lower()
+
+
+def normalize_tags(tags: list[str]) -> list[str]:
+    """Skill tags: lowercased (matched case-insensitively), deduplicated, sorted."""
+    return sorted({t.strip().lower() for t in tags if t.strip()})
+
 
-EXPLORE_CACHE_TTL = 300.0  # 5 minutes (user decision in CONTEXT.md)
-EXPLORE_CACHE_MAX_SIZE = 200
+def normalize_industry_tags(industry_tags: list[str]) -> list[str]:
+    """Industry tags: matched exactly, so only stripped, deduplicated and sorted."""
+    return sorted({t.strip() for t in industry_tags if t.strip()})
 
 
-def get_cached(key: str) -> Any | None:
-    """Return cached value if present and not expired, else None."""
-    with _cache_lock:
-        entry = _cache.get(key)
-        if entry is None:
-            return None
-        value, ts = entry
-        if time.time() - ts > EXPLORE_CACHE_TTL:
-            del _cache[key]
-            return None
+def explore_cache_key(
+    query: str,
+    rate_min: float,
+    rate_max: float,
+    tags: list[str],
+    industry_tags: list[str],
+    limit: int,
+    cursor: int,
+    seed: int,
+    usernames: list[str],
+) -> tuple:
+    """Canonical cache key for one explore request."""
+    return (
+        normalize_query(query),
+        float(rate_min),
+        float(rate_max),
+        tuple(normalize_tags(tags)),
+        tuple(normalize_industry_tags(industry_tags)),
+        limit,
+        cursor,
+        seed,
+        tuple(sorted(set(usernames))),
+    )
+
+
+# ── Cache access ─────────────────────────────────────────────────────────────
+
+def _shared() -> SharedCache | None:
+    return get_shared_cache() if EXPLORE_SHARED_CACHE else None
+
+
+def _sync_generation(shared: SharedCache) -> int | None:
+    """Poll the shared generation; invalidate local state if another worker bumped it."""
+    global _seen_generation, _last_poll
+    now = time.monotonic()
+    if _seen_generation is not None and now - _last_poll < SHARED_GENERATION_POLL:
+        return _seen_generation
+    try:
+        generation = shared.generation()
+    except sqlite3.Error as exc:
+        log.warning("explore_cache.shared_poll_failed", error=str(exc))
+        return _seen_generation
+    with _generation_lock:
+        if _seen_generation is not None and generation != _seen_generation:
+            # Another worker invalidated — its tag-index patches never reached this
+            # process either, so always rebuild the catalog here.
+            _invalidate_local(rebuild_catalog=True)
+            log.info("explore_cache.remote_invalidation", generation=generation)
+        _seen_generation = generation
+        _last_poll = now
+    return generation
+
+
+def cache_generation() -> int | None:
+    """
+    Shared generation to tag a result with — read BEFORE computing it, so a result
+    computed across an invalidation is stored at the old generation and never served.
+    None when the shared cache is disabled.
+    """
+    shared = _shared()
+    return _sync_generation(shared) if shared is not None else None
+
+
+def get_cached(key: tuple) -> Any | None:
+    """Return cached value from L1, then the shared L2 (if enabled), else None."""
+    shared = _shared()
+    if shared is not None:
+        _sync_generation(shared)
+    value = _cache.get(key)
+    if value is not None or shared is None:
         return value
+    try:
+        value = shared.get(key)
+    except sqlite3.Error as exc:
+        log.warning("explore_cache.shared_get_failed", error=str(exc))
+        return None
+    if value is not None:
+        _cache.set(key, value)  # promote to L1
+    return value
+
+
+def set_cached(key: tuple, value: Any, generation: int | None = None) -> None:
+    """
+    Store value in L1 (evicting least recently used entries over budget) and, when
+    enabled, in the shared L2 at `generation` (from cache_generation()).
+    """
+    _cache.set(key, value)
+    shared = _shared()
+    if shared is None or generation is None:
+        return
+    try:
+        shared.set(key, value, generation, EXPLORE_CACHE_TTL)
+    except sqlite3.Error as exc:
+        log.warning("explore_cache.shared_set_failed", error=str(exc))
+
+
+def explore_cache_stats() -> dict:
+    """Hit/miss/eviction counters and current size of the explore response cache (L1)."""
+    stats = _cache.stats()
+    stats["shared_l2"] = EXPLORE_SHARED_CACHE
+    stats["shared_generation"] = _seen_generation
+    return stats
+
 
+def _invalidate_local(rebuild_catalog: bool) -> None:
+    _cache.clear()
+    drop_snapshot_keys()  # in-flight scroll sessions keep paging their snapshot
+    if rebuild_catalog:
+        invalidate_catalog()
 
-def set_cached(key: str, value: Any) -> None:
-    """Store value in cache, evicting oldest entry if at capacity."""
-    with _cache_lock:
-        if len(_cache) >= EXPLORE_CACHE_MAX_SIZE:
-            oldest_key = min(_cache, key=lambda k: _cache[k][1])
-            del _cache[oldest_key]
-        _cache[key] = (value, time.time())
 
+def invalidate_explore_cache(rebuild_catalog: bool = True) -> None:
+    """
+    Clear all cached explore results and mark the catalog stale. Call after any expert mutation.
 
-def invalidate_explore_cache() -> None:
-    """Clear all cached explore results. Call after any expert mutation."""
-    with _cache_lock:
-        _cache.clear()
+    Pass rebuild_catalog=False when only expert_tags changed via sync_expert_tags() —
+    the catalog tag index is patched incrementally on commit, no rebuild needed.
+    With the shared cache enabled, also bumps the shared generation so every other
+    worker drops its cached results and catalog on its next poll.
+    """
+    global _seen_generation
+    _invalidate_local(rebuild_catalog)
+    shared = _shared()
+    if shared is None:
+        return
+    try:
+        generation = shared.bump_generation()
+    except sqlite3.Error as exc:
+        log.warning("explore_cache.shared_invalidate_failed", error=str(exc))
+        return
+    with _generation_lock:
+        _seen_generation = generation
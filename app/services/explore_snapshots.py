@@ -0,0 +1,111 @@
+"""
+Ranked-result snapshots behind /api/explore cursor pagination.
+
+The first page request for a (query, filters, seed) combination runs the full
+pipeline once and stores the resulting ranking as a RankingSnapshot. Later page
+requests that pass the snapshot id back slice the stored ranking instead of
+re-running embedding, FAISS, FTS5 and fusion — including seeded filter-mode
+requests, which the response cache in explore_cache.py never covers.
+
+Stability: a snapshot keeps a reference to the catalog it was ranked against, so
+infinite scroll over one snapshot is unaffected by catalog rebuilds mid-session.
+invalidate_explore_cache() only drops the (query, filters) → snapshot index, so new
+searches rank against fresh data while in-flight scroll sessions keep their order.
+
+Module-level thread-safe store, same pattern as explore_cache.py.
+"""
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from app.services.catalog import ExpertCatalog
+
+SNAPSHOT_TTL = 900.0        # 15 minutes — one browsing session of infinite scroll
+SNAPSHOT_REUSE_TTL = 300.0  # new searches reuse a snapshot only this long (matches EXPLORE_CACHE_TTL)
+SNAPSHOT_MAX_SIZE = 200
+
+
+@dataclass
+class RankingSnapshot:
+    """
+    One ranked result list, aligned by candidate index.
+
+    rows are catalog rows of every ranked candidate. Text mode carries the score
+    arrays and tiers; ranked holds the ranked prefix (candidate indices) computed
+    so far and is extended on demand by the explorer. Filter mode is fully ranked
+    up front and has no scores.
+    """
+    key: str
+    catalog: ExpertCatalog
+    query: str
+    rows: np.ndarray                       # int64 catalog rows
+    total: int
+    max_rate: float
+    ranked: np.ndarray                     # int64 indices into rows, best first
+    final_scores: np.ndarray | None = None
+    faiss_scores: np.ndarray | None = None
+    bm25_scores: np.ndarray | None = None
+    tiers: np.ndarray | None = None
+    degraded: bool = False                 # ranked without the vector stage (explorer latency budget)
+    id: str = field(default_factory=lambda: secrets.token_urlsafe(9))
+    created_at: float = field(default_factory=time.time)
+    # (cursor, limit) → pre-built next-page response (background prefetch)
+    pages: dict[tuple[int, int], Any] = field(default_factory=dict, repr=False)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+_snapshots: "OrderedDict[str, RankingSnapshot]" = OrderedDict()
+_by_key: dict[str, str] = {}
+_lock = threading.Lock()
+
+
+def _expired(snapshot: RankingSnapshot) -> bool:
+    return time.time() - snapshot.created_at > SNAPSHOT_TTL
+
+
+def get_snapshot(snapshot_id: str) -> RankingSnapshot | None:
+    """Return the snapshot with this id if present and not expired, else None."""
+    with _lock:
+        snapshot = _snapshots.get(snapshot_id)
+        if snapshot is None:
+            return None
+        if _expired(snapshot):
+            del _snapshots[snapshot_id]
+            return None
+        return snapshot
+
+
+def find_snapshot(key: str) -> RankingSnapshot | None:
+    """Return the current snapshot for a (query, filters, seed) key, if any."""
+    with _lock:
+        snapshot_id = _by_key.get(key)
+    snapshot = get_snapshot(snapshot_id) if snapshot_id else None
+    if snapshot is None or time.time() - snapshot.created_at > SNAPSHOT_REUSE_TTL:
+        return None
+    return snapshot
+
+
+def put_snapshot(snapshot: RankingSnapshot, reusable: bool = True) -> None:
+    """
+    Store a snapshot and, if reusable, make it current for its key; evicts the oldest at
+    capacity. Non-reusable snapshots are only reachable by id (cursor paging).
+    """
+    with _lock:
+        while len(_snapshots) >= SNAPSHOT_MAX_SIZE:
+            _, evicted = _snapshots.popitem(last=False)
+            if _by_key.get(evicted.key) == evicted.id:
+                del _by_key[evicted.key]
+        _snapshots[snapshot.id] = snapshot
+        if reusable:
+            _by_key[snapshot.key] = snapshot.id
+
+
+def drop_snapshot_keys() -> None:
+    """Stop reusing existing snapshots for new searches. Existing ids stay pageable."""
+    with _lock:
+        _by_key.clear()
@@ -2,13 +2,31 @@
 Hybrid search pipeline service for GET /api/explore.
 
 Three-stage pipeline:
-  1. SQLAlchemy pre-filter — hourly_rate range + tag AND-logic filter
-  2. FAISS IDSelectorBatch — semantic vector search on pre-filtered subset
+  1. Catalog pre-filter — vectorized hourly_rate range + is_active mask over the
+     in-memory catalog snapshot (app/services/catalog.py) + tag AND-logic filter
+     as a bitwise intersection over the bitmap tag index (app/services/tag_index.py)
+  2. Filter-aware FAISS search — scores only the pre-filtered subset: direct
+     matrix-vector product for small subsets, IDSelectorBatch / IDSelectorBitmap
+     search for larger ones (app/services/vector_search.py)
   3. FTS5 BM25 — keyword scoring, fused with FAISS at 0.7/0.3 weights
 
 Pure filter mode (no text query): sorts by findability_score DESC only —
   FAISS and FTS5 stages are skipped entirely.
 
+Latency budget: the vector stage gets whatever is left of LATENCY_BUDGET_S after
+Stage 1. If the query embedding does not arrive in time, or the embedding circuit
+breaker is open, Stage 2 is skipped and the results are ranked by BM25 +
+findability only and flagged degraded=True. The embedding keeps running in the
+background, so the next identical request gets the full hybrid ranking; degraded
+results are never reused as snapshots for new searches or cached by the router.
+
+Progressive mode (stream_explore, GET /api/explore/stream): a cold text query first
+yields a keyword page (BM25 + findability, no waiting on the embedding) and then the
+fused ranking once the query vector is ready.
+
+Each ranking is kept as a snapshot (app/services/explore_snapshots.py), so cursor
+pages after the first slice the stored ranking instead of re-running the pipeline.
+
 Output: ExploreResponse — the stable data contract all downstream phases build against.
 """
 
@@ -16,27 +34,50 @@ import json
 import random
 import re
 import time
+from collections.abc import Iterator
 from typing import Optional
 
 import numpy as np
+import orjson
 import structlog
-from pydantic import BaseModel
-from sqlalchemy import and_, exists, select, text
+from pydantic import BaseModel, PrivateAttr
+from sqlalchemy import select, text
 from sqlalchemy.orm import Session
 
-from app.models import Expert, ExpertTag, Feedback
-from app.services.embedder import embed_query
+from app.models import Expert
+from app.services.card_cache import CardFragment, get_fragments, put_fragment
+from app.services.catalog import current_generation, get_catalog
+from app.services.coarse_search import coarse_index_for
+from app.services.embedder import embed_query_within
+from app.services.explore_snapshots import (
+    RankingSnapshot,
+    find_snapshot,
+    get_snapshot,
+    put_snapshot,
+)
+from app.services.feedback_stats import feedback_multipliers
+from app.services.vector_search import search_subset
 
 log = structlog.get_logger()
 
 # --- Constants (hardcoded — no env vars; tuning is rare at this scale) ---
 FAISS_WEIGHT = 0.7
 BM25_WEIGHT = 0.3
+FEEDBACK_BOOST_CAP = 0.20
 ITEMS_PER_PAGE = 20
+LATENCY_BUDGET_S = 1.0  # per request; past it the vector stage is skipped (degraded mode)
+STREAM_LATENCY_BUDGET_S = 5.0  # streaming already showed keyword results — wait longer for the vector
 
 
 # --- Response schemas (stable data contract for phases 15–19) ---
 
+# Card fields that depend only on the expert row — cached per expert (app/services/card_cache.py)
+_STATIC_CARD_FIELDS = (
+    "username", "first_name", "last_name", "job_title", "company", "hourly_rate",
+    "currency", "profile_url", "photo_url", "tags", "findability_score", "category",
+)
+
+
 class ExpertCard(BaseModel):
     username: str
     first_name: str
@@ -55,6 +96,21 @@ class ExpertCard(BaseModel):
     final_score: float          # findability-boosted fused score (or findability_score in filter mode)
     match_reason: str | None    # None when query is empty
 
+    # Pre-serialized static fields from the card fragment cache (set by _card_from_fragment)
+    _static_json: bytes | None = PrivateAttr(default=None)
+
+    def to_json(self) -> bytes:
+        """Serialize with orjson, splicing in the cached static JSON when available."""
+        if self._static_json is None:
+            return orjson.dumps(self.model_dump())
+        dynamic = orjson.dumps({
+            "faiss_score": self.faiss_score,
+            "bm25_score": self.bm25_score,
+            "final_score": self.final_score,
+            "match_reason": self.match_reason,
+        })
+        return b"{" + self._static_json + b"," + dynamic[1:]
+
 
 class ExploreResponse(BaseModel):
     experts: list[ExpertCard]
@@ -62,6 +118,16 @@ class ExploreResponse(BaseModel):
     cursor: int | None  # next offset; None = no more pages
     took_ms: int
     max_rate: float     # highest hourly_rate among all pre-filtered experts (before pagination)
+    snapshot: str | None = None  # ranking snapshot id — send back with cursor to page the same ranking
+    degraded: bool = False  # True when the vector stage was skipped — BM25 + findability ranking only
+
+    def to_json(self) -> bytes:
+        """
+        Serialize the response body with orjson — same JSON as response_model validation
+        + stdlib encoding, without the second validation pass over every card.
+        """
+        rest = orjson.dumps(self.model_dump(exclude={"experts"}))
+        return b'{"experts":[' + b",".join(card.to_json() for card in self.experts) + b"]," + rest[1:]
 
 
 # --- FTS5 query sanitizer ---
@@ -80,43 +146,72 @@ def _safe_fts_query(query: str) -> str:
 
 # --- Tier key helper ---
 
-def _tier_key(findability_score: float | None) -> int:
+def _tier_keys(findability: np.ndarray) -> np.ndarray:
     """
-    Map a findability_score to a sort tier (ascending = better first).
+    Map findability_score values to sort tiers (ascending = better first).
     Mirrors the findabilityLabel() thresholds in the frontend ExpertCard.
 
-    Returns:
+    Returns an int8 array:
         0 — Top Match (findability_score >= 88)
         1 — Good Match (findability_score >= 75)
-        2 — rest (score < 75 or None)
+        2 — rest (score < 75 or NULL/NaN)
     """
-    if findability_score is None:
-        return 2
-    if findability_score >= 88:
-        return 0
-    if findability_score >= 75:
-        return 1
-    return 2
+    tiers = np.full(findability.shape, 2, dtype=np.int8)
+    tiers[findability >= 75] = 1  # NaN compares False — stays in tier 2
+    tiers[findability >= 88] = 0
+    return tiers
 
 
 # --- Scoring helpers ---
 
-def _apply_findability_boost(fused_score: float, findability_score: float | None) -> float:
+def _apply_findability_boost(fused: np.ndarray, findability: np.ndarray) -> np.ndarray:
     """
     Multiplicative findability boost: ±20% max based on findability_score (50–100 range).
     Experts at findability=100 get +20% boost; at 50 get -20% penalty.
     Neutral at findability=75 (midpoint of 50–100 range).
-    Returns fused_score unchanged when findability_score is None.
+    Leaves fused scores unchanged where findability_score is NULL (NaN).
     """
-    if findability_score is None:
-        return fused_score
     # Normalize 50–100 range to -1.0 to +1.0
-    normalized = (findability_score - 75.0) / 25.0  # -1 at 50, 0 at 75, +1 at 100
-    multiplier = 1.0 + (normalized * 0.20)           # range: 0.8 to 1.2
-    return fused_score * multiplier
+    normalized = (findability - 75.0) / 25.0  # -1 at 50, 0 at 75, +1 at 100
+    multiplier = 1.0 + (normalized * 0.20)     # range: 0.8 to 1.2
+    return np.where(np.isnan(findability), fused, fused * multiplier)
+
 
+def _rank_window(tiers: np.ndarray, scores: np.ndarray, window: int) -> np.ndarray:
+    """
+    Return indices of the first `window` items ordered by (tier ASC, score DESC, index ASC).
 
-def _build_match_reason(expert: Expert, tags: list[str], query: str) -> Optional[str]:
+    Same order as a stable full sort on (tier, -score), but only the tier that
+    straddles the window boundary is partitioned (np.argpartition) and only the
+    selected candidates are lexsorted — cost tracks the page, not the pool.
+    """
+    n = scores.size
+    if window >= n:
+        return np.lexsort((np.arange(n), -scores, tiers))
+
+    selected: list[np.ndarray] = []
+    remaining = window
+    for tier in range(3):
+        members = np.flatnonzero(tiers == tier)
+        if members.size <= remaining:
+            selected.append(members)
+            remaining -= members.size
+            if remaining == 0:
+                break
+            continue
+        # Boundary tier: keep everything scoring at least the remaining-th best
+        # (ties included, so the index tie-break below stays exact).
+        neg = -scores[members]
+        cutoff = neg[np.argpartition(neg, remaining - 1)[remaining - 1]]
+        selected.append(members[neg <= cutoff])
+        break
+
+    candidates = np.concatenate(selected)
+    order = np.lexsort((candidates, -scores[candidates], tiers[candidates]))
+    return candidates[order][:window]
+
+
+def _build_match_reason(job_title: str | None, tags: list[str], query: str) -> Optional[str]:
     """
     Construct a match_reason label from tag intersection — deterministic, zero latency.
     Returns None when the query is empty.
@@ -128,25 +223,23 @@ def _build_match_reason(expert: Expert, tags: list[str], query: str) -> Optional
     matched_tags = [t for t in tags if t.lower() in query_lower][:3]
     if matched_tags:
         return "Strong match: " + ", ".join(matched_tags)
-    if expert.job_title:
-        return f"Match via: {expert.job_title}"
+    if job_title:
+        return f"Match via: {job_title}"
     return None
 
 
-def _build_card(
-    expert: Expert,
-    faiss_score: Optional[float],
-    bm25_score: Optional[float],
-    final_score: float,
-    query: str,
-) -> ExpertCard:
-    """Build an ExpertCard from an Expert ORM object and computed scores."""
+def _card_fragment(expert: Expert) -> CardFragment:
+    """
+    Build the cacheable static part of an expert's card.
+
+    Validated once through ExpertCard (same coercion and errors as a full card);
+    the JSON body is serialized here so cache hits never re-encode it.
+    """
     tags = json.loads(expert.tags or "[]")
-    match_reason = _build_match_reason(expert, tags, query) if query.strip() else None
     # Build photo proxy URL if expert has a photo stored
     photo_url = f"/api/photos/{expert.username}" if expert.photo_url else None
 
-    return ExpertCard(
+    card = ExpertCard(
         username=expert.username,
         first_name=expert.first_name,
         last_name=expert.last_name,
@@ -159,11 +252,65 @@ def _build_card(
         tags=tags,
         findability_score=expert.findability_score,
         category=expert.category,
+        faiss_score=None,
+        bm25_score=None,
+        final_score=0.0,
+        match_reason=None,
+    )
+    fields = card.model_dump(include=set(_STATIC_CARD_FIELDS))
+    return CardFragment(fields=fields, json=orjson.dumps(fields)[1:-1])
+
+
+def _card_from_fragment(
+    fragment: CardFragment,
+    faiss_score: Optional[float],
+    bm25_score: Optional[float],
+    final_score: float,
+    query: str,
+) -> ExpertCard:
+    """Build an ExpertCard from a cached fragment and computed scores — no re-validation."""
+    fields = fragment.fields
+    match_reason = _build_match_reason(fields["job_title"], fields["tags"], query) if query.strip() else None
+    card = ExpertCard.model_construct(
+        **fields,
         faiss_score=faiss_score,
         bm25_score=bm25_score,
         final_score=round(final_score, 4),
         match_reason=match_reason,
     )
+    card._static_json = fragment.json
+    return card
+
+
+def _load_page_fragments(db: Session, ids: list[int]) -> dict[int, CardFragment]:
+    """
+    Return card fragments for one page of expert ids, loading only cache misses from the DB.
+
+    Ids whose expert no longer exists are absent from the result.
+    """
+    version = current_generation()
+    fragments = {key[0]: f for key, f in get_fragments([(i, version) for i in ids]).items()}
+    missing = [i for i in ids if i not in fragments]
+    if missing:
+        for expert in db.scalars(select(Expert).where(Expert.id.in_(missing))).all():
+            fragment = _card_fragment(expert)
+            put_fragment((expert.id, version), fragment)
+            fragments[expert.id] = fragment
+    return fragments
+
+
+# --- Snapshot key ---
+
+def _snapshot_key(
+    query: str,
+    rate_min: float,
+    rate_max: float,
+    tags: list[str],
+    industry_tags: list[str],
+    seed: int | None,
+) -> str:
+    """Key identifying one ranking: query + filters + seed, independent of cursor/limit."""
+    return f"{query}|{rate_min}|{rate_max}|{sorted(tags)}|{sorted(industry_tags)}|{seed or 0}"
 
 
 # --- Main pipeline ---
@@ -180,15 +327,25 @@ def run_explore(
     industry_tags: list[str] | None = None,
     seed: int | None = None,
     usernames: list[str] | None = None,
+    snapshot_id: str | None = None,
+    latency_budget: float = LATENCY_BUDGET_S,
 ) -> ExploreResponse:
     """
     Three-stage hybrid search pipeline.
 
-    Stage 1 (always): SQLAlchemy pre-filter by rate range + tags (AND logic).
-    Stage 2 (text query only): FAISS IDSelectorBatch semantic search.
+    Stage 1 (always): vectorized pre-filter over the catalog snapshot by rate range +
+                      active flag, plus bitmap tag intersection (AND logic).
+    Stage 2 (text query only): filter-aware FAISS search over the pre-filtered subset.
     Stage 3 (text query only): FTS5 BM25 keyword scoring.
-    Fusion: FAISS * 0.7 + BM25 * 0.3, then findability boost (±20%).
+    Fusion: FAISS * 0.7 + BM25 * 0.3, then findability boost (±20%) and feedback
+            multipliers — NumPy ops over score arrays aligned with the filtered rows;
+            only the window up to the requested page is ranked.
     Pure filter mode: sorted by findability_score DESC, skips FAISS and FTS5.
+    ORM rows are loaded for the returned page only.
+
+    The ranking is stored as a snapshot (app/services/explore_snapshots.py). Page
+    requests that pass snapshot_id back — or repeat a search whose snapshot is still
+    current — slice the stored ranking and skip all three stages.
     """
     start = time.time()
 
@@ -198,7 +355,7 @@ def run_explore(
             select(Expert).where(Expert.username.in_(usernames), Expert.is_active.is_(True))
         ).all())
         cards = [
-            _build_card(e, None, None, e.findability_score or 0.0, "")
+            _card_from_fragment(_card_fragment(e), None, None, e.findability_score or 0.0, "")
             for e in experts
         ]
         return ExploreResponse(
@@ -209,89 +366,178 @@ def run_explore(
             max_rate=max((e.hourly_rate for e in experts), default=0.0),
         )
 
-    # --- Stage 1: SQLAlchemy pre-filter (always runs) ---
-    stmt = select(Expert).where(
-        and_(
-            Expert.hourly_rate >= rate_min,
-            Expert.hourly_rate <= rate_max,
-            Expert.is_active.is_(True),
+    key = _snapshot_key(query, rate_min, rate_max, tags, industry_tags or [], seed)
+
+    # --- Ranking snapshot: reuse the stored ranking for this search when possible ---
+    snapshot = get_snapshot(snapshot_id) if snapshot_id else None
+    if snapshot is not None and snapshot.key != key:
+        snapshot = None  # id from a different search — ignore it
+    snapshot_hit = snapshot is not None
+    if snapshot is None:
+        snapshot = find_snapshot(key)
+        snapshot_hit = snapshot is not None
+
+    if snapshot is None:
+        snapshot = _rank_candidates(
+            query, rate_min, rate_max, tags, industry_tags or [], seed, key,
+            cursor + limit + 1, db, app_state, deadline=start + latency_budget,
         )
-    )
-    # AND logic: expert must have ALL selected tags — uses indexed ExpertTag join table (PERF-02)
-    # Phase 69.2: match both AI skill tags and admin-assigned manual tags
-    for tag in tags:
-        stmt = stmt.where(
-            exists().where(
-                ExpertTag.expert_id == Expert.id,
-                ExpertTag.tag == tag.lower(),
-                ExpertTag.tag_type.in_(["skill", "manual"]),
+        if snapshot is None:
+            return ExploreResponse(
+                experts=[],
+                total=0,
+                cursor=None,
+                took_ms=int((time.time() - start) * 1000),
+                max_rate=0.0,
             )
-        )
+        # Degraded rankings stay pageable by id but are not reused for new searches
+        put_snapshot(snapshot, reusable=not snapshot.degraded)
 
-    # Industry tag AND logic: expert must have ALL selected industry tags
-    for itag in (industry_tags or []):
-        stmt = stmt.where(
-            exists().where(
-                ExpertTag.expert_id == Expert.id,
-                ExpertTag.tag == itag,
-                ExpertTag.tag_type == "industry",
-            )
-        )
+    response = _render_page(snapshot, cursor, limit, db)
+    took_ms = int((time.time() - start) * 1000)
 
-    filtered_experts: list[Expert] = list(db.scalars(stmt).all())
+    log.info(
+        "explore.pipeline_complete",
+        query_len=len(query),
+        total=response.total,
+        returned=len(response.experts),
+        snapshot_hit=snapshot_hit,
+        degraded=response.degraded,
+        took_ms=took_ms,
+    )
+    return response.model_copy(update={"took_ms": took_ms})
 
-    if not filtered_experts:
-        return ExploreResponse(
-            experts=[],
-            total=0,
-            cursor=None,
-            took_ms=int((time.time() - start) * 1000),
-            max_rate=0.0,
+
+def stream_explore(
+    query: str,
+    rate_min: float,
+    rate_max: float,
+    tags: list[str],
+    limit: int,
+    db: Session,
+    app_state,
+    industry_tags: list[str] | None = None,
+) -> Iterator[tuple[str, ExploreResponse]]:
+    """
+    Progressive first page for GET /api/explore/stream: yields (phase, response) pairs.
+
+    "keyword" — only for a text query whose embedding is not cached yet: Stage 1 +
+                BM25 + findability, ranked without waiting for the vector (the
+                embedding is started in the background by the same call). The
+                snapshot is pageable by id but never reused for new searches.
+    "final"   — the regular run_explore() first page, with STREAM_LATENCY_BUDGET_S
+                for the vector stage. Always yielded, last.
+    """
+    industry_tags = industry_tags or []
+    key = _snapshot_key(query, rate_min, rate_max, tags, industry_tags, None)
+
+    if query.strip() and find_snapshot(key) is None:
+        start = time.time()
+        snapshot = _rank_candidates(
+            query, rate_min, rate_max, tags, industry_tags, None, key,
+            limit + 1, db, app_state, deadline=start,  # zero budget: vector only if already cached
         )
+        if snapshot is not None:
+            if snapshot.degraded:
+                put_snapshot(snapshot, reusable=False)
+                page = _render_page(snapshot, 0, limit, db)
+                yield "keyword", page.model_copy(update={"took_ms": int((time.time() - start) * 1000)})
+            else:
+                put_snapshot(snapshot)  # embedding was cached — this is already the final ranking
+
+    yield "final", run_explore(
+        query=query,
+        rate_min=rate_min,
+        rate_max=rate_max,
+        tags=tags,
+        industry_tags=industry_tags,
+        limit=limit,
+        cursor=0,
+        db=db,
+        app_state=app_state,
+        latency_budget=STREAM_LATENCY_BUDGET_S,
+    )
 
-    # Compute max_rate once from the full pre-filtered set (all stages, before pagination)
-    actual_max_rate = max((e.hourly_rate for e in filtered_experts), default=0.0)
 
-    is_text_query = bool(query.strip())
+def _rank_candidates(
+    query: str,
+    rate_min: float,
+    rate_max: float,
+    tags: list[str],
+    industry_tags: list[str],
+    seed: int | None,
+    key: str,
+    window: int,
+    db: Session,
+    app_state,
+    deadline: float | None = None,
+) -> RankingSnapshot | None:
+    """
+    Run Stages 1–3 + fusion and return the ranking as a snapshot (None when nothing passes Stage 1).
+
+    Text mode ranks only the first `window` candidates up front; _ranked_prefix()
+    extends the ranked prefix when a later page needs more. `deadline` (time.time())
+    bounds the wait for the query embedding; without one the wait gets
+    LATENCY_BUDGET_S. When the embedding misses that budget the vector stage is
+    skipped and the snapshot is marked degraded.
+    """
+    start = time.time()
 
-    # --- Pre-fetch feedback once per request (PERF-03) ---
-    # Moved from inside the scoring loop to the top — single DB read per explore request.
-    feedback_rows = []
-    if is_text_query:
-        try:
-            feedback_rows = db.scalars(
-                select(Feedback).where(Feedback.vote.in_(["up", "down"]))
-            ).all()
-        except Exception as exc:
-            log.warning("explore.feedback_prefetch_failed", error=str(exc))
-
-    if is_text_query:
-        # --- Stage 2: FAISS search + post-filter to pre-filtered experts ---
-        username_to_pos: dict[str, int] = app_state.username_to_faiss_pos
-        faiss_index = app_state.faiss_index
-
-        allowed_usernames = {
-            e.username for e in filtered_experts
-            if e.username in username_to_pos
-        }
-
-        faiss_scores: dict[str, float] = {}
-        if allowed_usernames:
-            query_vec = np.array(embed_query(query), dtype=np.float32).reshape(1, -1)
-            k = min(faiss_index.ntotal, max(50, len(allowed_usernames)))
-            scores, indices = faiss_index.search(query_vec, k)
-            for score, pos in zip(scores[0], indices[0]):
-                if pos < 0:
-                    continue
-                username = app_state.metadata[pos].get("Username", "")
-                if username and username in allowed_usernames:
-                    faiss_scores[username] = float(score)
+    # --- Stage 1: vectorized pre-filter over the catalog snapshot (always runs) ---
+    catalog = get_catalog(app_state, db)
+    mask = (
+        catalog.is_active
+        & (catalog.hourly_rate >= rate_min)
+        & (catalog.hourly_rate <= rate_max)
+    )
+    # AND logic: expert must have ALL selected tags — bitwise intersection over the
+    # catalog's bitmap tag index. Phase 69.2: skill tags match AI skill + manual tags.
+    if tags or industry_tags:
+        mask &= catalog.tag_index.match_all(tags, industry_tags)
+
+    filtered_rows = np.flatnonzero(mask)
+    if filtered_rows.size == 0:
+        return None
+
+    # Compute max_rate once from the full pre-filtered set (all stages, before pagination)
+    actual_max_rate = float(catalog.hourly_rate[filtered_rows].max())
+
+    faiss_strategy: str | None = None  # "direct" | "batch" | "bitmap" | "coarse" — logged for tuning
+    degraded = False
+
+    if query.strip():
+        # --- Stage 2: filter-aware FAISS search over the pre-filtered subset ---
+        # The search snapshot the catalog's positions refer to — not app_state's live one
+        search_snapshot = catalog.search_snapshot
+        faiss_index = search_snapshot.faiss_index
+
+        # Score arrays aligned with filtered_rows (sorted, so searchsorted maps row → slot)
+        n_filtered = filtered_rows.size
+        faiss_scores = np.zeros(n_filtered, dtype=np.float64)
+        bm25_scores = np.zeros(n_filtered, dtype=np.float64)
+
+        allowed_pos = catalog.faiss_pos[filtered_rows]
+        allowed_pos = allowed_pos[(allowed_pos >= 0) & (allowed_pos < faiss_index.ntotal)]
+        if allowed_pos.size:
+            budget = (deadline - time.time()) if deadline is not None else LATENCY_BUDGET_S
+            vec = embed_query_within(query, budget)
+            if vec is None:
+                # Embedding slow or provider down — rank by BM25 + findability only
+                degraded = True
+            else:
+                query_vec = np.array(vec, dtype=np.float32).reshape(1, -1)
+                exact_vectors = search_snapshot.faiss_vectors
+                coarse = coarse_index_for(faiss_index, exact_vectors)
+                if coarse is not None:
+                    positions, scores, faiss_strategy = coarse.search_subset(query_vec, allowed_pos)
+                else:
+                    positions, scores, faiss_strategy = search_subset(faiss_index, query_vec, allowed_pos, exact_vectors)
+                slots = np.searchsorted(filtered_rows, catalog.faiss_row[positions])
+                faiss_scores[slots] = scores
 
         # --- Stage 3: FTS5 BM25 ---
-        filtered_ids = {e.id for e in filtered_experts}
         safe_q = _safe_fts_query(query)
 
-        bm25_scores: dict[int, float] = {}
         if safe_q:
             try:
                 fts_rows = db.execute(
@@ -305,142 +551,169 @@ def run_explore(
                 ).fetchall()
 
                 # Filter to pre-filtered experts only
-                relevant_fts = [
-                    (row.rowid, abs(row.rank))
-                    for row in fts_rows
-                    if row.rowid in filtered_ids
-                ]
-                if relevant_fts:
-                    max_rank = max(v for _, v in relevant_fts) or 1.0
-                    bm25_scores = {rid: v / max_rank for rid, v in relevant_fts}
+                relevant_rows: list[int] = []
+                relevant_ranks: list[float] = []
+                for fts_row in fts_rows:
+                    row = catalog.id_to_row.get(fts_row.rowid)
+                    if row is not None and mask[row]:
+                        relevant_rows.append(row)
+                        relevant_ranks.append(abs(fts_row.rank))
+                if relevant_rows:
+                    ranks = np.array(relevant_ranks, dtype=np.float64)
+                    max_rank = ranks.max() or 1.0
+                    bm25_scores[np.searchsorted(filtered_rows, relevant_rows)] = ranks / max_rank
             except Exception as exc:
                 log.warning("explore.fts5_match_failed", error=str(exc), query=safe_q)
                 # Continue without BM25 scores — FAISS results still valid
 
-        # --- Score fusion + findability boost ---
-        scored: list[tuple[float, float, float, Expert]] = []  # (final, faiss, bm25, expert)
-        for expert in filtered_experts:
-            fs = faiss_scores.get(expert.username, 0.0)
-            bs = bm25_scores.get(expert.id, 0.0)
-            if fs == 0.0 and bs == 0.0:
-                continue  # no signal in either index — exclude from hybrid results
-            fused = (fs * FAISS_WEIGHT) + (bs * BM25_WEIGHT)
-            final = _apply_findability_boost(fused, expert.findability_score)
-            scored.append((final, fs, bs, expert))
-
-        # --- Feedback boost (using pre-fetched feedback_rows — PERF-03) ---
-        # Mirrors the formula in search_intelligence._apply_feedback_boost().
-        # Uses feedback_rows pre-fetched at the top of run_explore() instead of re-querying.
-        # Graceful degradation: any error logs a warning and returns scored unchanged.
+        # --- Score fusion + findability boost (vectorized over the filtered pool) ---
+        # No signal in either index — exclude from hybrid results
+        has_signal = (faiss_scores != 0.0) | (bm25_scores != 0.0)
+        scored_rows = filtered_rows[has_signal]
+        faiss_scores = faiss_scores[has_signal]
+        bm25_scores = bm25_scores[has_signal]
+        findability = catalog.findability_score[scored_rows]
+
+        fused = (faiss_scores * FAISS_WEIGHT) + (bm25_scores * BM25_WEIGHT)
+        final_scores = _apply_findability_boost(fused, findability)
+
+        # --- Feedback boost (materialized expert_feedback_stats counters) ---
+        # Same cold-start guard and formula as search_intelligence._apply_feedback_boost()
+        # via feedback_stats.feedback_multipliers(); reads only URLs past the guard.
+        # Graceful degradation: any error logs a warning and leaves final_scores unchanged.
         try:
-            url_set = {
-                e.profile_url_utm or e.profile_url
-                for _, _, _, e in scored
-                if e.profile_url_utm or e.profile_url
-            }
-            if url_set and feedback_rows:
-                counts: dict[str, dict[str, int]] = {u: {"up": 0, "down": 0} for u in url_set}
-                for row in feedback_rows:
-                    expert_ids = json.loads(row.expert_ids or "[]")
-                    for eid in expert_ids:
-                        if eid in url_set:
-                            counts[eid][row.vote] = counts[eid].get(row.vote, 0) + 1
-
-                FEEDBACK_BOOST_CAP = 0.20
-                boost_factor = FEEDBACK_BOOST_CAP * 2  # 0.40 — mirrors search_intelligence formula
-
-                multipliers: dict[str, float] = {}
-                for url in url_set:
-                    up = counts[url]["up"]
-                    down = counts[url]["down"]
-                    total_votes = up + down
-                    if total_votes < 10:
-                        continue  # cold-start guard — skip sparse feedback
-                    ratio = up / total_votes
-                    if ratio > 0.5:
-                        multipliers[url] = 1.0 + (ratio - 0.5) * boost_factor
-                    elif ratio < 0.5:
-                        multipliers[url] = 1.0 - (0.5 - ratio) * boost_factor
-
+            if scored_rows.size:
+                multipliers = feedback_multipliers(db, FEEDBACK_BOOST_CAP)
                 if multipliers:
-                    scored = [
-                        (
-                            final_s * multipliers.get(
-                                e.profile_url_utm or e.profile_url, 1.0
-                            ),
-                            faiss_s,
-                            bm25_s,
-                            e,
-                        )
-                        for final_s, faiss_s, bm25_s, e in scored
-                    ]
+                    # Catalog-wide multiplier vector — URLs without a boost stay at 1.0
+                    row_multipliers = np.ones(len(catalog), dtype=np.float64)
+                    for url, multiplier in multipliers.items():
+                        rows = catalog.url_to_rows.get(url)
+                        if rows:
+                            row_multipliers[rows] = multiplier
+                    final_scores = final_scores * row_multipliers[scored_rows]
         except Exception as exc:
             log.warning("explore.feedback_boost_failed", error=str(exc))
-            # scored unchanged — degrade gracefully, never raise
-
-        scored.sort(key=lambda x: (_tier_key(x[3].findability_score), -x[0]))
+            # final_scores unchanged — degrade gracefully, never raise
 
         # total = semantically-matched experts (those with FAISS or BM25 signal)
         # This is what the user sees as the result count — reflects actual search quality,
         # not the raw pre-filter pool which can be the full DB when no rate/tag filters are set.
-        total = len(scored)
-
-        # --- Pagination ---
-        page = scored[cursor: cursor + limit + 1]
-        has_more = len(page) > limit
-        page = page[:limit]
-        next_cursor: Optional[int] = cursor + limit if has_more else None
-
-        cards = [
-            _build_card(expert, faiss_s, bm25_s, final_s, query)
-            for final_s, faiss_s, bm25_s, expert in page
-        ]
+        tiers = _tier_keys(findability)
+        snapshot = RankingSnapshot(
+            key=key,
+            catalog=catalog,
+            query=query,
+            rows=scored_rows,
+            total=int(scored_rows.size),
+            max_rate=actual_max_rate,
+            ranked=_rank_window(tiers, final_scores, window),
+            final_scores=final_scores,
+            faiss_scores=faiss_scores,
+            bm25_scores=bm25_scores,
+            tiers=tiers,
+            degraded=degraded,
+        )
 
     else:
         # --- Pure filter mode: sort by findability_score DESC, or weighted-random if seed given ---
+        findability = np.nan_to_num(catalog.findability_score[filtered_rows], nan=0.0)
         if seed is not None and seed > 0:
             # Weighted-random shuffle: higher findability experts tend to appear near the top
             # but with variety. Spread factor of 30 shuffles within similar tiers without
             # pushing low-findability experts to the very top.
             rng = random.Random(seed)
             SPREAD_FACTOR = 30
-            sorted_experts = sorted(
-                filtered_experts,
-                key=lambda e: -(e.findability_score or 0.0) + rng.random() * SPREAD_FACTOR,
-            )
+            jitter = np.array([rng.random() for _ in range(filtered_rows.size)]) * SPREAD_FACTOR
+            order = np.argsort(-findability + jitter, kind="stable")
         else:
-            # Backward-compatible: deterministic findability DESC sort
-            sorted_experts = sorted(
-                filtered_experts,
-                key=lambda e: (e.findability_score or 0.0),
-                reverse=True,
-            )
+            # Backward-compatible: deterministic findability DESC sort (stable for ties)
+            order = np.argsort(-findability, kind="stable")
 
         # In pure filter mode, total = all experts that pass rate/tag filters
-        total = len(filtered_experts)
-
-        page_experts = sorted_experts[cursor: cursor + limit + 1]
-        has_more = len(page_experts) > limit
-        page_experts = page_experts[:limit]
-        next_cursor = cursor + limit if has_more else None
-
-        cards = [
-            _build_card(e, None, None, e.findability_score or 0.0, "")
-            for e in page_experts
-        ]
+        snapshot = RankingSnapshot(
+            key=key,
+            catalog=catalog,
+            query=query,
+            rows=filtered_rows,
+            total=int(filtered_rows.size),
+            max_rate=actual_max_rate,
+            ranked=order,
+        )
 
     log.info(
-        "explore.pipeline_complete",
-        query_len=len(query),
-        total=total,
-        returned=len(cards),
+        "explore.snapshot_built",
+        snapshot=snapshot.id,
+        total=snapshot.total,
+        faiss_strategy=faiss_strategy,
+        degraded=snapshot.degraded,
         took_ms=int((time.time() - start) * 1000),
     )
+    return snapshot
+
+
+def _ranked_prefix(snapshot: RankingSnapshot, stop: int) -> np.ndarray:
+    """Return the snapshot's ranked candidate indices, extended to cover [0, stop) if needed."""
+    needed = min(stop, snapshot.rows.size)
+    if snapshot.ranked.size >= needed:
+        return snapshot.ranked
+    with snapshot.lock:
+        if snapshot.ranked.size < needed:
+            # Grow geometrically so a long scroll re-ranks O(log pages) times
+            window = max(stop, snapshot.ranked.size * 2)
+            snapshot.ranked = _rank_window(snapshot.tiers, snapshot.final_scores, window)
+        return snapshot.ranked
+
+
+def _render_page(snapshot: RankingSnapshot, cursor: int, limit: int, db: Session) -> ExploreResponse:
+    """Slice one page out of a ranking snapshot and build its cards."""
+    prefetched = snapshot.pages.pop((cursor, limit), None)
+    if prefetched is not None:
+        return prefetched
+
+    catalog = snapshot.catalog
+    page = _ranked_prefix(snapshot, cursor + limit + 1)[cursor: cursor + limit + 1]
+    has_more = page.size > limit
+    page = page[:limit]
+    next_cursor: Optional[int] = cursor + limit if has_more else None
+
+    fragments = _load_page_fragments(db, [int(catalog.ids[snapshot.rows[i]]) for i in page])
+
+    cards = []
+    for i in page:
+        fragment = fragments.get(int(catalog.ids[snapshot.rows[i]]))
+        if fragment is None:
+            continue  # expert deleted since the snapshot was ranked
+        if snapshot.final_scores is not None:
+            cards.append(_card_from_fragment(
+                fragment,
+                float(snapshot.faiss_scores[i]),
+                float(snapshot.bm25_scores[i]),
+                float(snapshot.final_scores[i]),
+                snapshot.query,
+            ))
+        else:
+            findability = fragment.fields["findability_score"]
+            cards.append(_card_from_fragment(fragment, None, None, findability or 0.0, ""))
 
     return ExploreResponse(
         experts=cards,
-        total=total,
+        total=snapshot.total,
         cursor=next_cursor,
-        took_ms=int((time.time() - start) * 1000),
-        max_rate=actual_max_rate,
+        took_ms=0,
+        max_rate=snapshot.max_rate,
+        snapshot=snapshot.id,
+        degraded=snapshot.degraded,
     )
+
+
+def prefetch_page(snapshot_id: str, cursor: int, limit: int, db: Session) -> None:
+    """
+    Pre-build one page of a snapshot so the next infinite-scroll request is a dict pop.
+
+    Called in the background by the explore router after serving the previous page.
+    """
+    snapshot = get_snapshot(snapshot_id)
+    if snapshot is None or (cursor, limit) in snapshot.pages:
+        return
+    snapshot.pages[(cursor, limit)] = _render_page(snapshot, cursor, limit, db)
@@ -0,0 +1,139 @@
+"""
+Materialized per-expert feedback counters and the shared feedback boost formula.
+
+Both ranking paths (explorer.run_explore and search_intelligence._apply_feedback_boost)
+used to load every up/down Feedback row and json.loads each expert_ids blob on every
+text query — O(total feedback) per search. The expert_feedback_stats table keeps the
+per-URL up/down counts instead:
+
+  - record_vote()             — increments counters in the caller's transaction
+                                (POST /api/feedback), so counts commit with the vote row
+  - rebuild_feedback_stats()  — full recompute from the feedback table; runs at startup
+                                and via POST /api/admin/feedback-stats/rebuild
+  - feedback_multipliers()    — score multipliers for URLs past the cold-start guard,
+                                optionally restricted to a candidate URL set
+
+The cold-start guard and boost formula live here only (SEARCH-05).
+"""
+import json
+from collections import Counter
+
+import structlog
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.models import ExpertFeedbackStats, Feedback
+
+log = structlog.get_logger()
+
+# Experts with fewer total votes than this receive no boost (SEARCH-05)
+COLD_START_MIN_VOTES = 10
+
+
+def feedback_multiplier(up: int, down: int, feedback_boost_cap: float) -> float:
+    """
+    Score multiplier from cumulative thumbs up/down counts.
+
+        ratio = up / (up + down)
+        boost_factor = feedback_boost_cap * 2   # ratio range 0.0-1.0, cap range 0.0-0.50
+        if ratio > 0.5: multiplier = 1.0 + (ratio - 0.5) * boost_factor  (max 1 + cap)
+        if ratio < 0.5: multiplier = 1.0 - (0.5 - ratio) * boost_factor  (min 1 - cap)
+        otherwise (ratio == 0.5 or below the cold-start guard): 1.0
+    """
+    total = up + down
+    if total < COLD_START_MIN_VOTES:
+        return 1.0  # cold-start guard — sparse feedback is noise
+    boost_factor = feedback_boost_cap * 2
+    ratio = up / total
+    if ratio > 0.5:
+        return 1.0 + (ratio - 0.5) * boost_factor
+    if ratio < 0.5:
+        return 1.0 - (0.5 - ratio) * boost_factor
+    return 1.0
+
+
+def feedback_multipliers(
+    db: Session,
+    feedback_boost_cap: float,
+    urls: set[str] | None = None,
+) -> dict[str, float]:
+    """
+    Return {profile_url: multiplier} for URLs whose multiplier differs from 1.0.
+
+    Only rows past the cold-start guard are read. Pass urls to restrict the lookup
+    to a candidate set; omit it to get every eligible URL (bounded by expert count).
+    """
+    stmt = select(ExpertFeedbackStats.profile_url, ExpertFeedbackStats.up, ExpertFeedbackStats.down).where(
+        ExpertFeedbackStats.up + ExpertFeedbackStats.down >= COLD_START_MIN_VOTES
+    )
+    if urls is not None:
+        if not urls:
+            return {}
+        stmt = stmt.where(ExpertFeedbackStats.profile_url.in_(urls))
+
+    multipliers: dict[str, float] = {}
+    for row in db.execute(stmt):
+        multiplier = feedback_multiplier(row.up, row.down, feedback_boost_cap)
+        if multiplier != 1.0:
+            multipliers[row.profile_url] = multiplier
+    return multipliers
+
+
+def _count_urls(expert_ids: list) -> Counter:
+    """Count URL occurrences in one vote's expert_ids list."""
+    return Counter(eid for eid in expert_ids if isinstance(eid, str) and eid)
+
+
+def record_vote(db: Session, vote: str, expert_ids: list[str]) -> None:
+    """
+    Increment the counters for every URL in one vote.
+
+    Does NOT commit — call in the same transaction as the Feedback insert.
+    """
+    if vote not in ("up", "down"):
+        return
+    for url, n in _count_urls(expert_ids).items():
+        stmt = insert(ExpertFeedbackStats).values(
+            profile_url=url,
+            up=n if vote == "up" else 0,
+            down=n if vote == "down" else 0,
+        )
+        column = getattr(ExpertFeedbackStats, vote)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[ExpertFeedbackStats.profile_url],
+            set_={vote: column + n, "updated_at": stmt.excluded.updated_at},
+        ))
+
+
+def rebuild_feedback_stats(db: Session) -> int:
+    """
+    Recompute expert_feedback_stats from the full feedback table.
+
+    Idempotent: deletes all rows, re-inserts aggregated counts.
+    Called at startup and from the admin rebuild endpoint. Commits the transaction.
+    Returns the number of URLs with counters.
+    """
+    up: Counter = Counter()
+    down: Counter = Counter()
+    rows = db.execute(
+        select(Feedback.vote, Feedback.expert_ids).where(Feedback.vote.in_(["up", "down"]))
+    )
+    for row in rows:
+        try:
+            expert_ids = json.loads(row.expert_ids or "[]")
+        except (json.JSONDecodeError, TypeError):
+            continue  # Skip malformed JSON
+        if isinstance(expert_ids, list):
+            (up if row.vote == "up" else down).update(_count_urls(expert_ids))
+
+    db.execute(delete(ExpertFeedbackStats))
+    urls = up.keys() | down.keys()
+    if urls:
+        db.bulk_save_objects([
+            ExpertFeedbackStats(profile_url=url, up=up[url], down=down[url])
+            for url in urls
+        ])
+    db.commit()
+    log.info("feedback_stats.rebuilt", urls=len(urls))
+    return len(urls)
@@ -0,0 +1,336 @@
+"""
+Hedged calls and deadline-aware retries for tail-latency-sensitive API calls.
+
+  LatencyTracker  — rolling window of recent call latencies; p95() drives the
+                    hedge delay, snapshot() feeds GET /api/admin/health.
+  hedged_call     — run fn on a worker pool; if it has not returned after
+                    `hedge_after` seconds, fire one duplicate and return whichever
+                    succeeds first. Never waits past the deadline.
+  retry_until     — retry with jittered exponential backoff, but only while the
+                    backoff plus a typical call still fits in the remaining budget.
+  ahedged_call / aretry_until
+                  — the same policies for coroutines (client.aio): backoff uses
+                    asyncio.sleep and losing or timed-out attempts are cancelled.
+  CircuitBreaker  — stop calling a failing provider for a cool-down period so
+                    callers can fall back immediately instead of waiting on it.
+
+Deadlines are time.monotonic() timestamps. A thread-pool call still running when
+its caller gives up cannot be cancelled — the worker finishes it in the background —
+so callers must also bound the underlying client (e.g. an HTTP timeout). The async
+variants cancel their tasks instead.
+"""
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+import structlog
+
+log = structlog.get_logger()
+
+
+class LatencyTracker:
+    """Rolling latency window plus hedge / retry / timeout counters."""
+
+    def __init__(self, window: int = 500, min_samples: int = 20) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._min_samples = min_samples
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.retries = 0
+        self.timeouts = 0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def incr(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def quantile(self, q: float) -> float | None:
+        """Latency quantile in seconds, or None until min_samples calls were recorded."""
+        with self._lock:
+            if len(self._samples) < self._min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def p95(self) -> float | None:
+        return self.quantile(0.95)
+
+    def snapshot(self) -> dict:
+        def _ms(q: float) -> float | None:
+            value = self.quantile(q)
+            return round(value * 1000, 1) if value is not None else None
+
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": round(self.hedges / self.calls, 4) if self.calls else 0.0,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "p50_ms": _ms(0.50),
+            "p95_ms": _ms(0.95),
+            "p99_ms": _ms(0.99),
+        }
+
+
+def hedged_call(
+    fn: Callable[[], Any],
+    pool: ThreadPoolExecutor,
+    tracker: LatencyTracker,
+    hedge_after: float,
+    deadline: float,
+) -> Any:
+    """
+    Run fn, hedging with one duplicate call after hedge_after seconds.
+
+    Returns the first successful result. Raises the last error if every attempt
+    failed, or TimeoutError when the deadline passes first.
+    """
+
+    def _timed() -> Any:
+        t0 = time.monotonic()
+        tracker.incr("calls")
+        try:
+            result = fn()
+        except Exception:
+            tracker.incr("errors")
+            raise
+        tracker.record(time.monotonic() - t0)
+        return result
+
+    primary = pool.submit(_timed)
+    pending: set[Future] = {primary}
+    hedged = False
+    error: BaseException | None = None
+
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        timeout = remaining if hedged else min(remaining, hedge_after)
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                if future is not primary:
+                    tracker.incr("hedge_wins")
+                return future.result()
+            error = future.exception()
+        if not hedged and not done:
+            # Primary is slower than the hedge budget — race a duplicate against it
+            hedged = True
+            tracker.incr("hedges")
+            pending.add(pool.submit(_timed))
+
+    if error is not None and not pending:
+        raise error
+    tracker.incr("timeouts")
+    raise TimeoutError("hedged call exceeded its deadline")
+
+
+def retry_until(
+    fn: Callable[[], Any],
+    deadline: float,
+    tracker: LatencyTracker,
+    max_attempts: int,
+    base_delay: float,
+    max_delay: float,
+) -> Any:
+    """
+    Call fn, retrying failures with jittered exponential backoff while the deadline allows.
+
+    A retry is only attempted if the backoff plus the tracker's median call latency
+    still fits in the remaining budget; otherwise the last error is raised at once.
+    TimeoutError (the budget is already spent) is never retried.
+    """
+    attempt = 1
+    while True:
+        try:
+            return fn()
+        except TimeoutError:
+            raise
+        except Exception as exc:
+            delay = min(max_delay, base_delay * 2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+            typical = tracker.quantile(0.50) or 0.0
+            if attempt >= max_attempts or time.monotonic() + delay + typical >= deadline:
+                raise
+            tracker.incr("retries")
+            log.warning("hedging.retry", attempt=attempt, delay_s=round(delay, 3), error=str(exc))
+            time.sleep(delay)
+            attempt += 1
+
+
+async def ahedged_call(
+    fn: Callable[[], Awaitable[Any]],
+    tracker: LatencyTracker,
+    hedge_after: float,
+    deadline: float,
+) -> Any:
+    """
+    Async hedged_call(): await fn(), racing one duplicate after hedge_after seconds.
+
+    The losing attempt — and every attempt still running at the deadline or when the
+    caller is cancelled — is cancelled.
+    """
+
+    async def _timed() -> Any:
+        t0 = time.monotonic()
+        tracker.incr("calls")
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            tracker.incr("errors")
+            raise
+        tracker.record(time.monotonic() - t0)
+        return result
+
+    primary = asyncio.ensure_future(_timed())
+    pending: set[asyncio.Future] = {primary}
+    hedged = False
+    error: BaseException | None = None
+
+    try:
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            timeout = remaining if hedged else min(remaining, hedge_after)
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is not primary:
+                        tracker.incr("hedge_wins")
+                    return future.result()
+                error = future.exception()
+            if not hedged and not done:
+                hedged = True
+                tracker.incr("hedges")
+                pending.add(asyncio.ensure_future(_timed()))
+    finally:
+        for future in pending:
+            future.cancel()
+
+    if error is not None and not pending:
+        raise error
+    tracker.incr("timeouts")
+    raise TimeoutError("hedged call exceeded its deadline")
+
+
+async def aretry_until(
+    fn: Callable[[], Awaitable[Any]],
+    deadline: float,
+    tracker: LatencyTracker,
+    max_attempts: int,
+    base_delay: float,
+    max_delay: float,
+) -> Any:
+    """Async retry_until(): same budget rule, backoff via asyncio.sleep."""
+    attempt = 1
+    while True:
+        try:
+            return await fn()
+        except TimeoutError:
+            raise
+        except Exception as exc:
+            delay = min(max_delay, base_delay * 2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+            typical = tracker.quantile(0.50) or 0.0
+            if attempt >= max_attempts or time.monotonic() + delay + typical >= deadline:
+                raise
+            tracker.incr("retries")
+            log.warning("hedging.retry", attempt=attempt, delay_s=round(delay, 3), error=str(exc))
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed    — calls allowed; `failure_threshold` consecutive failures open it.
+    open      — calls rejected for `reset_after` seconds.
+    half_open — after the cool-down one probe call is allowed; its success closes
+                the breaker, its failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_after: float, name: str = "breaker") -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self._name = name
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self.opened = 0  # times the breaker tripped
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.reset_after:
+            return "open"
+        return "half_open"
+
+    def is_open(self) -> bool:
+        """True while calls would be rejected (open, or half-open with a probe in flight)."""
+        with self._lock:
+            state = self._state()
+            return state == "open" or (state == "half_open" and self._probing)
+
+    def allow(self) -> bool:
+        """Whether a call may proceed now; in half-open state only one probe is let through."""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                log.info("hedging.breaker_closed", breaker=self._name)
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or (self._opened_at is None and self._failures >= self.failure_threshold):
+                self._opened_at = time.monotonic()
+                self._probing = False
+                self.opened += 1
+                log.warning("hedging.breaker_opened", breaker=self._name, failures=self._failures)
+
+    def release_probe(self) -> None:
+        """
+        Give back a half-open probe that ended without a verdict (e.g. the caller was
+        cancelled), so the next call can probe. Every path that got allow() == True
+        must end in record_success(), record_failure() or this — otherwise the
+        breaker stays half-open and rejects every call.
+        """
+        with self._lock:
+            self._probing = False
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"state": self._state(), "failures": self._failures, "opened": self.opened}
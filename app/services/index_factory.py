@@ -0,0 +1,136 @@
+"""
+Configurable FAISS index builds for the search snapshot.
+
+faiss.index is always the exact IndexFlatIP. The snapshot that the server maps
+(app/services/index_snapshot.py) can instead hold one of these index types,
+selected with INDEX_TYPE or `scripts/ingest.py --index-type`:
+
+  flat  — IndexFlatIP, exact. The baseline; right for the current catalog size.
+  hnsw  — HNSW graph over full vectors: fast, high recall, ~+m·8 bytes/vector.
+  ivf   — IVF-Flat: k-means coarse quantizer, scans nprobe of nlist lists.
+  sq8   — scalar quantizer, 8 bits/dim (4x smaller than flat), exhaustive scan.
+  fp16  — scalar quantizer, float16 (2x smaller than flat), exhaustive scan.
+  pq    — product quantizer, d/8 sub-vectors x nbits: ~32x smaller, lowest recall.
+
+build_index() returns the index plus an info dict (type, factory string, build and
+search params) that write_snapshot() records in the manifest. Search-time params
+(efSearch, nprobe) are re-applied on load with apply_search_params(), so a mapped
+index searches exactly as it was benchmarked. scripts/bench_index.py measures
+recall@k against flat and p50/p99 latency for each type.
+"""
+import math
+
+import faiss
+import numpy as np
+
+INDEX_TYPES = ("flat", "hnsw", "ivf", "sq8", "fp16", "pq")
+
+# Defaults — overridable per build via build_index(**params)
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 128
+IVF_NPROBE = 16
+PQ_NBITS = 8
+
+# k-means wants ~39 training points per centroid; larger samples only slow training
+TRAIN_POINTS_PER_CENTROID = 39
+TRAIN_SAMPLE_MAX = 100_000
+
+# Search-time parameters, settable on a loaded index through faiss.ParameterSpace
+_SEARCH_PARAMS = ("efSearch", "nprobe")
+
+
+def _ivf_nlist(n: int) -> int:
+    """About 4·sqrt(n) lists, but never more than the data can train."""
+    return max(1, min(int(4 * math.sqrt(n)), n // TRAIN_POINTS_PER_CENTROID))
+
+
+def _pq_nbits(n: int) -> int:
+    """8-bit codebooks when there is enough data to train 256 centroids, else fewer (min 4)."""
+    return max(4, min(PQ_NBITS, int(math.log2(max(n // TRAIN_POINTS_PER_CENTROID, 1)))))
+
+
+def _factory_spec(index_type: str, d: int, n: int, params: dict) -> tuple[str, dict]:
+    """FAISS factory string plus the build/search params it was resolved with."""
+    if index_type == "flat":
+        return "Flat", {}
+    if index_type == "hnsw":
+        resolved = {
+            "m": params.get("m", HNSW_M),
+            "efConstruction": params.get("efConstruction", HNSW_EF_CONSTRUCTION),
+            "efSearch": params.get("efSearch", HNSW_EF_SEARCH),
+        }
+        return f"HNSW{resolved['m']},Flat", resolved
+    if index_type == "ivf":
+        nlist = params.get("nlist") or _ivf_nlist(n)
+        return f"IVF{nlist},Flat", {"nlist": nlist, "nprobe": min(params.get("nprobe", IVF_NPROBE), nlist)}
+    if index_type == "sq8":
+        return "SQ8", {}
+    if index_type == "fp16":
+        return "SQfp16", {}
+    if index_type == "pq":
+        m = params.get("m", d // 8)
+        if d % m:
+            raise ValueError(f"pq: dimension {d} is not divisible by m={m}")
+        nbits = params.get("nbits") or _pq_nbits(n)
+        return f"PQ{m}x{nbits}", {"m": m, "nbits": nbits}
+    raise ValueError(f"unknown index type {index_type!r}; expected one of {', '.join(INDEX_TYPES)}")
+
+
+def build_index(matrix: np.ndarray, index_type: str = "flat", seed: int = 1234, **params):
+    """
+    Build an inner-product index of the given type over L2-normalized vectors.
+
+    Args:
+        matrix:     (n, d) float32, already L2-normalized.
+        index_type: One of INDEX_TYPES.
+        seed:       Seed for the training-sample draw (builds are reproducible).
+        **params:   Overrides for the defaults above (m, efConstruction, efSearch,
+                    nlist, nprobe, nbits).
+
+    Returns:
+        (index, info) — info = {"type", "factory", "params"} for the snapshot manifest.
+    """
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    n, d = matrix.shape
+    factory, resolved = _factory_spec(index_type, d, n, params)
+    index = faiss.index_factory(d, factory, faiss.METRIC_INNER_PRODUCT)
+
+    if "efConstruction" in resolved:
+        index.hnsw.efConstruction = resolved["efConstruction"]
+    if not index.is_trained:
+        sample = matrix
+        if n > TRAIN_SAMPLE_MAX:
+            rows = np.random.default_rng(seed).choice(n, TRAIN_SAMPLE_MAX, replace=False)
+            sample = matrix[np.sort(rows)]
+        index.train(sample)
+    index.add(matrix)
+
+    info = {"type": index_type, "factory": factory, "params": resolved}
+    apply_search_params(index, info)
+    return index, info
+
+
+def apply_search_params(index, info: dict | None) -> None:
+    """Set the recorded search-time params (efSearch / nprobe) on a loaded index."""
+    if not info:
+        return
+    space = faiss.ParameterSpace()
+    for name in _SEARCH_PARAMS:
+        if name in info.get("params", {}):
+            space.set_index_parameter(index, name, info["params"][name])
+
+
+def describe_index(index) -> str:
+    """Short index-type label for a loaded index (admin health)."""
+    if isinstance(index, faiss.IndexFlat):
+        return "flat"
+    if isinstance(index, faiss.IndexHNSW):
+        return "hnsw"
+    if isinstance(index, faiss.IndexIVF):
+        return "ivf"
+    if isinstance(index, faiss.IndexScalarQuantizer):
+        return "fp16" if index.sq.qtype == faiss.ScalarQuantizer.QT_fp16 else "sq8"
+    if isinstance(index, faiss.IndexPQ):
+        return "pq"
+    return type(index).__name__
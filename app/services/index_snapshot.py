@@ -0,0 +1,290 @@
+"""
+Read-only search snapshot: memory-mapped FAISS index + columnar expert metadata.
+
+scripts/ingest.py writes a new numbered generation under SNAPSHOT_DIR alongside
+faiss.index / metadata.json, then points CURRENT at it:
+
+  SNAPSHOT_DIR/
+    CURRENT                 — name of the live generation, replaced atomically
+    gen-000007/
+      index.faiss           — the search index (INDEX_TYPE, app/services/index_factory.py),
+                              read with IO_FLAG_MMAP
+      vectors.npy           — exact float32 vectors, only for non-flat index types
+      manifest.json         — generation, row count, column names, index build info
+      metadata_offsets.npy  — int64 (n_columns, rows + 1) byte offsets into the heap
+      metadata_heap.npy     — uint8 heap of JSON-encoded cells, column-major
+
+Generation directories are written complete and never modified; the newest
+SNAPSHOT_KEEP are kept so set_current_generation() can roll CURRENT back to one.
+The server maps a generation read-only (np.load(mmap_mode="r")), so N uvicorn
+workers share one copy in the page cache instead of N private copies, and startup
+no longer parses every bio. ColumnarMetadata is a lazy Sequence[dict]: rows are
+decoded on access — search paths only touch the top-k hits — and whole columns can
+be read without materializing rows; retriever.records_for() decodes only the short
+display columns and sizes the bio cells from their offsets.
+
+current_generation_dir() resolves CURRENT once; loading every piece from that one
+directory keeps index and metadata from different generations apart
+(app/services/search_snapshot.py bundles them). It returns None — callers fall back
+to faiss.index / metadata.json — when there is no snapshot or CURRENT is older than
+those files (e.g. a pulled index without a fresh ingest). A regular in-memory read
+is used when this FAISS build cannot mmap the index type.
+
+faiss.index itself always stays an exact IndexFlatIP; only the snapshot carries an
+approximate index. Consumers that need exact scores for an arbitrary subset
+(vector_search.search_subset) read them from load_vectors() in that case.
+"""
+import json
+import os
+import re
+import shutil
+from collections.abc import Sequence
+from pathlib import Path
+
+import faiss
+import numpy as np
+import structlog
+
+from app.config import FAISS_INDEX_PATH, INDEX_TYPE, METADATA_PATH, SNAPSHOT_DIR
+from app.services.index_factory import apply_search_params, build_index
+
+log = structlog.get_logger()
+
+# Generations kept on disk (the current one included) — rollback targets
+SNAPSHOT_KEEP = int(os.getenv("SNAPSHOT_KEEP", "3"))
+
+SNAPSHOT_CURRENT = "CURRENT"
+SNAPSHOT_INDEX = "index.faiss"
+SNAPSHOT_VECTORS = "vectors.npy"
+SNAPSHOT_MANIFEST = "manifest.json"
+SNAPSHOT_OFFSETS = "metadata_offsets.npy"
+SNAPSHOT_HEAP = "metadata_heap.npy"
+
+
+# ── Writing (scripts/ingest.py) ──────────────────────────────────────────────
+
+def generation_name(generation: int) -> str:
+    return f"gen-{generation:06d}"
+
+
+_GENERATION_DIR = re.compile(r"^gen-(\d+)$")
+
+
+def list_generations(root: Path = SNAPSHOT_DIR) -> list[int]:
+    """Complete generations on disk (a manifest exists), oldest first."""
+    if not root.is_dir():
+        return []
+    found = []
+    for path in root.iterdir():
+        match = _GENERATION_DIR.match(path.name)
+        if match and (path / SNAPSHOT_MANIFEST).exists():
+            found.append(int(match.group(1)))
+    return sorted(found)
+
+
+def _set_current(root: Path, generation: int) -> None:
+    """Point CURRENT at a generation — write a temp file, then one atomic rename."""
+    tmp = root / f".{SNAPSHOT_CURRENT}.tmp"
+    tmp.write_text(generation_name(generation), encoding="utf-8")
+    os.replace(tmp, root / SNAPSHOT_CURRENT)
+
+
+def _prune(root: Path, keep: int) -> None:
+    """Delete all but the newest `keep` generations, never the current one."""
+    current = read_current_generation(root)
+    for generation in list_generations(root)[:-keep]:
+        if generation != current:
+            shutil.rmtree(root / generation_name(generation), ignore_errors=True)
+
+
+def write_snapshot(
+    index,
+    metadata: list[dict],
+    root: Path = SNAPSHOT_DIR,
+    index_type: str = INDEX_TYPE,
+) -> dict:
+    """
+    Write index + columnar metadata as a new generation, then make it current.
+
+    index is the exact flat index from ingest; for any other index_type the snapshot
+    index is built from its vectors, which are also saved as vectors.npy. Workers
+    that still map an older generation keep reading it until they reload — pruned
+    files stay readable while mapped. Returns the manifest.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    generation = max(list_generations(root), default=0) + 1
+    staging = root / f".staging-{generation_name(generation)}"
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir()
+
+    if index_type == "flat":
+        info = {"type": "flat", "factory": "Flat", "params": {}}
+    else:
+        vectors = index.reconstruct_n(0, index.ntotal)
+        index, info = build_index(vectors, index_type)
+        np.save(staging / SNAPSHOT_VECTORS, vectors)
+    faiss.write_index(index, str(staging / SNAPSHOT_INDEX))
+
+    columns: list[str] = list(dict.fromkeys(key for row in metadata for key in row))
+    offsets = np.zeros((len(columns), len(metadata) + 1), dtype=np.int64)
+    heap = bytearray()
+    for c, column in enumerate(columns):
+        offsets[c, 0] = len(heap)
+        for i, row in enumerate(metadata):
+            if column in row:  # an absent key stays an empty cell
+                heap += json.dumps(row[column], ensure_ascii=False, default=str).encode()
+            offsets[c, i + 1] = len(heap)
+    np.save(staging / SNAPSHOT_OFFSETS, offsets)
+    np.save(staging / SNAPSHOT_HEAP, np.frombuffer(bytes(heap), dtype=np.uint8))
+    # Manifest last: a generation directory without one is incomplete and ignored
+    manifest = {"generation": generation, "rows": len(metadata), "columns": columns, "index": info}
+    (staging / SNAPSHOT_MANIFEST).write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+
+    staging.rename(root / generation_name(generation))
+    _set_current(root, generation)  # CURRENT last: its mtime marks the snapshot as fresh
+    _prune(root, SNAPSHOT_KEEP)
+    return manifest
+
+
+def set_current_generation(generation: int, root: Path = SNAPSHOT_DIR) -> None:
+    """Roll CURRENT to an existing generation (admin rollback); ValueError if it is gone."""
+    if generation not in list_generations(root):
+        raise ValueError(f"snapshot generation {generation} does not exist")
+    _set_current(root, generation)
+
+
+# ── Reading (server) ─────────────────────────────────────────────────────────
+
+def read_manifest(directory: Path) -> dict:
+    """A generation's manifest.json."""
+    return json.loads((directory / SNAPSHOT_MANIFEST).read_text(encoding="utf-8"))
+
+
+class ColumnarMetadata(Sequence):
+    """Lazy, read-only Sequence[dict] over a memory-mapped columnar metadata snapshot."""
+
+    def __init__(self, directory: Path) -> None:
+        manifest = read_manifest(directory)
+        self.columns: list[str] = manifest["columns"]
+        self._rows: int = manifest["rows"]
+        self._offsets = np.load(directory / SNAPSHOT_OFFSETS, mmap_mode="r")
+        self._heap = np.load(directory / SNAPSHOT_HEAP, mmap_mode="r")
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._rows))]
+        if i < 0:
+            i += self._rows
+        if not 0 <= i < self._rows:
+            raise IndexError("metadata row out of range")
+        row: dict = {}
+        for c, column in enumerate(self.columns):
+            start, end = self._offsets[c, i], self._offsets[c, i + 1]
+            if end > start:
+                row[column] = json.loads(self._heap[start:end].tobytes())
+        return row
+
+    def column(self, name: str) -> list:
+        """Every row's value for one column (None where absent) — no row dicts built."""
+        if name not in self.columns:
+            return [None] * self._rows
+        c = self.columns.index(name)
+        bounds = self._offsets[c]
+        return [
+            json.loads(self._heap[bounds[i]:bounds[i + 1]].tobytes()) if bounds[i + 1] > bounds[i] else None
+            for i in range(self._rows)
+        ]
+
+    def cell(self, name: str, i: int):
+        """One row's value for one column (None where absent)."""
+        c = self.columns.index(name)
+        start, end = self._offsets[c, i], self._offsets[c, i + 1]
+        return json.loads(self._heap[start:end].tobytes()) if end > start else None
+
+    def cell_sizes(self, name: str) -> np.ndarray:
+        """Encoded byte size of every row's cell in one column (0 where absent) — nothing decoded."""
+        if name not in self.columns:
+            return np.zeros(self._rows, dtype=np.int64)
+        return np.diff(self._offsets[self.columns.index(name)])
+
+
+def read_current_generation(root: Path = SNAPSHOT_DIR) -> int | None:
+    """The generation CURRENT points at, or None when there is no pointer."""
+    try:
+        match = _GENERATION_DIR.match((root / SNAPSHOT_CURRENT).read_text(encoding="utf-8").strip())
+    except FileNotFoundError:
+        return None
+    return int(match.group(1)) if match else None
+
+
+def current_generation_dir(root: Path = SNAPSHOT_DIR) -> tuple[int, Path] | None:
+    """
+    (generation, directory) of the live snapshot, or None to use faiss.index / metadata.json.
+
+    None when there is no complete current generation, or when CURRENT is older
+    than faiss.index / metadata.json.
+    """
+    generation = read_current_generation(root)
+    if generation is None:
+        if root.exists():
+            log.warning("index_snapshot.no_current", path=str(root))
+        return None
+    directory = root / generation_name(generation)
+    if not (directory / SNAPSHOT_MANIFEST).exists():
+        log.warning("index_snapshot.missing_generation", path=str(directory))
+        return None
+    pointed = (root / SNAPSHOT_CURRENT).stat().st_mtime
+    sources = [p for p in (FAISS_INDEX_PATH, METADATA_PATH) if p.exists()]
+    if any(p.stat().st_mtime > pointed for p in sources):
+        log.warning("index_snapshot.stale", path=str(directory))
+        return None
+    return generation, directory
+
+
+def load_faiss_index(directory: Path | None):
+    """A generation's search index, memory-mapped when possible; faiss.index when directory is None."""
+    if directory is None:
+        return faiss.read_index(str(FAISS_INDEX_PATH))
+    path = directory / SNAPSHOT_INDEX
+    info = read_manifest(directory).get("index")
+    try:
+        index = faiss.read_index(str(path), faiss.IO_FLAG_MMAP)
+        log.info(
+            "index_snapshot.index_mapped",
+            path=str(path),
+            vectors=index.ntotal,
+            index_type=(info or {}).get("type", "flat"),
+        )
+    except RuntimeError as exc:
+        log.warning("index_snapshot.mmap_unsupported", error=str(exc))
+        index = faiss.read_index(str(path))
+    apply_search_params(index, info)
+    return index
+
+
+def load_vectors(directory: Path | None) -> np.ndarray | None:
+    """Exact (ntotal, d) vectors, memory-mapped, when a generation's index is not flat; else None."""
+    if directory is not None and (directory / SNAPSHOT_VECTORS).exists():
+        return np.load(directory / SNAPSHOT_VECTORS, mmap_mode="r")
+    return None
+
+
+def load_metadata(directory: Path | None) -> Sequence[dict]:
+    """Position-aligned expert metadata: a generation's ColumnarMetadata, else metadata.json."""
+    if directory is not None:
+        return ColumnarMetadata(directory)
+    with open(METADATA_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def username_positions(metadata: Sequence[dict]) -> dict[str, int]:
+    """Username → FAISS position, reading only the username columns when possible."""
+    if isinstance(metadata, ColumnarMetadata):
+        usernames = [a or b for a, b in zip(metadata.column("Username"), metadata.column("username"))]
+    else:
+        usernames = [row.get("Username") or row.get("username") for row in metadata]
+    return {name: pos for pos, name in enumerate(usernames) if name}
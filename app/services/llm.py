@@ -8,18 +8,32 @@ Key design decisions (from CONTEXT.md):
 - "Why them" style: 1-2 sentences, query-specific, grounded in title/company/domain
 - Low-confidence path: BOTH score threshold AND LLM judgment — score check runs first (fast)
 - Retry: up to 3 attempts with exponential backoff on Gemini API failure
+- agenerate_response(): same contract on client.aio (asyncio.sleep backoff);
+  generate_response() stays for synchronous callers
+- astream_response(): the chat endpoint's streaming variant — narrative and why_them
+  text are yielded as Gemini writes them (generate_content_stream + partial JSON
+  parsing), experts only once their name passes the candidate check
 - History: last N messages as context (sliding window, configurable via HISTORY_WINDOW)
+- Output cache: raw generations are cached (app/services/llm_cache.py) under a hash of
+  the normalized query, the candidate lines and the trimmed history window — repeated
+  onboarding queries skip Gemini entirely
 """
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import time
-from dataclasses import dataclass, field
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, field
+from typing import Any
 
 import structlog
 from google import genai
 from google.genai import types
 
+from app.services.llm_cache import LLMOutputCache, llm_cache_key, normalize_prompt_text
+from app.services.partial_json import parse_partial_json
 from app.services.retriever import RetrievedExpert, SIMILARITY_THRESHOLD
 
 log = structlog.get_logger()
@@ -33,6 +47,12 @@ RETRY_BASE_DELAY = 1.0  # seconds; doubles each retry (1s, 2s, 4s)
 # Configurable: set HISTORY_WINDOW=0 to disable multi-turn context.
 HISTORY_WINDOW = 3
 
+# Generation output cache — a hit skips the Gemini call and only re-runs validation
+GENERATION_CACHE_TTL = float(os.getenv("GENERATION_CACHE_TTL", "3600"))
+GENERATION_CACHE_MAX_ENTRIES = int(os.getenv("GENERATION_CACHE_MAX_ENTRIES", "2000"))
+
+_generation_cache = LLMOutputCache("generation", GENERATION_CACHE_MAX_ENTRIES, GENERATION_CACHE_TTL)
+
 
 @dataclass
 class Expert:
@@ -62,6 +82,22 @@ def _get_client() -> genai.Client:
     return _client
 
 
+def _history_turns(history: list[dict]) -> list[dict]:
+    return history[-HISTORY_WINDOW * 2:]  # Each turn = 2 entries (user + assistant)
+
+
+def _candidate_line(c: RetrievedExpert) -> str:
+    role = c.title or ""
+    at_company = f" at {c.company}" if c.company else ""
+    role_part = f"{role}{at_company}" if role else (c.company or "Independent")
+    bio = str(c.raw.get("Bio") or "").strip()
+    bio_part = f" | Bio: {bio[:400]}" if bio else ""
+    return (
+        f"- {c.name} | {role_part} | Rate: {c.hourly_rate} | "
+        f"URL: {c.profile_url or 'N/A'} | Similarity: {c.score:.3f}{bio_part}"
+    )
+
+
 def _build_prompt(
     query: str,
     candidates: list[RetrievedExpert],
@@ -71,24 +107,13 @@ def _build_prompt(
     """Build the Gemini prompt from query, candidates, and conversation history."""
     history_text = ""
     if history:
-        turns = history[-HISTORY_WINDOW * 2:]  # Each turn = 2 entries (user + assistant)
+        turns = _history_turns(history)
         history_text = "\n".join(
             f"{'User' if m['role'] == 'user' else 'Assistant'}: {m['content']}"
             for m in turns
         )
         history_text = f"\n\nConversation history (most recent {HISTORY_WINDOW} turns):\n{history_text}"
 
-    def _candidate_line(c: "RetrievedExpert") -> str:
-        role = c.title or ""
-        at_company = f" at {c.company}" if c.company else ""
-        role_part = f"{role}{at_company}" if role else (c.company or "Independent")
-        bio = str(c.raw.get("Bio") or "").strip()
-        bio_part = f" | Bio: {bio[:400]}" if bio else ""
-        return (
-            f"- {c.name} | {role_part} | Rate: {c.hourly_rate} | "
-            f"URL: {c.profile_url or 'N/A'} | Similarity: {c.score:.3f}{bio_part}"
-        )
-
     candidates_text = "\n".join(_candidate_line(c) for c in candidates)
 
     allowed_names = "\n".join(f"  - {c.name}" for c in candidates) if candidates else "  (none)"
@@ -136,6 +161,102 @@ Each expert object: {{"name": str, "title": str, "company": str, "hourly_rate":
 "why_them": 1-2 sentences referencing their specific role/domain and why they fit this query. Use only data shown above."""
 
 
+def _generation_config() -> types.GenerateContentConfig:
+    return types.GenerateContentConfig(
+        response_mime_type="application/json",
+        temperature=0.3,  # Low temperature for consistent structured output
+    )
+
+
+def _candidate_lookup(candidates: list[RetrievedExpert]) -> dict[str, RetrievedExpert]:
+    # Lookup by normalized name to validate LLM output against candidates
+    return {c.name.strip().lower(): c for c in candidates}
+
+
+def _validated_expert(e: dict, candidate_lookup: dict[str, RetrievedExpert]) -> Expert | None:
+    """The candidate an LLM expert object names, or None if the name is not a candidate."""
+    canonical = candidate_lookup.get(str(e.get("name", "")).strip().lower())
+    if canonical is None:
+        return None
+    # Use candidate's own fields for name/title/company/rate/url to prevent drift
+    return Expert(
+        name=canonical.name,
+        title=canonical.title or e.get("title", ""),
+        company=canonical.company or e.get("company", ""),
+        hourly_rate=canonical.hourly_rate,
+        profile_url=canonical.profile_url,
+        why_them=e.get("why_them", ""),
+    )
+
+
+def _parse_response(raw_json: str, candidates: list[RetrievedExpert], attempt: int) -> ChatResponse:
+    """Parse Gemini's JSON output and validate every expert against the candidate list."""
+    data = json.loads(raw_json)
+
+    response_type = data.get("type", "match")
+    narrative = data.get("narrative", "")
+    experts_raw = data.get("experts", [])
+
+    candidate_lookup = _candidate_lookup(candidates)
+
+    experts: list[Expert] = []
+    for e in experts_raw:
+        expert = _validated_expert(e, candidate_lookup)
+        if expert is None:
+            # LLM hallucinated a name not in candidates — drop it
+            log.warning(
+                "llm.hallucinated_expert",
+                name=str(e.get("name", "")).strip(),
+                allowed=[c.name for c in candidates],
+            )
+            continue
+        experts.append(expert)
+
+    log.info(
+        "llm.generate_response",
+        type=response_type,
+        expert_count=len(experts),
+        hallucinated=len(experts_raw) - len(experts),
+        attempt=attempt + 1,
+    )
+    return ChatResponse(type=response_type, narrative=narrative, experts=experts)
+
+
+def _is_low_confidence(candidates: list[RetrievedExpert]) -> bool:
+    # Score-based low-confidence check (fast path — runs before calling LLM)
+    return not candidates or all(c.score < SIMILARITY_THRESHOLD for c in candidates)
+
+
+def _prompt_for(query: str, candidates: list[RetrievedExpert], history: list[dict]) -> str:
+    return _build_prompt(query, candidates, history, _is_low_confidence(candidates))
+
+
+def _generation_key(query: str, candidates: list[RetrievedExpert], history: list[dict]) -> str:
+    """Cache key: model, normalized query, candidate lines as prompted, trimmed history window."""
+    return llm_cache_key(
+        GENERATION_MODEL,
+        normalize_prompt_text(query),
+        [_candidate_line(c) for c in candidates],
+        [(m["role"], m["content"]) for m in _history_turns(history)],
+        _is_low_confidence(candidates),
+    )
+
+
+def generation_cache_stats() -> dict:
+    """Hit/miss/eviction counters of the chat generation cache."""
+    return _generation_cache.stats()
+
+
+def _log_retry(attempt: int, delay: float, exc: Exception) -> None:
+    log.warning(
+        "llm.generate_response.retry",
+        attempt=attempt + 1,
+        max_retries=MAX_RETRIES,
+        delay=delay,
+        error=str(exc),
+    )
+
+
 def generate_response(
     query: str,
     candidates: list[RetrievedExpert],
@@ -156,13 +277,13 @@ def generate_response(
     Raises:
         RuntimeError: If all retries are exhausted and Gemini still fails.
     """
-    # Score-based low-confidence check (fast path — runs before calling LLM)
-    is_low_confidence = (
-        not candidates
-        or all(c.score < SIMILARITY_THRESHOLD for c in candidates)
-    )
+    cache_key = _generation_key(query, candidates, history)
+    cached = _generation_cache.get(cache_key)
+    if cached is not None:
+        log.info("llm.generation_cache_hit")
+        return _parse_response(cached, candidates, 0)
 
-    prompt = _build_prompt(query, candidates, history, is_low_confidence)
+    prompt = _prompt_for(query, candidates, history)
 
     last_error: Exception | None = None
     for attempt in range(MAX_RETRIES):
@@ -170,66 +291,196 @@ def generate_response(
             response = _get_client().models.generate_content(
                 model=GENERATION_MODEL,
                 contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    temperature=0.3,  # Low temperature for consistent structured output
-                ),
+                config=_generation_config(),
             )
-            raw_json = response.text
-            data = json.loads(raw_json)
-
-            response_type = data.get("type", "match")
-            narrative = data.get("narrative", "")
-            experts_raw = data.get("experts", [])
-
-            # Build lookup by normalized name to validate LLM output against candidates
-            candidate_lookup = {
-                c.name.strip().lower(): c for c in candidates
-            }
-
-            experts: list[Expert] = []
-            for e in experts_raw:
-                llm_name = str(e.get("name", "")).strip()
-                canonical = candidate_lookup.get(llm_name.lower())
-                if canonical is None:
-                    # LLM hallucinated a name not in candidates — drop it
-                    log.warning(
-                        "llm.hallucinated_expert",
-                        name=llm_name,
-                        allowed=[c.name for c in candidates],
-                    )
-                    continue
-                # Use candidate's own fields for name/title/company/rate/url to prevent drift
-                experts.append(Expert(
-                    name=canonical.name,
-                    title=canonical.title or e.get("title", ""),
-                    company=canonical.company or e.get("company", ""),
-                    hourly_rate=canonical.hourly_rate,
-                    profile_url=canonical.profile_url,
-                    why_them=e.get("why_them", ""),
-                ))
-
-            log.info(
-                "llm.generate_response",
-                type=response_type,
-                expert_count=len(experts),
-                hallucinated=len(experts_raw) - len(experts),
-                attempt=attempt + 1,
+            result = _parse_response(response.text, candidates, attempt)
+            _generation_cache.set(cache_key, response.text)
+            return result
+
+        except Exception as exc:
+            last_error = exc
+            delay = RETRY_BASE_DELAY * (2 ** attempt)
+            _log_retry(attempt, delay, exc)
+            if attempt < MAX_RETRIES - 1:
+                time.sleep(delay)
+
+    raise RuntimeError(
+        f"Gemini generation failed after {MAX_RETRIES} attempts: {last_error}"
+    )
+
+
+async def agenerate_response(
+    query: str,
+    candidates: list[RetrievedExpert],
+    history: list[dict],
+) -> ChatResponse:
+    """
+    Async generate_response() on client.aio (non-streaming; the chat endpoint uses astream_response()).
+
+    Same prompt, validation and retry schedule, but the call is awaited on the event
+    loop and backoff uses asyncio.sleep, so no worker thread is held; cancelling the
+    caller (client disconnect, timeout) cancels the in-flight request. Shares the
+    generation cache with generate_response().
+    """
+    cache_key = _generation_key(query, candidates, history)
+    cached = await _generation_cache.aget(cache_key)
+    if cached is not None:
+        log.info("llm.generation_cache_hit")
+        return _parse_response(cached, candidates, 0)
+
+    prompt = _prompt_for(query, candidates, history)
+
+    last_error: Exception | None = None
+    for attempt in range(MAX_RETRIES):
+        try:
+            response = await _get_client().aio.models.generate_content(
+                model=GENERATION_MODEL,
+                contents=prompt,
+                config=_generation_config(),
             )
-            return ChatResponse(type=response_type, narrative=narrative, experts=experts)
+            result = _parse_response(response.text, candidates, attempt)
+            await _generation_cache.aset(cache_key, response.text)
+            return result
 
         except Exception as exc:
             last_error = exc
             delay = RETRY_BASE_DELAY * (2 ** attempt)
-            log.warning(
-                "llm.generate_response.retry",
-                attempt=attempt + 1,
-                max_retries=MAX_RETRIES,
-                delay=delay,
-                error=str(exc),
+            _log_retry(attempt, delay, exc)
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(delay)
+
+    raise RuntimeError(
+        f"Gemini generation failed after {MAX_RETRIES} attempts: {last_error}"
+    )
+
+
+# ── Streaming generation ─────────────────────────────────────────────────────
+
+class _StreamParser:
+    """
+    Turn a growing JSON-mode response into incremental chat events.
+
+    feed() re-parses the accumulated text (app/services/partial_json.py) and returns
+    the events it newly allows:
+        ("narrative", {"delta": str})
+        ("expert",    {"index": int, "expert": {...}})   — name validated against candidates
+        ("why_them",  {"index": int, "delta": str})
+    An expert is only announced once its name is complete (a later key exists or the
+    object is closed), so partial names never reach the hallucination guard. Indexes
+    count validated experts only, matching the final result's experts list.
+    """
+
+    def __init__(self, candidates: list[RetrievedExpert]) -> None:
+        self.text = ""
+        self._lookup = _candidate_lookup(candidates)
+        self._narrative = ""
+        self._resolved: dict[int, int | None] = {}  # raw array index → validated index
+        self._why_them: dict[int, str] = {}
+
+    def feed(self, chunk: str) -> list[tuple[str, dict]]:
+        self.text += chunk
+        data = parse_partial_json(self.text)
+        if not isinstance(data, dict):
+            return []
+        events: list[tuple[str, dict]] = []
+
+        narrative = data.get("narrative")
+        delta = _text_delta(self._narrative, narrative)
+        if delta:
+            self._narrative = narrative
+            events.append(("narrative", {"delta": delta}))
+
+        experts_raw = data.get("experts")
+        if not isinstance(experts_raw, list):
+            return events
+        for i, item in enumerate(experts_raw):
+            if not isinstance(item, dict):
+                continue
+            if i not in self._resolved:
+                keys = list(item)
+                name_complete = "name" in item and (keys[-1] != "name" or i < len(experts_raw) - 1)
+                if not name_complete:
+                    break
+                expert = _validated_expert(item, self._lookup)
+                if expert is None:
+                    self._resolved[i] = None  # hallucinated — dropped (logged by _parse_response)
+                    continue
+                index = len(self._why_them)
+                self._resolved[i] = index
+                self._why_them[index] = ""
+                payload = asdict(expert)
+                payload["why_them"] = ""
+                events.append(("expert", {"index": index, "expert": payload}))
+            index = self._resolved[i]
+            if index is None:
+                continue
+            why_them = item.get("why_them")
+            delta = _text_delta(self._why_them[index], why_them)
+            if delta:
+                self._why_them[index] = why_them
+                events.append(("why_them", {"index": index, "delta": delta}))
+        return events
+
+
+def _text_delta(sent: str, current) -> str:
+    """The new suffix of current, or "" if it is not a longer extension of sent."""
+    if not isinstance(current, str) or len(current) <= len(sent) or not current.startswith(sent):
+        return ""
+    return current[len(sent):]
+
+
+async def astream_response(
+    query: str,
+    candidates: list[RetrievedExpert],
+    history: list[dict],
+) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Streaming agenerate_response(): yields _StreamParser events while Gemini writes
+    its JSON (generate_content_stream), then ("result", ChatResponse) — the full
+    response parsed and validated exactly as agenerate_response() would.
+
+    Same prompt, generation cache and retry schedule. If an attempt fails after
+    events were already yielded, ("reset", {}) is yielded before the retry so the
+    client can discard the partial text.
+    """
+    cache_key = _generation_key(query, candidates, history)
+    cached = await _generation_cache.aget(cache_key)
+    if cached is not None:
+        log.info("llm.generation_cache_hit")
+        for event in _StreamParser(candidates).feed(cached):
+            yield event
+        yield "result", _parse_response(cached, candidates, 0)
+        return
+
+    prompt = _prompt_for(query, candidates, history)
+
+    last_error: Exception | None = None
+    for attempt in range(MAX_RETRIES):
+        parser = _StreamParser(candidates)
+        emitted = False
+        try:
+            stream = await _get_client().aio.models.generate_content_stream(
+                model=GENERATION_MODEL,
+                contents=prompt,
+                config=_generation_config(),
             )
+            async for chunk in stream:
+                for event in parser.feed(chunk.text or ""):
+                    emitted = True
+                    yield event
+            result = _parse_response(parser.text, candidates, attempt)
+            await _generation_cache.aset(cache_key, parser.text)
+            yield "result", result
+            return
+
+        except Exception as exc:
+            last_error = exc
+            delay = RETRY_BASE_DELAY * (2 ** attempt)
+            _log_retry(attempt, delay, exc)
+            if emitted:
+                yield "reset", {}
             if attempt < MAX_RETRIES - 1:
-                time.sleep(delay)
+                await asyncio.sleep(delay)
 
     raise RuntimeError(
         f"Gemini generation failed after {MAX_RETRIES} attempts: {last_error}"
@@ -0,0 +1,178 @@
+"""
+Cache for Gemini text outputs — HyDE bios (search_intelligence.py) and chat
+generations (llm.py).
+
+Identical chat queries used to regenerate both from scratch, each taking
+seconds. Outputs are keyed by a hash of everything that shapes the prompt
+(llm_cache_key()), so a hit returns what the same call would have been sent.
+
+  L1   — in-process LRUCache (app/services/lru_cache.py): entry cap + TTL.
+  disk — optional (LLM_CACHE_PERSIST=true): a host-local SQLite file
+         (LLM_CACHE_PATH) so outputs survive restarts and are shared by the
+         workers on the host. Disk hits are promoted to L1.
+
+Only successful outputs are stored. Any SQLite error is logged and treated as a
+miss — the cache never fails a chat request. stats() feeds GET /api/admin/health.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import structlog
+
+from app.config import LLM_CACHE_PATH
+from app.services.blocking import run_blocking
+from app.services.lru_cache import LRUCache
+
+log = structlog.get_logger()
+
+LLM_CACHE_PERSIST = os.getenv("LLM_CACHE_PERSIST", "false").lower() == "true"
+
+_PRUNE_EVERY = 100  # delete expired rows every N disk writes
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    namespace  TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    value      TEXT NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+"""
+
+
+def normalize_prompt_text(text: str) -> str:
+    """Collapse whitespace and lowercase — the query part of a cache key."""
+    return " ".join(text.split()).lower()
+
+
+def llm_cache_key(*parts) -> str:
+    """Stable hex digest of JSON-serializable key parts (model, normalized query, ...)."""
+    payload = json.dumps(parts, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class _DiskStore:
+    """SQLite table of (namespace, key) → text with absolute expiry."""
+
+    def __init__(self, path: str) -> None:
+        self._conn = sqlite3.connect(path, timeout=1.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def get(self, namespace: str, key: str) -> tuple[str, float] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE namespace = ? AND key = ? AND expires_at > ?",
+                (namespace, key, time.time()),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set(self, namespace: str, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (namespace, key, expires_at, value) VALUES (?, ?, ?, ?)",
+                (namespace, key, time.time() + ttl, value),
+            )
+            self._writes += 1
+            if self._writes % _PRUNE_EVERY == 0:
+                self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (time.time(),))
+
+
+_disk: _DiskStore | None = None
+_disk_failed = False
+_disk_lock = threading.Lock()
+
+
+def _get_disk() -> _DiskStore | None:
+    """Process-wide disk store, opened on first use; None when disabled or unavailable."""
+    global _disk, _disk_failed
+    if not LLM_CACHE_PERSIST or _disk_failed:
+        return None
+    if _disk is None:
+        with _disk_lock:
+            if _disk is None and not _disk_failed:
+                try:
+                    _disk = _DiskStore(str(LLM_CACHE_PATH))
+                except sqlite3.Error as exc:
+                    _disk_failed = True
+                    log.warning("llm_cache.open_failed", path=str(LLM_CACHE_PATH), error=str(exc))
+    return _disk
+
+
+class LLMOutputCache:
+    """Text outputs of one kind of LLM call: L1 LRU + optional shared disk tier."""
+
+    def __init__(self, namespace: str, max_entries: int, ttl: float) -> None:
+        self.namespace = namespace
+        self.ttl = ttl
+        self._l1 = LRUCache(max_entries=max_entries, ttl=ttl)
+        self._stats_lock = threading.Lock()
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self.disk_errors = 0
+
+    def get(self, key: str) -> str | None:
+        """Cached output for key, or None. Blocking when the disk tier is enabled."""
+        value = self._l1.get(key)
+        if value is not None:
+            return value
+        disk = _get_disk()
+        if disk is None:
+            return None
+        try:
+            row = disk.get(self.namespace, key)
+        except sqlite3.Error as exc:
+            self._incr("disk_errors")
+            log.warning("llm_cache.disk_get_failed", namespace=self.namespace, error=str(exc))
+            return None
+        if row is None:
+            self._incr("disk_misses")
+            return None
+        self._incr("disk_hits")
+        value, expires_at = row
+        self._l1.set(key, value, ttl=max(0.0, expires_at - time.time()))  # keep the disk expiry
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store an output in L1 and, when enabled, on disk. Blocking when the disk tier is enabled."""
+        self._l1.set(key, value)
+        disk = _get_disk()
+        if disk is None:
+            return
+        try:
+            disk.set(self.namespace, key, value, self.ttl)
+        except sqlite3.Error as exc:
+            self._incr("disk_errors")
+            log.warning("llm_cache.disk_set_failed", namespace=self.namespace, error=str(exc))
+
+    async def aget(self, key: str) -> str | None:
+        """get() for async callers — inline when L1-only, on the blocking pool with the disk tier."""
+        if _get_disk() is None:
+            return self._l1.get(key)
+        return await run_blocking(self.get, key)
+
+    async def aset(self, key: str, value: str) -> None:
+        if _get_disk() is None:
+            self._l1.set(key, value)
+            return
+        await run_blocking(self.set, key, value)
+
+    def _incr(self, counter: str) -> None:
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> dict:
+        """L1 counters plus disk-tier counters, for the admin health endpoint."""
+        stats = self._l1.stats()
+        stats["persist"] = LLM_CACHE_PERSIST
+        stats["disk_hits"] = self.disk_hits
+        stats["disk_misses"] = self.disk_misses
+        stats["disk_errors"] = self.disk_errors
+        return stats
@@ -0,0 +1,109 @@
+"""
+Micro-batching dispatcher for blocking batch APIs.
+
+Callers submit one item at a time and block for its result. A daemon collector
+thread waits for the first item, keeps collecting for `window` seconds (or
+until `max_batch` items are queued), then hands the whole batch to `batch_fn`
+on a small worker pool and fans the results back to the waiting callers. The
+collector goes straight back to collecting, so several batches can be in
+flight while the next window fills.
+
+Used by embedder.py: concurrent query embeddings from the explorer, the
+retriever and the HyDE blend share one embed_content call per window instead
+of one HTTP request each.
+
+An exception raised by batch_fn is re-raised in every caller of that batch.
+"""
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import structlog
+
+log = structlog.get_logger()
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-item calls into batched calls of batch_fn."""
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[Any]], list[Any]],
+        window: float,
+        max_batch: int,
+        max_in_flight: int = 4,
+        name: str = "micro_batch",
+    ) -> None:
+        self._batch_fn = batch_fn
+        self.window = window
+        self.max_batch = max_batch
+        self._name = name
+        self._queue: queue.SimpleQueue[tuple[Any, Future]] = queue.SimpleQueue()
+        self._pool = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix=name)
+        self._collector: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.max_batch_seen = 0
+
+    def submit(self, item: Any, timeout: float | None = None) -> Any:
+        """
+        Queue one item and block until its batch returns; returns this item's result.
+        Raises TimeoutError if the batch has not returned within timeout seconds.
+        """
+        self._ensure_collector()
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future.result(timeout=timeout)
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "max_batch": self.max_batch_seen,
+            "window_ms": self.window * 1000,
+        }
+
+    # ── Internals ────────────────────────────────────────────────────────────
+
+    def _ensure_collector(self) -> None:
+        if self._collector is not None:
+            return
+        with self._start_lock:
+            if self._collector is None:
+                self._collector = threading.Thread(target=self._collect_forever, name=self._name, daemon=True)
+                self._collector.start()
+
+    def _collect_forever(self) -> None:
+        while True:
+            batch = [self._queue.get()]  # block until the first item of the next batch
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._pool.submit(self._dispatch, batch)
+
+    def _dispatch(self, batch: list[tuple[Any, Future]]) -> None:
+        with self._stats_lock:
+            self.batches += 1
+            self.items += len(batch)
+            self.max_batch_seen = max(self.max_batch_seen, len(batch))
+        try:
+            results = self._batch_fn([item for item, _ in batch])
+        except Exception as exc:  # noqa: BLE001 — any failure is forwarded to every waiting future
+            log.warning("micro_batch.batch_failed", batcher=self._name, size=len(batch), error=str(exc))
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results, strict=True):
+            future.set_result(result)
@@ -0,0 +1,61 @@
+"""
+Best-effort parsing of a JSON document that is still being streamed.
+
+parse_partial_json() turns a prefix of a JSON text into the most complete value
+it describes: an open string is closed where it stops, open objects and arrays
+are closed, and a dangling key, separator or unfinished literal is dropped by
+cutting back to the last complete member. Strings only ever grow between calls
+(apart from an escape sequence that is cut until it completes), so a caller can
+diff successive results to emit text deltas.
+
+Used by llm.astream_response() to stream the narrative and why_them text of a
+JSON-mode Gemini response as it arrives.
+"""
+import json
+import re
+from typing import Any
+
+_PARTIAL_UNICODE_ESCAPE = re.compile(r"\\u[0-9a-fA-F]{0,3}$")
+_MAX_CUTBACKS = 4  # fallbacks tried after the direct completion fails
+
+
+def parse_partial_json(text: str) -> Any | None:
+    """Parse a JSON prefix into its most complete value; None if nothing parses yet."""
+    stack: list[str] = []
+    cuts: list[tuple[int, str]] = []  # (prefix end, closers) — prefixes that end on a complete member
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+            cuts.append((i + 1, "".join(reversed(stack))))
+        elif ch in "}]":
+            if stack:
+                stack.pop()
+        elif ch == ",":
+            cuts.append((i, "".join(reversed(stack))))
+
+    head = text
+    if in_string:
+        head = text[:-1] if escaped else _PARTIAL_UNICODE_ESCAPE.sub("", text)
+        head += '"'
+    try:
+        return json.loads(head + "".join(reversed(stack)))
+    except ValueError:
+        pass
+    for end, closers in reversed(cuts[-_MAX_CUTBACKS:]):
+        try:
+            return json.loads(text[:end] + closers)
+        except ValueError:
+            continue
+    return None
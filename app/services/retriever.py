@@ -11,13 +11,17 @@ Key design decisions (from CONTEXT.md):
 """
 from __future__ import annotations
 
+import threading
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import faiss
 import numpy as np
 
+from app.services.coarse_search import coarse_index_for
 from app.services.embedder import embed_query
+from app.services.index_snapshot import ColumnarMetadata
 
 if TYPE_CHECKING:
     pass
@@ -50,71 +54,173 @@ def retrieve(query: str, faiss_index: faiss.IndexFlatIP, metadata: list[dict]) -
 
     Args:
         query: Natural language user query.
-        faiss_index: Loaded FAISS index from app.state.faiss_index.
-        metadata: Position-aligned metadata list from app.state.metadata.
+        faiss_index: FAISS index of one SearchSnapshot (app.state.search_snapshot).
+        metadata: Position-aligned metadata of the same snapshot.
 
     Returns:
         List of RetrievedExpert, sorted by score descending, length 0-TOP_K.
         An empty list means no valid candidates found — triggers clarification response.
     """
     # 1. Embed the query (L2-normalized 768-dim vector)
-    vector = np.array(embed_query(query), dtype=np.float32).reshape(1, -1)
+    return search_vector(embed_query(query), faiss_index, metadata)
 
-    # 2. Search FAISS — retrieve TOP_K nearest neighbors
-    k = min(TOP_K, faiss_index.ntotal)
-    scores, indices = faiss_index.search(vector, k)
-    scores = scores[0].tolist()
-    indices = indices[0].tolist()
 
-    # 3. Build candidate list, skipping incomplete experts
+def search_vector(query_vec: list[float], faiss_index: faiss.IndexFlatIP, metadata: list[dict]) -> list[RetrievedExpert]:
+    """
+    retrieve() for an already-embedded query — FAISS search + candidate filtering only.
+
+    The async chat pipeline embeds with aembed_query() on the event loop and runs just
+    this part on a worker thread.
+    """
+    vector = np.array(query_vec, dtype=np.float32).reshape(1, -1)
+
+    # 2. Search FAISS — retrieve TOP_K nearest neighbors (two-stage when COARSE_SEARCH is on)
+    k = min(TOP_K, faiss_index.ntotal)
+    coarse = coarse_index_for(faiss_index)
+    if coarse is not None:
+        scores, indices = coarse.search(vector, k)
+    else:
+        scores, indices = faiss_index.search(vector, k)
+
+    # 3. Build candidate list from the precompiled records, skipping incomplete experts
+    records = records_for(metadata)
     candidates: list[RetrievedExpert] = []
-    for score, idx in zip(scores, indices):
+    for score, idx in zip(scores[0].tolist(), indices[0].tolist()):
         if idx < 0:  # FAISS returns -1 for unfilled slots when index has fewer than k vectors
             continue
-        row = metadata[idx]
+        record = records[idx]
+        if not record.complete:
+            continue
+        candidates.append(RetrievedExpert(
+            name=record.name,
+            title=record.title,
+            company=record.company,
+            hourly_rate=record.hourly_rate,
+            profile_url=record.profile_url,
+            score=score,
+            raw=metadata[idx],  # decoded on demand from a columnar snapshot
+        ))
+
+    return candidates
+
+
+# ── Precompiled metadata records ─────────────────────────────────────────────
+# metadata.json rows come from CSV imports with inconsistent column spellings, so
+# every display field is resolved through a list of aliases. That resolution runs
+# once per row when a metadata list is first searched (startup / hot-reload call
+# records_for() eagerly), not once per FAISS hit. Records keep only the short
+# display fields; the full row (bio etc.) is read from metadata for the top-k hits.
+# For a columnar snapshot only the display columns are decoded: whether a row has a
+# bio is read from the cell sizes, so compiling never parses the bios.
+
+_NAME_KEYS = ("name", "Name", "expert_name", "Full Name", "full_name")
+_FIRST_NAME_KEYS = ("First Name", "first_name", "first name")
+_LAST_NAME_KEYS = ("Last Name", "last_name", "last name")
+_TITLE_KEYS = ("Job Title", "job_title", "title", "Title", "position", "Role")
+_COMPANY_KEYS = ("company", "Company", "organization", "employer")
+_RATE_KEYS = ("Hourly Rate", "hourly_rate", "hourly rate", "rate", "Rate", "price")
+_BIO_KEYS = ("Bio", "bio", "description", "about", "summary")
+# Pre-tagged UTM URL from CSV; fall back to plain profile URL or Link column
+_URL_KEYS = ("Profile URL with UTM", "profile_url_with_utm", "Link", "profile_url", "url", "URL")
+
 
-        # CONTEXT.md rule: omit experts missing name, title, company, or hourly_rate
-        def _get(row: dict, *keys: str) -> str | None:
+def _usable(value) -> bool:
+    """A metadata value that counts as filled in (not blank, "nan" or "none")."""
+    return bool(value and str(value).strip() and str(value).strip().lower() not in ("nan", "none", ""))
+
+
+class RetrievalRecord:
+    """Display fields of one metadata row, resolved ahead of search time."""
+
+    __slots__ = ("company", "complete", "hourly_rate", "name", "profile_url", "title")
+
+    def __init__(self, row: dict, has_bio: bool | None = None) -> None:
+        # First occurrence wins, matching a scan over the row in key order
+        lowered: dict[str, object] = {}
+        for key, value in row.items():
+            lowered.setdefault(key.lower(), value)
+
+        def _get(*keys: str) -> str | None:
             for k in keys:
-                # Try exact key, then underscore→space, then case-insensitive scan
+                # Try exact key, then underscore→space, then case-insensitive match
                 for candidate in (k, k.replace("_", " ")):
                     v = row.get(candidate)
                     if v is None:
-                        # Case-insensitive fallback
-                        v = next((row[rk] for rk in row if rk.lower() == candidate.lower()), None)
-                    if v and str(v).strip() and str(v).strip().lower() not in ("nan", "none", ""):
+                        v = lowered.get(candidate.lower())
+                    if _usable(v):
                         return str(v).strip()
             return None
 
         # Handle split first/last name fields
-        first = _get(row, "First Name", "first_name", "first name")
-        last = _get(row, "Last Name", "last_name", "last name")
-        if first and last:
-            name = f"{first} {last}"
-        else:
-            name = _get(row, "name", "Name", "expert_name", "Full Name", "full_name")
+        first = _get(*_FIRST_NAME_KEYS)
+        last = _get(*_LAST_NAME_KEYS)
+        self.name = f"{first} {last}" if first and last else _get(*_NAME_KEYS)
+        self.title = _get(*_TITLE_KEYS)
+        self.company = _get(*_COMPANY_KEYS)
+        self.hourly_rate = _get(*_RATE_KEYS)
+        self.profile_url = _get(*_URL_KEYS)
+        # Require name, hourly_rate, and bio — without a bio we can't verify the match
+        if has_bio is None:
+            has_bio = _get(*_BIO_KEYS) is not None
+        self.complete = bool(self.name and self.hourly_rate and has_bio)
 
-        title = _get(row, "Job Title", "job_title", "title", "Title", "position", "Role")
-        company = _get(row, "company", "Company", "organization", "employer")
-        hourly_rate = _get(row, "Hourly Rate", "hourly_rate", "hourly rate", "rate", "Rate", "price")
 
-        bio = _get(row, "Bio", "bio", "description", "about", "summary")
+# Recently compiled (metadata, records) pairs, newest first — swapped as one tuple so
+# readers never pair one list's records with another list. Two slots: the live search
+# snapshot and the previous one, which in-flight requests may still be searching.
+_COMPILED_SLOTS = 2
+_compiled: tuple[tuple[Sequence[dict], list[RetrievalRecord]], ...] = ()
+_compile_lock = threading.Lock()
 
-        # Require name, hourly_rate, and bio — without a bio we can't verify the match
-        if not name or not hourly_rate or not bio:
-            continue
 
-        # Use pre-tagged UTM URL from CSV; fall back to plain profile URL or Link column
-        profile_url = _get(row, "Profile URL with UTM", "profile_url_with_utm", "Link", "profile_url", "url", "URL")
+def records_for(metadata: Sequence[dict]) -> list[RetrievalRecord]:
+    """
+    Position-aligned RetrievalRecords for a metadata list, memoized on its identity.
 
-        candidates.append(RetrievedExpert(
-            name=name,
-            title=title,
-            company=company,
-            hourly_rate=hourly_rate,
-            profile_url=profile_url,
-            score=score,
-            raw=row,
-        ))
+    A SearchSnapshot's metadata (a list or a ColumnarMetadata) is never mutated —
+    a hot-reload installs a new snapshot, and a new object is the signal to compile.
+    """
+    global _compiled
+    for source, records in _compiled:
+        if source is metadata:
+            return records
+    with _compile_lock:
+        for source, records in _compiled:
+            if source is metadata:
+                return records
+        if isinstance(metadata, ColumnarMetadata):
+            records = _columnar_records(metadata)
+        else:
+            records = [RetrievalRecord(row) for row in metadata]
+        _compiled = ((metadata, records), *_compiled[:_COMPILED_SLOTS - 1])
+        return records
+
+
+def _alias_columns(columns: list[str], keys: tuple[str, ...]) -> list[str]:
+    """Columns RetrievalRecord's alias lookup can read for these keys, in column order."""
+    wanted = {candidate.lower() for k in keys for candidate in (k, k.replace("_", " "))}
+    return [column for column in columns if column.lower() in wanted]
+
+
+# A JSON-encoded bio cell this long cannot be blank, "nan" or "none"; shorter cells
+# are decoded and checked like any other value
+_SHORT_CELL_BYTES = 16
+
+
+def _columnar_records(metadata: ColumnarMetadata) -> list[RetrievalRecord]:
+    """records_for() over a columnar snapshot without decoding the bio column."""
+    display_keys = (
+        _NAME_KEYS + _FIRST_NAME_KEYS + _LAST_NAME_KEYS + _TITLE_KEYS + _COMPANY_KEYS + _RATE_KEYS + _URL_KEYS
+    )
+    display = {column: metadata.column(column) for column in _alias_columns(metadata.columns, display_keys)}
+    has_bio = np.zeros(len(metadata), dtype=bool)
+    for column in _alias_columns(metadata.columns, _BIO_KEYS):
+        sizes = metadata.cell_sizes(column)
+        has_bio |= sizes > _SHORT_CELL_BYTES
+        for i in np.flatnonzero((sizes > 0) & (sizes <= _SHORT_CELL_BYTES) & ~has_bio):
+            has_bio[i] = _usable(metadata.cell(column, i))
+    return [
+        RetrievalRecord({c: values[i] for c, values in display.items() if values[i] is not None}, bool(has_bio[i]))
+        for i in range(len(metadata))
+    ]
 
-    return candidates
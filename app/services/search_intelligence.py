@@ -9,18 +9,33 @@ Settings are read via get_settings(db) on every retrieve_with_intelligence() cal
 Settings are cached in-memory for 30 seconds (PERF-04). The POST /api/admin/settings
 endpoint calls invalidate_settings_cache() to force an immediate re-read.
 
-retrieve_with_intelligence() is SYNCHRONOUS. It MUST NOT be async because it
-calls synchronous genai.Client() and embed_query(). Call it from chat.py via
-loop.run_in_executor(None, lambda: retrieve_with_intelligence(...)) — same pattern
-as retriever.retrieve(). The HyDE timeout (asyncio.wait_for) is handled by the
-caller in chat.py; this module does not manage asyncio timeouts.
-
-All 5 settings fall back to env vars (or hardcoded defaults) when no DB row exists.
+retrieve_with_intelligence() is SYNCHRONOUS — it calls the synchronous
+genai.Client() and embed_query(); run it in a thread (admin Search Lab).
+aretrieve_with_intelligence() is the async twin used by POST /api/chat: embeddings
+and the HyDE generation are awaited on client.aio, the HyDE call is bounded by
+asyncio.wait_for(HYDE_TIMEOUT_SECONDS), and only FAISS searches and SQLite reads
+run on the bounded blocking pool (app/services/blocking.py).
+
+HYDE_MODE picks how HyDE is scheduled when QUERY_EXPANSION_ENABLED is on:
+    serial      — embed, search, and only for weak queries generate the bio, then
+                  embed and search again (no extra LLM calls for strong queries).
+    speculative — start generating the bio alongside the first embed + search and
+                  discard it if the query turns out strong, so weak queries — the
+                  slowest ones — skip a full LLM round trip of waiting.
+The query and the bio are embedded together in one call (aembed_queries()).
+
+Generated bios are cached by normalized query (app/services/llm_cache.py, TTL +
+LRU, optional disk tier) — a bio depends only on the query, so repeated weak
+queries skip the HyDE LLM call.
+
+All 6 settings fall back to env vars (or hardcoded defaults) when no DB row exists.
 """
+import asyncio
 import os
-import json
 import threading
 import time
+from collections.abc import Awaitable
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import numpy as np
 import faiss
@@ -31,21 +46,48 @@ from google.genai import types
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
-from app.services.embedder import embed_query
-from app.services.retriever import retrieve, RetrievedExpert, TOP_K
-from app.models import Feedback
+from app.database import SessionLocal
+from app.services.blocking import run_blocking
+from app.services.embedder import EMBED_DEADLINE_S, aembed_queries, aembed_query, embed_query
+from app.services.retriever import retrieve, search_vector, RetrievedExpert, TOP_K
+from app.services.feedback_stats import feedback_multipliers
+from app.services.llm_cache import LLMOutputCache, llm_cache_key, normalize_prompt_text
 
 log = structlog.get_logger()
 
 # ── Safety constant ────────────────────────────────────────────────────────────
 
 # Abort HyDE LLM call after this many seconds (gemini-2.5-flash socket hang bug —
-# see RESEARCH.md Pitfall 4). Enforced by asyncio.wait_for in chat.py caller.
+# see RESEARCH.md Pitfall 4). Enforced by asyncio.wait_for in _agenerate_hypothetical_bio()
+# and by the future wait in _bio_within() on the synchronous path.
 # This is a hang-protection guard, NOT a tuneable setting — keep hardcoded.
 HYDE_TIMEOUT_SECONDS = 5.0
 
+HYDE_MODES = ("serial", "speculative")
+
+# Under a retrieval timeout, time held back from the bio wait for embedding the bio
+HYDE_EMBED_RESERVE_S = 2.0
+
+HYDE_MODEL = "gemini-2.5-flash"
+
+# ── HyDE bio cache ───────────────────────────────────────────────────────────
+
+HYDE_CACHE_TTL = float(os.getenv("HYDE_CACHE_TTL", "86400"))  # 24 hours
+HYDE_CACHE_MAX_ENTRIES = int(os.getenv("HYDE_CACHE_MAX_ENTRIES", "2000"))
+
+_hyde_cache = LLMOutputCache("hyde", HYDE_CACHE_MAX_ENTRIES, HYDE_CACHE_TTL)
+
+
+def _hyde_key(query: str) -> str:
+    return llm_cache_key(HYDE_MODEL, normalize_prompt_text(query))
+
+
+def hyde_cache_stats() -> dict:
+    """Hit/miss/eviction counters of the HyDE bio cache."""
+    return _hyde_cache.stats()
+
 # ── Settings TTL cache (PERF-04) ─────────────────────────────────────────────
-# Caches the 5 intelligence settings dict for 30 seconds to avoid a DB round-trip
+# Caches the 6 intelligence settings dict for 30 seconds to avoid a DB round-trip
 # on every chat message. Invalidated immediately by invalidate_settings_cache().
 _settings_cache: dict | None = None
 _settings_cache_ts: float = 0.0
@@ -67,13 +109,13 @@ def invalidate_settings_cache() -> None:
 
 def get_settings(db: Session) -> dict:
     """
-    Read all 5 intelligence settings from the DB, falling back to env vars.
+    Read all 6 intelligence settings from the DB, falling back to env vars.
 
     Cached in-memory for 30 seconds (PERF-04). invalidate_settings_cache()
     zeroes the timestamp so the next call re-reads from the database — ensuring
     POST /api/admin/settings changes take effect immediately.
 
-    Returns a dict with native Python types (bool, float, int) ready to use directly.
+    Returns a dict with native Python types (bool, float, int, str) ready to use directly.
 
     Valid keys and their defaults:
         QUERY_EXPANSION_ENABLED   — bool,  default: "false"
@@ -81,6 +123,7 @@ def get_settings(db: Session) -> dict:
         SIMILARITY_THRESHOLD      — float, default: "0.60"
         STRONG_RESULT_MIN         — int,   default: "3"
         FEEDBACK_BOOST_CAP        — float, default: "0.20"
+        HYDE_MODE                 — str,   default: "serial" (one of HYDE_MODES)
     """
     global _settings_cache, _settings_cache_ts
 
@@ -112,12 +155,17 @@ def get_settings(db: Session) -> dict:
         except (ValueError, TypeError):
             return int(default)
 
+    def _choice(key: str, default: str, choices: tuple[str, ...]) -> str:
+        value = _db_or_env(key, default).lower().strip()
+        return value if value in choices else default
+
     fresh = {
         "QUERY_EXPANSION_ENABLED": _bool("QUERY_EXPANSION_ENABLED", "false"),
         "FEEDBACK_LEARNING_ENABLED": _bool("FEEDBACK_LEARNING_ENABLED", "false"),
         "SIMILARITY_THRESHOLD": _float("SIMILARITY_THRESHOLD", "0.60"),
         "STRONG_RESULT_MIN": _int("STRONG_RESULT_MIN", "3"),
         "FEEDBACK_BOOST_CAP": _float("FEEDBACK_BOOST_CAP", "0.20"),
+        "HYDE_MODE": _choice("HYDE_MODE", "serial", HYDE_MODES),
     }
 
     # Store in cache
@@ -139,6 +187,13 @@ def _get_hyde_client() -> genai.Client:
         _hyde_client = genai.Client()
     return _hyde_client
 
+
+# Bio generation for the synchronous path runs here so the caller can stop waiting
+# after HYDE_TIMEOUT_SECONDS (and, speculatively, embed and search meanwhile). A
+# running call cannot be cancelled — an abandoned one finishes in the background and
+# still fills the bio cache.
+_hyde_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hyde")
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
 
@@ -157,8 +212,8 @@ def retrieve_with_intelligence(
 
     Args:
         query:       Natural language user query.
-        faiss_index: Loaded FAISS index from app.state.faiss_index.
-        metadata:    Position-aligned metadata list from app.state.metadata.
+        faiss_index: FAISS index of one SearchSnapshot (app.state.search_snapshot).
+        metadata:    Position-aligned metadata of the same snapshot.
         db:          SQLAlchemy Session for feedback table access.
 
     Returns:
@@ -178,6 +233,11 @@ def retrieve_with_intelligence(
     similarity_threshold = settings["SIMILARITY_THRESHOLD"]
     feedback_boost_cap = settings["FEEDBACK_BOOST_CAP"]
 
+    # Speculative HyDE: generate the bio while the first pass runs
+    pending_bio: Future | None = None
+    if query_expansion_enabled and settings["HYDE_MODE"] == "speculative":
+        pending_bio = _hyde_pool.submit(_generate_hypothetical_bio, query)
+
     # Step 1: Initial FAISS retrieval
     candidates = retrieve(query, faiss_index, metadata)
     intelligence: dict = {
@@ -188,7 +248,9 @@ def retrieve_with_intelligence(
 
     # Step 2: HyDE expansion — only when enabled and query is weak
     if query_expansion_enabled and _is_weak_query(candidates, strong_result_min, similarity_threshold):
-        bio = _generate_hypothetical_bio(query)
+        if pending_bio is None:
+            pending_bio = _hyde_pool.submit(_generate_hypothetical_bio, query)
+        bio = _bio_within(pending_bio)
         if bio is not None:
             original_vec = embed_query(query)
             blended_vec = _blend_embeddings(original_vec, bio)
@@ -197,6 +259,9 @@ def retrieve_with_intelligence(
             intelligence["hyde_triggered"] = True
             intelligence["hyde_bio"] = bio
             log.info("hyde.triggered", query_preview=query[:60])
+    elif pending_bio is not None:
+        # Strong query — the bio is not needed; the call runs to completion unobserved
+        log.info("hyde.speculation_discarded", query_preview=query[:60])
 
     # Step 3: Feedback re-ranking — only when enabled
     if feedback_learning_enabled:
@@ -205,9 +270,97 @@ def retrieve_with_intelligence(
 
     return candidates, intelligence
 
+async def aretrieve_with_intelligence(
+    query: str,
+    faiss_index,
+    metadata: list[dict],
+    timeout: float | None = None,
+) -> tuple[list[RetrievedExpert], dict]:
+    """
+    Async retrieve_with_intelligence() for the chat endpoint — same steps and result.
+
+    Gemini calls (query/bio embeddings, HyDE generation) are awaited on client.aio;
+    with HYDE_MODE=speculative the bio generation starts before the first search;
+    settings, FAISS searches and the feedback boost run on the bounded blocking pool,
+    each with its own short-lived DB session. Cancelling the caller cancels the
+    in-flight Gemini requests.
+
+    timeout bounds the whole retrieval: each Gemini stage gets at most what is left
+    of it, and when the bio or its embedding would not fit, HyDE is skipped and the
+    first-pass candidates are returned.
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+
+    def left(cap: float, reserve: float = 0.0) -> float:
+        if deadline is None:
+            return cap
+        return max(0.0, min(cap, deadline - time.monotonic() - reserve))
+
+    settings = await run_blocking(_load_settings)
+    expansion_enabled = settings["QUERY_EXPANSION_ENABLED"]
+
+    # Speculative HyDE: generate the bio while the first pass runs
+    bio_task: asyncio.Task | None = None
+    if expansion_enabled and settings["HYDE_MODE"] == "speculative":
+        bio_task = asyncio.ensure_future(_agenerate_hypothetical_bio(query))
+
+    intelligence: dict = {
+        "hyde_triggered": False,
+        "hyde_bio": None,
+        "feedback_applied": False,
+    }
+    try:
+        # Step 1: Initial FAISS retrieval
+        original_vec = await aembed_query(query, timeout=left(EMBED_DEADLINE_S))
+        candidates = await run_blocking(search_vector, original_vec, faiss_index, metadata)
+
+        # Step 2: HyDE expansion — only when enabled and query is weak
+        if expansion_enabled and _is_weak_query(
+            candidates, settings["STRONG_RESULT_MIN"], settings["SIMILARITY_THRESHOLD"]
+        ):
+            bio = await _abio_within(
+                bio_task if bio_task is not None else _agenerate_hypothetical_bio(query),
+                left(HYDE_TIMEOUT_SECONDS, reserve=HYDE_EMBED_RESERVE_S),
+            )
+            hyde_vecs = None
+            if bio is not None:
+                try:
+                    hyde_vecs = await aembed_queries([query, bio], timeout=left(EMBED_DEADLINE_S))
+                except TimeoutError:
+                    log.warning("hyde.skipped_deadline", stage="embed", query_preview=query[:60])
+            if hyde_vecs is not None:
+                blended_vec = _average_vectors(*hyde_vecs)
+                hyde_candidates = await run_blocking(_search_with_vector, blended_vec, faiss_index, metadata)
+                candidates = _merge_candidates(candidates, hyde_candidates)
+                intelligence["hyde_triggered"] = True
+                intelligence["hyde_bio"] = bio
+                log.info("hyde.triggered", query_preview=query[:60], mode=settings["HYDE_MODE"])
+        elif bio_task is not None:
+            log.info("hyde.speculation_discarded", query_preview=query[:60])
+    finally:
+        if bio_task is not None and not bio_task.done():
+            bio_task.cancel()  # strong query, or the caller gave up — stop the LLM call
+
+    # Step 3: Feedback re-ranking — only when enabled
+    if settings["FEEDBACK_LEARNING_ENABLED"]:
+        candidates = await run_blocking(_feedback_boost_in_session, candidates, settings["FEEDBACK_BOOST_CAP"])
+        intelligence["feedback_applied"] = True
+
+    return candidates, intelligence
+
 # ── Internal helpers ──────────────────────────────────────────────────────────
 
 
+def _load_settings() -> dict:
+    with SessionLocal() as db:
+        return get_settings(db)
+
+
+def _feedback_boost_in_session(candidates: list[RetrievedExpert], feedback_boost_cap: float) -> list[RetrievedExpert]:
+    with SessionLocal() as db:
+        return _apply_feedback_boost(candidates, db, feedback_boost_cap)
+
+
 def _is_weak_query(
     candidates: list[RetrievedExpert],
     strong_result_min: int,
@@ -223,15 +376,8 @@ def _is_weak_query(
     return strong < strong_result_min
 
 
-def _generate_hypothetical_bio(query: str) -> str | None:
-    """
-    Generate a hypothetical expert bio shaped to match the FAISS embedding space.
-
-    Returns None on any failure — the caller falls back to the original candidates.
-    The bio is first-person and domain-specific to land in the expert-bio region of
-    the embedding space rather than the question/problem region.
-    """
-    prompt = (
+def _hyde_prompt(query: str) -> str:
+    return (
         f"Write a short professional bio (2-3 sentences) for an expert consultant "
         f"who would be the perfect answer to this problem:\n\n"
         f"\"{query}\"\n\n"
@@ -239,22 +385,84 @@ def _generate_hypothetical_bio(query: str) -> str | None:
         f"Example style: 'I am a tax attorney specializing in EU VAT compliance for "
         f"e-commerce companies. I have advised 50+ startups on cross-border tax structures.'"
     )
+
+
+_HYDE_CONFIG = types.GenerateContentConfig(
+    temperature=0.7,
+    max_output_tokens=200,
+)
+
+
+def _generate_hypothetical_bio(query: str) -> str | None:
+    """
+    Generate a hypothetical expert bio shaped to match the FAISS embedding space.
+
+    Returns None on any failure — the caller falls back to the original candidates.
+    The bio is first-person and domain-specific to land in the expert-bio region of
+    the embedding space rather than the question/problem region. Served from the
+    bio cache when the same query was expanded recently.
+    """
+    cache_key = _hyde_key(query)
+    cached = _hyde_cache.get(cache_key)
+    if cached is not None:
+        return cached
     try:
         response = _get_hyde_client().models.generate_content(
-            model="gemini-2.5-flash",
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                temperature=0.7,
-                max_output_tokens=200,
-            ),
+            model=HYDE_MODEL,
+            contents=_hyde_prompt(query),
+            config=_HYDE_CONFIG,
         )
         bio = (response.text or "").strip()
+        if bio:
+            _hyde_cache.set(cache_key, bio)
         return bio if bio else None
     except Exception as exc:
         log.warning("hyde.generation_failed", error=str(exc))
         return None
 
 
+def _bio_within(pending: Future) -> str | None:
+    """Result of a _hyde_pool bio generation, or None after HYDE_TIMEOUT_SECONDS."""
+    try:
+        return pending.result(timeout=HYDE_TIMEOUT_SECONDS)
+    except TimeoutError:
+        log.warning("hyde.generation_failed", error="timed out", timeout_s=HYDE_TIMEOUT_SECONDS)
+        return None
+
+
+async def _agenerate_hypothetical_bio(query: str) -> str | None:
+    """Async _generate_hypothetical_bio() on client.aio, cancelled after HYDE_TIMEOUT_SECONDS."""
+    cache_key = _hyde_key(query)
+    cached = await _hyde_cache.aget(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        response = await asyncio.wait_for(
+            _get_hyde_client().aio.models.generate_content(
+                model=HYDE_MODEL,
+                contents=_hyde_prompt(query),
+                config=_HYDE_CONFIG,
+            ),
+            timeout=HYDE_TIMEOUT_SECONDS,
+        )
+        bio = (response.text or "").strip()
+        if bio:
+            await _hyde_cache.aset(cache_key, bio)
+        return bio if bio else None
+    except Exception as exc:
+        log.warning("hyde.generation_failed", error=str(exc) or type(exc).__name__)
+        return None
+
+
+async def _abio_within(bio: Awaitable[str | None], timeout: float) -> str | None:
+    """Await a bio generation for at most timeout seconds; None (HyDE skipped) past it."""
+    try:
+        return await asyncio.wait_for(bio, timeout=timeout)
+    except TimeoutError:
+        log.warning("hyde.skipped_deadline", stage="bio", timeout_s=round(timeout, 3))
+        return None
+
+
 def _blend_embeddings(original_vec: list[float], hyde_text: str) -> list[float]:
     """
     Embed the hypothetical bio, average with the original query vector, and
@@ -272,6 +480,11 @@ def _blend_embeddings(original_vec: list[float], hyde_text: str) -> list[float]:
         L2-normalized blended vector (same dimension as original_vec).
     """
     hyde_vec = embed_query(hyde_text)  # Already L2-normalized by embed_query()
+    return _average_vectors(original_vec, hyde_vec)
+
+
+def _average_vectors(original_vec: list[float], hyde_vec: list[float]) -> list[float]:
+    """Average two unit vectors and re-normalize (see _blend_embeddings)."""
     orig = np.array(original_vec, dtype=np.float32)
     hyp = np.array(hyde_vec, dtype=np.float32)
     blended = (orig + hyp) / 2.0
@@ -288,67 +501,18 @@ def _search_with_vector(
     """
     Search FAISS with a pre-built vector (instead of a query string).
 
-    Replicates the core search logic from retriever.retrieve() but accepts a
-    pre-computed, L2-normalized vector. Filters incomplete experts the same way.
+    Same search and candidate materialization as retriever.retrieve() (one shared
+    implementation, retriever.search_vector) for a pre-computed, L2-normalized vector.
 
     Args:
         blended_vec:  L2-normalized vector to search with.
-        faiss_index:  Loaded FAISS index from app.state.faiss_index.
-        metadata:     Position-aligned metadata list from app.state.metadata.
+        faiss_index:  FAISS index of one SearchSnapshot (app.state.search_snapshot).
+        metadata:     Position-aligned metadata of the same snapshot.
 
     Returns:
         List of RetrievedExpert sorted by score descending, length 0-TOP_K.
     """
-    vector = np.array(blended_vec, dtype=np.float32).reshape(1, -1)
-    k = min(TOP_K, faiss_index.ntotal)
-    scores, indices = faiss_index.search(vector, k)
-    scores = scores[0].tolist()
-    indices = indices[0].tolist()
-
-    candidates: list[RetrievedExpert] = []
-    for score, idx in zip(scores, indices):
-        if idx < 0:
-            continue
-        row = metadata[idx]
-
-        def _get(row: dict, *keys: str) -> str | None:
-            for k in keys:
-                for candidate in (k, k.replace("_", " ")):
-                    v = row.get(candidate)
-                    if v is None:
-                        v = next((row[rk] for rk in row if rk.lower() == candidate.lower()), None)
-                    if v and str(v).strip() and str(v).strip().lower() not in ("nan", "none", ""):
-                        return str(v).strip()
-            return None
-
-        first = _get(row, "First Name", "first_name", "first name")
-        last = _get(row, "Last Name", "last_name", "last name")
-        if first and last:
-            name = f"{first} {last}"
-        else:
-            name = _get(row, "name", "Name", "expert_name", "Full Name", "full_name")
-
-        title = _get(row, "Job Title", "job_title", "title", "Title", "position", "Role")
-        company = _get(row, "company", "Company", "organization", "employer")
-        hourly_rate = _get(row, "Hourly Rate", "hourly_rate", "hourly rate", "rate", "Rate", "price")
-        bio = _get(row, "Bio", "bio", "description", "about", "summary")
-
-        if not name or not hourly_rate or not bio:
-            continue
-
-        profile_url = _get(row, "Profile URL with UTM", "profile_url_with_utm", "Link", "profile_url", "url", "URL")
-
-        candidates.append(RetrievedExpert(
-            name=name,
-            title=title,
-            company=company,
-            hourly_rate=hourly_rate,
-            profile_url=profile_url,
-            score=score,
-            raw=row,
-        ))
-
-    return candidates
+    return search_vector(blended_vec, faiss_index, metadata)
 
 
 def _merge_candidates(
@@ -391,68 +555,32 @@ def _apply_feedback_boost(
     """
     Re-rank candidates using cumulative thumbs up/down feedback signals.
 
-    Cold-start guard: experts with fewer than 10 global feedback interactions
-    receive no boost (prevents statistical noise from sparse data — SEARCH-05).
-
-    Boost formula (uses feedback_boost_cap, default 0.20):
-        ratio = up / (up + down)
-        boost_factor = feedback_boost_cap * 2   # ratio range 0.0-1.0, cap range 0.0-0.50
-        if ratio > 0.5: multiplier = 1.0 + (ratio - 0.5) * boost_factor  (max 1 + cap)
-        if ratio < 0.5: multiplier = 1.0 - (0.5 - ratio) * boost_factor  (min 1 - cap)
-        if ratio == 0.5: multiplier = 1.0 (no change)
+    Multipliers come from feedback_stats.feedback_multipliers() — the shared
+    cold-start guard (fewer than 10 votes → no boost, SEARCH-05) and boost formula
+    (max ±feedback_boost_cap), read from the expert_feedback_stats counters.
 
     Graceful degradation: any DB error returns candidates unchanged and logs a
     warning. Never raises — SEARCH-06 requires feedback to never block search.
 
     Args:
         candidates:        Current candidate list (may have been HyDE-merged).
-        db:                SQLAlchemy Session for feedback table access.
+        db:                SQLAlchemy Session for expert_feedback_stats access.
         feedback_boost_cap: Max fractional score adjustment (0.0–0.50). DB-controlled.
 
     Returns:
         Re-ranked candidates (or original list on DB failure).
     """
     try:
-        urls = [c.profile_url for c in candidates if c.profile_url]
-        url_set = set(urls)
+        url_set = {c.profile_url for c in candidates if c.profile_url}
 
         # Guard: return early if no candidates have a profile_url to look up.
         # Also avoids empty .in_() query (same pattern as Phase 09-01 decision).
         if not url_set:
             return candidates
 
-        # Load all up/down feedback rows — SQLite has no JSON indexing so we
-        # filter expert_ids in Python. Acceptable for small feedback tables.
-        rows = db.scalars(
-            select(Feedback).where(Feedback.vote.in_(["up", "down"]))
-        ).all()
-
-        # Accumulate per-URL vote counts
-        counts: dict[str, dict[str, int]] = {u: {"up": 0, "down": 0} for u in url_set}
-
-        for row in rows:
-            expert_ids = json.loads(row.expert_ids or "[]")
-            for eid in expert_ids:
-                if eid in url_set:
-                    counts[eid][row.vote] = counts[eid].get(row.vote, 0) + 1
-
-        # Compute multipliers for experts that meet the cold-start threshold
-        boost_factor = feedback_boost_cap * 2  # ratio range 0.0-1.0, cap range 0.0-0.50
-        multipliers: dict[str, float] = {}
-        for url in url_set:
-            up = counts[url]["up"]
-            down = counts[url]["down"]
-            total = up + down
-            if total < 10:
-                # Cold-start guard — do not boost experts with sparse feedback
-                continue
-            ratio = up / total
-            if ratio > 0.5:
-                boost = (ratio - 0.5) * boost_factor  # max feedback_boost_cap at ratio=1.0
-                multipliers[url] = 1.0 + boost
-            elif ratio < 0.5:
-                penalty = (0.5 - ratio) * boost_factor  # max feedback_boost_cap at ratio=0.0
-                multipliers[url] = 1.0 - penalty
+        # Precomputed per-URL counters (expert_feedback_stats) — O(candidates),
+        # independent of the size of the feedback table.
+        multipliers = feedback_multipliers(db, feedback_boost_cap, url_set)
 
         # Apply multipliers in-place (dataclass fields are mutable)
         for candidate in candidates:
@@ -0,0 +1,114 @@
+"""
+Immutable, versioned bundle of everything a vector search reads.
+
+The index, the position-aligned metadata, the username → position map and the
+exact vectors must always come from the same ingest. They used to be separate
+app.state attributes reassigned one after another by the ingest hot-reload, so a
+concurrent explore could pair a new index with old metadata and map positions to
+the wrong experts. A SearchSnapshot holds all of them; install_search_snapshot()
+swaps app.state.search_snapshot with one reference assignment, and a request reads
+that attribute once and uses only that object, so it keeps the snapshot it started
+with across a reload.
+
+load_search_snapshot() opens the generation CURRENT points at (app/services/
+index_snapshot.py) — or faiss.index / metadata.json when there is none — and
+precompiles the per-snapshot search structures (retrieval records, coarse codes)
+before it is installed, so the swap itself is instant. Rollback re-points CURRENT
+at an older generation and installs that (POST /api/admin/search-snapshot/rollback).
+"""
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+import numpy as np
+import structlog
+
+from app.services.coarse_search import coarse_index_for
+from app.services.index_snapshot import (
+    current_generation_dir,
+    load_faiss_index,
+    load_metadata,
+    load_vectors,
+    read_manifest,
+    username_positions,
+)
+from app.services.retriever import records_for
+
+log = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class SearchSnapshot:
+    """
+    One consistent generation of the search data.
+
+    generation is the on-disk snapshot generation, 0 when loaded from faiss.index /
+    metadata.json. faiss_vectors are the exact vectors for a non-flat index, else None.
+    """
+    generation: int
+    faiss_index: Any
+    metadata: Sequence[dict]
+    username_to_faiss_pos: Mapping[str, int]
+    faiss_vectors: np.ndarray | None = None
+    index_info: Mapping[str, Any] = field(default_factory=dict)
+    loaded_at: float = field(default_factory=time.time)
+
+    @property
+    def ntotal(self) -> int:
+        return self.faiss_index.ntotal
+
+    def describe(self) -> dict:
+        """Summary for the admin endpoints."""
+        return {
+            "generation": self.generation,
+            "vectors": self.ntotal,
+            "records": len(self.metadata),
+            "index": dict(self.index_info),
+            "loaded_at": self.loaded_at,
+        }
+
+
+def load_search_snapshot() -> SearchSnapshot:
+    """
+    Load the current generation and precompile its search structures.
+
+    Raises RuntimeError when the index and metadata disagree on the expert count —
+    the caller keeps serving the snapshot it has.
+    """
+    current = current_generation_dir()
+    generation, directory = current if current is not None else (0, None)
+    faiss_index = load_faiss_index(directory)
+    metadata = load_metadata(directory)
+    if faiss_index.ntotal != len(metadata):
+        raise RuntimeError(
+            f"search snapshot generation {generation}: index has {faiss_index.ntotal} vectors "
+            f"but metadata has {len(metadata)} records"
+        )
+    index_info = read_manifest(directory).get("index", {}) if directory is not None else {"type": "flat"}
+    snapshot = SearchSnapshot(
+        generation=generation,
+        faiss_index=faiss_index,
+        metadata=metadata,
+        username_to_faiss_pos=MappingProxyType(username_positions(metadata)),
+        faiss_vectors=load_vectors(directory),
+        index_info=MappingProxyType(index_info),
+    )
+    # Built now rather than by the first request that searches this snapshot
+    records_for(snapshot.metadata)
+    coarse_index_for(snapshot.faiss_index, snapshot.faiss_vectors)
+    return snapshot
+
+
+def install_search_snapshot(app_state, snapshot: SearchSnapshot) -> SearchSnapshot | None:
+    """Make snapshot the live one with a single reference swap; returns the previous one."""
+    previous: SearchSnapshot | None = getattr(app_state, "search_snapshot", None)
+    app_state.search_snapshot = snapshot
+    log.info(
+        "search_snapshot.installed",
+        generation=snapshot.generation,
+        previous=previous.generation if previous is not None else None,
+        vectors=snapshot.ntotal,
+    )
+    return previous
@@ -0,0 +1,132 @@
+"""
+Cross-worker L2 cache for serialized /api/explore responses.
+
+Each uvicorn worker keeps its own in-process LRU (L1, explore_cache.py). With
+several workers on one host every worker warmed its own cache and an admin
+invalidation only cleared the worker that served it. This module adds a store
+shared by all workers on the host: a local SQLite file (SHARED_CACHE_PATH, WAL
+mode) holding response bodies as BLOBs, plus a shared generation counter.
+
+  - get(key)                    — body for key if stored at the current generation
+                                  and not expired
+  - set(key, body, generation)  — store a body computed at `generation`; bodies from
+                                  an older generation are never served
+  - bump_generation()           — invalidate every worker's cached results at once
+  - generation()                — current shared generation; explore_cache polls it
+                                  to clear L1 and mark its catalog stale when another
+                                  worker invalidated
+
+Optional: enabled with EXPLORE_SHARED_CACHE=true. Any SQLite error is logged and
+treated as a miss — the shared cache never fails an explore request.
+"""
+import json
+import sqlite3
+import threading
+import time
+
+import structlog
+
+from app.config import SHARED_CACHE_PATH
+
+log = structlog.get_logger()
+
+# Delete expired / old-generation rows every N writes, and keep at most this many rows
+_PRUNE_EVERY = 100
+SHARED_CACHE_MAX_ENTRIES = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS explore_cache (
+    key        TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    body       BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cache_meta (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cache_meta (name, value) VALUES ('generation', 0);
+"""
+
+
+class SharedCache:
+    """SQLite-backed byte cache shared by all processes that open the same file."""
+
+    def __init__(self, path: str) -> None:
+        self._conn = sqlite3.connect(path, timeout=1.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    @staticmethod
+    def _key(key) -> str:
+        return json.dumps(key, separators=(",", ":"))
+
+    def generation(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM cache_meta WHERE name = 'generation'").fetchone()
+        return row[0]
+
+    def bump_generation(self) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "UPDATE cache_meta SET value = value + 1 WHERE name = 'generation' RETURNING value"
+            ).fetchone()
+        return row[0]
+
+    def get(self, key) -> bytes | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM explore_cache "
+                "WHERE key = ? AND expires_at > ? "
+                "AND generation = (SELECT value FROM cache_meta WHERE name = 'generation')",
+                (self._key(key), time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, body: bytes, generation: int, ttl: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO explore_cache (key, generation, expires_at, body) VALUES (?, ?, ?, ?)",
+                (self._key(key), generation, time.time() + ttl, body),
+            )
+            self._writes += 1
+            if self._writes % _PRUNE_EVERY == 0:
+                self._prune()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM explore_cache")
+
+    def _prune(self) -> None:
+        """Drop expired and superseded rows, then the oldest rows beyond the row cap."""
+        self._conn.execute(
+            "DELETE FROM explore_cache WHERE expires_at <= ? "
+            "OR generation < (SELECT value FROM cache_meta WHERE name = 'generation')",
+            (time.time(),),
+        )
+        self._conn.execute(
+            "DELETE FROM explore_cache WHERE key IN ("
+            "SELECT key FROM explore_cache ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (SHARED_CACHE_MAX_ENTRIES,),
+        )
+
+
+_shared: SharedCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_cache() -> SharedCache | None:
+    """Return the process-wide SharedCache, opening it on first use; None if it cannot be opened."""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                try:
+                    _shared = SharedCache(str(SHARED_CACHE_PATH))
+                except sqlite3.Error as exc:
+                    log.warning("shared_cache.open_failed", path=str(SHARED_CACHE_PATH), error=str(exc))
+                    return None
+    return _shared
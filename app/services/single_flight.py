@@ -0,0 +1,81 @@
+"""
+Single-flight request coalescing.
+
+When many identical requests miss a cache at the same moment, only the first
+one (the leader) runs the expensive computation; concurrent callers with the
+same key wait for the leader's result instead of repeating the work. Once the
+call finishes the key is released, so later callers go back to the caches.
+
+  AsyncSingleFlight — for coroutines on the event loop (GET /api/explore).
+                      The computation runs as its own task, so a leader whose
+                      client disconnects does not cancel it for the followers.
+  SingleFlight      — for blocking code on worker threads (embed_query).
+
+Exceptions propagate to the leader and every follower alike.
+"""
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent identical coroutine calls on one event loop."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.coalesced = 0  # calls served by another caller's in-flight task
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: self._inflight.pop(k, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+
+class _Call:
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesce concurrent identical blocking calls across threads."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            call.done.set()
@@ -0,0 +1,110 @@
+"""
+Bitmap tag index for AND-logic skill/industry filtering in run_explore.
+
+Inverted index from (tag, tag_type) to a packed bitset over catalog row indexes
+(np.packbits, one bit per expert). Built from the expert_tags table that
+app/services/tag_sync.py maintains, so the same normalization applies:
+skill and manual tags are lowercased, industry tags are stored as-is.
+
+AND-filtering across N selected tags is N bitwise intersections over
+ceil(rows / 8) bytes each — no per-tag EXISTS subquery against SQLite.
+
+Incremental updates: sync_expert_tags() stages the new tag set for an expert on
+the session; after commit, replace_row() swaps in copies of the affected bitmaps
+(copy-on-write), so readers never observe a half-applied update.
+"""
+from collections import defaultdict
+from collections.abc import Iterable
+
+import numpy as np
+
+TagKey = tuple[str, str]  # (tag, tag_type)
+
+SKILL_TAG_TYPES = ("skill", "manual")  # Phase 69.2: skill filter matches AI + admin tags
+INDUSTRY_TAG_TYPE = "industry"
+
+
+class TagBitmapIndex:
+    """Packed-bitset inverted index over dense catalog rows."""
+
+    def __init__(self, n_rows: int) -> None:
+        self.n_rows = n_rows
+        self._bitmaps: dict[TagKey, np.ndarray] = {}
+        self._row_keys: dict[int, frozenset[TagKey]] = {}
+
+    @classmethod
+    def build(cls, n_rows: int, entries: Iterable[tuple[int, str, str]]) -> "TagBitmapIndex":
+        """Build the index from (row, tag, tag_type) triples."""
+        index = cls(n_rows)
+        rows_by_key: dict[TagKey, list[int]] = defaultdict(list)
+        keys_by_row: dict[int, set[TagKey]] = defaultdict(set)
+        for row, tag, tag_type in entries:
+            rows_by_key[(tag, tag_type)].append(row)
+            keys_by_row[row].add((tag, tag_type))
+
+        for key, rows in rows_by_key.items():
+            bits = np.zeros(n_rows, dtype=bool)
+            bits[rows] = True
+            index._bitmaps[key] = np.packbits(bits)
+        index._row_keys = {row: frozenset(keys) for row, keys in keys_by_row.items()}
+        return index
+
+    def __len__(self) -> int:
+        return len(self._bitmaps)
+
+    def _empty(self) -> np.ndarray:
+        return np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+
+    def _skill_bitmap(self, tag: str) -> np.ndarray:
+        """Union of the skill and manual bitmaps for one (lowercased) tag."""
+        result = None
+        for tag_type in SKILL_TAG_TYPES:
+            bm = self._bitmaps.get((tag, tag_type))
+            if bm is not None:
+                result = bm if result is None else np.bitwise_or(result, bm)
+        return result if result is not None else self._empty()
+
+    def match_all(self, tags: list[str], industry_tags: list[str]) -> np.ndarray:
+        """
+        Return a boolean row mask for experts that have ALL selected tags.
+
+        tags: skill tags — matched case-insensitively against skill + manual tags.
+        industry_tags: matched exactly against industry tags.
+        """
+        acc: np.ndarray | None = None
+        for tag in tags:
+            bm = self._skill_bitmap(tag.lower())
+            acc = bm if acc is None else np.bitwise_and(acc, bm)
+        for itag in industry_tags:
+            bm = self._bitmaps.get((itag, INDUSTRY_TAG_TYPE))
+            if bm is None:
+                bm = self._empty()
+            acc = bm if acc is None else np.bitwise_and(acc, bm)
+        if acc is None:
+            return np.ones(self.n_rows, dtype=bool)
+        return np.unpackbits(acc, count=self.n_rows).astype(bool)
+
+    def replace_row(self, row: int, keys: Iterable[TagKey]) -> None:
+        """
+        Replace the full tag set of one row (mirrors sync_expert_tags delete + insert).
+
+        Affected bitmaps are copied before modification and swapped in with a
+        single dict assignment each — concurrent readers see old or new, never torn.
+        """
+        new_keys = frozenset(keys)
+        old_keys = self._row_keys.get(row, frozenset())
+        byte, bit = row >> 3, np.uint8(1 << (7 - (row & 7)))  # np.packbits is big-endian
+
+        for key in old_keys - new_keys:
+            bm = self._bitmaps.get(key)
+            if bm is not None:
+                bm = bm.copy()
+                bm[byte] &= ~bit
+                self._bitmaps[key] = bm
+        for key in new_keys - old_keys:
+            bm = self._bitmaps.get(key)
+            bm = self._empty() if bm is None else bm.copy()
+            bm[byte] |= bit
+            self._bitmaps[key] = bm
+
+        self._row_keys[row] = new_keys
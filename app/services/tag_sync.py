@@ -5,17 +5,39 @@ Keeps the expert_tags join table in sync with Expert.tags and Expert.industry_ta
 JSON columns. Called from:
   - Startup (sync_all_expert_tags) — full rebuild after FTS5 rebuild
   - Admin write paths (sync_expert_tags) — per-expert sync after tag updates
+
+sync_expert_tags() also stages the expert's new tag set on the session. Once the
+session commits, the staged sets are applied to the explore catalog's bitmap tag
+index (app/services/tag_index.py); a rollback discards them.
 """
 import json
 
 import structlog
-from sqlalchemy import delete
+from sqlalchemy import delete, event
 from sqlalchemy.orm import Session
 
+from app.database import SessionLocal
 from app.models import Expert, ExpertTag
+from app.services.catalog import apply_tag_updates
 
 log = structlog.get_logger()
 
+# Session.info key for tag sets staged by sync_expert_tags() until commit
+_PENDING_TAG_UPDATES = "pending_tag_index_updates"
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _apply_pending_tag_updates(session: Session) -> None:
+    """Patch the catalog tag index with tag sets committed in this session."""
+    updates = session.info.pop(_PENDING_TAG_UPDATES, None)
+    if updates:
+        apply_tag_updates(updates)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_pending_tag_updates(session: Session) -> None:
+    session.info.pop(_PENDING_TAG_UPDATES, None)
+
 
 def sync_expert_tags(
     db: Session,
@@ -28,7 +50,8 @@ def sync_expert_tags(
     Delete and re-insert expert_tags rows for one expert.
 
     Call this after any update to Expert.tags, Expert.industry_tags, or Expert.manual_tags.
-    Does NOT commit — caller handles the transaction.
+    Does NOT commit — caller handles the transaction. The catalog tag index picks up
+    the new tag set when the caller's session commits.
 
     Args:
         db: SQLAlchemy Session.
@@ -50,6 +73,7 @@ def sync_expert_tags(
     ]
     if rows:
         db.bulk_save_objects(rows)
+    db.info.setdefault(_PENDING_TAG_UPDATES, {})[expert_id] = {(r.tag, r.tag_type) for r in rows}
 
 
 def sync_all_expert_tags(db: Session) -> None:
@@ -0,0 +1,99 @@
+"""
+Filter-aware FAISS search over a pre-filtered subset of index positions.
+
+run_explore() scores every expert that survives Stage 1, so the vector stage
+needs the similarity of the query against exactly that subset — not the global
+top-k. The strategy is picked by subset size and selectivity:
+
+  direct  — small subsets: gather the subset's vectors and take one
+            matrix-vector product. No index scan at all.
+  batch   — selective filters: FAISS search restricted with IDSelectorBatch
+            (hash set of allowed ids), k = subset size.
+  bitmap  — broad filters: FAISS search restricted with IDSelectorBitmap
+            (one bit per index position), k = subset size.
+
+All three return the inner-product score of every allowed position, so ranking
+does not depend on the strategy chosen.
+
+When the snapshot index is approximate (HNSW, IVF, quantized — see
+index_factory.py), a selector-restricted search would return approximate scores
+and can drop allowed positions, so the caller passes the snapshot's exact vectors
+and every subset is scored directly against them.
+"""
+import faiss
+import numpy as np
+
+# Subsets up to this many vectors are scored directly (gather + matvec).
+DIRECT_SCORING_MAX = 2048
+
+# Above this fraction of ntotal, a bitmap selector is cheaper than a hash set.
+BITMAP_SELECTIVITY_MIN = 0.25
+
+
+def _flat_vectors(index) -> np.ndarray | None:
+    """
+    Return an (ntotal, d) float32 view of a flat index's stored vectors, or None.
+
+    Zero-copy for IndexFlat* — the view aliases the index's own storage.
+    """
+    if not isinstance(index, faiss.IndexFlat) or index.ntotal == 0:
+        return None
+    return faiss.rev_swig_ptr(index.get_xb(), index.ntotal * index.d).reshape(index.ntotal, index.d)
+
+
+def choose_strategy(subset_size: int, ntotal: int, direct_available: bool = True) -> str:
+    """Pick the subset search strategy from subset size and selectivity."""
+    if direct_available and subset_size <= DIRECT_SCORING_MAX:
+        return "direct"
+    if ntotal and subset_size / ntotal >= BITMAP_SELECTIVITY_MIN:
+        return "bitmap"
+    return "batch"
+
+
+def search_subset(
+    index,
+    query_vec: np.ndarray,
+    positions: np.ndarray,
+    exact_vectors: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, str]:
+    """
+    Score query_vec against the given FAISS positions only.
+
+    Args:
+        index:         Loaded FAISS index (inner-product metric, L2-normalized vectors).
+        query_vec:     (1, d) float32 L2-normalized query vector.
+        positions:     int64 FAISS positions to score (unique, each < index.ntotal).
+        exact_vectors: (ntotal, d) exact vectors for a non-flat index
+                       (index_snapshot.load_vectors()); forces direct scoring.
+
+    Returns:
+        (positions, scores, strategy) — positions and float32 scores aligned;
+        positions absent from the index are dropped.
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    if positions.size == 0:
+        return positions, np.empty(0, dtype=np.float32), "empty"
+
+    vectors = _flat_vectors(index)
+    if vectors is None and exact_vectors is not None:
+        vectors, strategy = exact_vectors, "direct"
+    else:
+        strategy = choose_strategy(positions.size, index.ntotal, vectors is not None)
+
+    if strategy == "direct":
+        scores = vectors[positions] @ query_vec[0]
+        return positions, scores.astype(np.float32, copy=False), strategy
+
+    if strategy == "bitmap":
+        bits = np.zeros(index.ntotal, dtype=bool)
+        bits[positions] = True
+        packed = np.packbits(bits, bitorder="little")  # FAISS bitmap is LSB-first per byte
+        selector = faiss.IDSelectorBitmap(index.ntotal, faiss.swig_ptr(packed))
+    else:
+        selector = faiss.IDSelectorBatch(positions.size, faiss.swig_ptr(positions))
+
+    # packed / positions must stay alive until search returns — the selector only borrows them
+    params = faiss.SearchParameters(sel=selector)
+    scores, indices = index.search(query_vec, int(positions.size), params=params)
+    keep = indices[0] >= 0
+    return indices[0][keep], scores[0][keep], strategy
@@ -121,13 +121,14 @@ export interface IngestStatus {
 
 export interface AdminSetting {
   key: string
-  value: boolean | number         // native typed (bool for flags, float/int for thresholds)
+  value: boolean | number | string  // native typed (bool for flags, float/int for thresholds, string for choices)
   raw: string                     // original string value from DB or env var
   source: 'db' | 'env' | 'default'  // override hierarchy indicator from backend
-  type: 'bool' | 'float' | 'int'
+  type: 'bool' | 'float' | 'int' | 'choice'
   description: string
   min?: number
   max?: number
+  choices?: string[]
 }
 
 export interface AdminSettingsResponse {
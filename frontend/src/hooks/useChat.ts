@@ -89,6 +89,20 @@ export function useChat({ email }: UseChatOptions): UseChatReturn {
         const decoder = new TextDecoder()
         let buffer = ''
 
+        // Progressive preview built from candidates / narrative / expert / why_them
+        // events; the final result event replaces it wholesale.
+        let streamedNarrative = ''
+        let streamedExperts: Expert[] = []
+        const showPreview = () => {
+          const experts = [...streamedExperts]
+          updateLastAssistantMessage((msg) => ({
+            ...msg,
+            content: streamedNarrative,
+            experts: experts.length > 0 ? experts : undefined,
+            isStreaming: true,
+          }))
+        }
+
         while (true) {
           const { done, value } = await reader.read()
           if (done) break
@@ -114,6 +128,39 @@ export function useChat({ email }: UseChatOptions): UseChatReturn {
 
             if (event.event === 'status' && event.status === 'thinking') {
               // Already in thinking state — no-op
+            } else if (event.event === 'candidates') {
+              // Retrieval finished — show the top candidates until the LLM picks its experts
+              const candidates = (event.experts ?? []) as Expert[]
+              streamedExperts = candidates.slice(0, 3).map((c) => ({
+                name: c.name,
+                title: c.title,
+                company: c.company,
+                hourly_rate: c.hourly_rate,
+                profile_url: c.profile_url,
+                why_them: '',
+              }))
+              setStatus('streaming')
+              showPreview()
+            } else if (event.event === 'narrative') {
+              streamedNarrative += event.delta as string
+              showPreview()
+            } else if (event.event === 'expert') {
+              const index = event.index as number
+              if (index === 0) streamedExperts = [] // first chosen expert replaces the candidate preview
+              streamedExperts[index] = event.expert as Expert
+              showPreview()
+            } else if (event.event === 'why_them') {
+              const index = event.index as number
+              const expert = streamedExperts[index]
+              if (expert) {
+                streamedExperts[index] = { ...expert, why_them: expert.why_them + (event.delta as string) }
+                showPreview()
+              }
+            } else if (event.event === 'reset') {
+              // Generation retried after partial output — drop the partial text
+              streamedNarrative = ''
+              streamedExperts = []
+              showPreview()
             } else if (event.event === 'result') {
               const narrative = event.narrative as string
               const experts = (event.experts ?? []) as Expert[]
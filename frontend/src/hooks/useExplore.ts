@@ -1,9 +1,51 @@
 import { useCallback, useEffect, useRef, useState } from 'react'
 import { useExplorerStore } from '../store'
+import type { Expert } from '../store/resultsSlice'
 import { trackEvent } from '../tracking'
 
 const API_BASE = import.meta.env.VITE_API_URL ?? ''
 
+// First-page fields of an ExploreResponse (GET /api/explore or one stream event)
+interface ExplorePage {
+  experts: Expert[]
+  total: number
+  cursor: number | null
+  max_rate?: number
+  snapshot?: string | null
+}
+
+// Progressive first page for text queries: /api/explore/stream sends a keyword-ranked
+// page ("keyword" event, cold queries only) and then the semantic ranking ("final").
+// Parses the SSE stream manually (same approach as useChat) and calls onPage per page.
+async function readExploreStream(
+  res: Response,
+  onPage: (data: ExplorePage, isFinal: boolean) => void,
+): Promise<void> {
+  if (!res.body) throw new Error('Empty response body')
+  const reader = res.body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+
+  while (true) {
+    const { done, value } = await reader.read()
+    if (done) break
+
+    buffer += decoder.decode(value, { stream: true })
+
+    // SSE events are separated by \n\n
+    const parts = buffer.split('\n\n')
+    buffer = parts.pop() ?? '' // last part may be incomplete
+
+    for (const part of parts) {
+      if (!part.startsWith('data: ')) continue
+      const event = JSON.parse(part.slice(6)) // strip "data: "
+      if (event.event === 'keyword') onPage(event, false)
+      else if (event.event === 'final') onPage(event, true)
+      else if (event.event === 'error') throw new Error(event.message ?? 'Search failed')
+    }
+  }
+}
+
 export function useExplore() {
   // Session-stable seed: generated once per page load, stays stable across filter changes.
   // Reused when user clears search and returns to pure filter mode (session-stable ordering).
@@ -36,6 +78,8 @@ export function useExplore() {
   const setFetchingMore = useExplorerStore((s) => s.setFetchingMore)
 
   const controllerRef = useRef<AbortController | null>(null)
+  // Ranking snapshot id from the first page — sent with cursor so later pages slice the same ranking
+  const snapshotRef = useRef<string | null>(null)
 
   useEffect(() => {
     // Abort any in-flight request from the previous effect run
@@ -70,30 +114,38 @@ export function useExplore() {
     setLoading(true)
     setError(null)
 
-    fetch(`${API_BASE}/api/explore?${params}`, { signal: controller.signal })
+    const onPage = (data: ExplorePage, isFinal: boolean) => {
+      snapshotRef.current = data.snapshot ?? null
+      setResults(data.experts, data.total, data.cursor, data.max_rate ?? 5000)
+      setLoading(false)
+      if (!isFinal) return // keyword page — the semantic ranking replaces it shortly
+      // Track search query for analytics — fires for any active filter (query, tags, or rate)
+      // Anonymous tracking: uses session_id (no email required)
+      const hasActiveFilter =
+        query.trim().length > 0 ||
+        tags.length > 0 ||
+        rateMin > 0 ||
+        rateMax < Infinity
+      if (hasActiveFilter) {
+        void trackEvent('search_query', {
+          query_text: query,
+          active_tags: tags,
+          rate_min: rateMin,
+          rate_max: rateMax,
+          result_count: data.total ?? 0,
+        })
+      }
+    }
+
+    // Text queries stream keyword results first; filter-only and saved views use the plain endpoint
+    const streaming = !savedFilter && query.trim().length > 0
+    const endpoint = streaming ? '/api/explore/stream' : '/api/explore'
+
+    fetch(`${API_BASE}${endpoint}?${params}`, { signal: controller.signal })
       .then((res) => {
         if (!res.ok) throw new Error(`HTTP ${res.status}`)
-        return res.json()
-      })
-      .then((data) => {
-        setResults(data.experts, data.total, data.cursor, data.max_rate ?? 5000)
-        setLoading(false)
-        // Track search query for analytics — fires for any active filter (query, tags, or rate)
-        // Anonymous tracking: uses session_id (no email required)
-        const hasActiveFilter =
-          query.trim().length > 0 ||
-          tags.length > 0 ||
-          rateMin > 0 ||
-          rateMax < Infinity
-        if (hasActiveFilter) {
-          void trackEvent('search_query', {
-            query_text: query,
-            active_tags: tags,
-            rate_min: rateMin,
-            rate_max: rateMax,
-            result_count: data.total ?? 0,
-          })
-        }
+        if (streaming) return readExploreStream(res, onPage)
+        return res.json().then((data: ExplorePage) => onPage(data, true))
       })
       .catch((err: Error) => {
         if (err.name === 'AbortError') {
@@ -125,6 +177,7 @@ export function useExplore() {
       params.set('tags', tags.join(','))
       params.set('industry_tags', industryTags.join(','))
       params.set('cursor', String(cursor))
+      if (snapshotRef.current) params.set('snapshot', snapshotRef.current)
       // Pass seed for pure filter mode pagination — preserves ordering across pages
       if (!query) {
         params.set('seed', String(seed))
@@ -132,6 +185,7 @@ export function useExplore() {
       const res = await fetch(`${API_BASE}/api/explore?${params}`)
       if (!res.ok) return
       const data = await res.json()
+      snapshotRef.current = data.snapshot ?? snapshotRef.current
       appendResults(data.experts, data.cursor ?? null)
     } catch {
       // silent — VirtuosoGrid will retry on next endReached trigger
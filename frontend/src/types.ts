@@ -21,7 +21,7 @@ export interface Message {
 export type ChatStatus =
   | 'idle'        // no active request
   | 'thinking'    // status:thinking event received, waiting for result
-  | 'streaming'   // result event received, narrative being displayed
+  | 'streaming'   // candidates / narrative / result events arriving, content being displayed
   | 'done'        // done event received
   | 'error'       // error event received
 
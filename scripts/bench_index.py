@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark: FAISS index types vs the exact flat baseline on synthetic catalogs.
+
+Usage:
+  python scripts/bench_index.py [--sizes 10000,100000,1000000] [--types flat,hnsw,ivf,sq8,fp16,pq]
+                                [--coarse mrl128,mrl256,binary] [--queries 200] [--k 10]
+                                [--json results.json]
+
+For each catalog size, generates clustered, L2-normalized OUTPUT_DIM vectors (expert
+embeddings cluster by domain, so uniform random data would flatter IVF and PQ),
+builds every index type with the same build_index() ingest uses
+(app/services/index_factory.py) and reports:
+
+  build_s    — train + add time
+  size_mb    — serialized index size (what the snapshot maps)
+  recall@k   — mean overlap of the top-k with the exact flat top-k
+  p50/p99_ms — single-query search latency (one query per call, as the API searches)
+
+--coarse adds the two-stage searches of app/services/coarse_search.py (code scan +
+exact rerank of COARSE_OVERFETCH x k candidates) as extra rows, with size_mb the
+size of the codes. Synthetic vectors have no Matryoshka structure, so add the size
+"catalog" to measure on the real faiss.index (queries: perturbed expert vectors).
+
+Needs no API key or database. The 1M size holds ~3 GB of float32 vectors plus
+each index in memory — pass smaller --sizes on small machines.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import faiss
+import numpy as np
+
+# Allow importing from app/ when run from repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config import FAISS_INDEX_PATH, OUTPUT_DIM
+from app.services.coarse_search import COARSE_MODES, COARSE_OVERFETCH, CoarseIndex
+from app.services.index_factory import INDEX_TYPES, build_index
+
+_CHUNK = 100_000  # rows generated per step — bounds temporary memory
+
+
+# ── Synthetic data ─────────────────────────────────────────────────────────────
+
+def synthetic_vectors(n: int, d: int, centers: np.ndarray, rng: np.random.Generator, spread: float) -> np.ndarray:
+    """n normalized vectors scattered around randomly chosen cluster centers."""
+    out = np.empty((n, d), dtype=np.float32)
+    for start in range(0, n, _CHUNK):
+        rows = min(_CHUNK, n - start)
+        assigned = centers[rng.integers(0, len(centers), rows)]
+        out[start:start + rows] = assigned + rng.standard_normal((rows, d), dtype=np.float32) * spread
+    faiss.normalize_L2(out)
+    return out
+
+
+def make_dataset(n: int, d: int, n_queries: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(16, int(np.sqrt(n))), d), dtype=np.float32)
+    faiss.normalize_L2(centers)
+    spread = 1.0 / np.sqrt(d)  # noise of the same norm as a center
+    base = synthetic_vectors(n, d, centers, rng, spread)
+    queries = synthetic_vectors(n_queries, d, centers, rng, spread)
+    return base, queries
+
+
+def catalog_dataset(n_queries: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """The real expert vectors; queries are randomly chosen experts plus small noise."""
+    index = faiss.read_index(str(FAISS_INDEX_PATH))
+    base = index.reconstruct_n(0, index.ntotal)
+    rng = np.random.default_rng(seed)
+    queries = base[rng.integers(0, len(base), n_queries)] + rng.normal(0, 0.02, (n_queries, base.shape[1]))
+    queries = queries.astype(np.float32)
+    faiss.normalize_L2(queries)
+    return base, queries
+
+
+# ── Measurements ───────────────────────────────────────────────────────────────
+
+def serialized_mb(index) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "index.faiss")
+        faiss.write_index(index, path)
+        return os.path.getsize(path) / 1e6
+
+
+def search_latencies_ms(index, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Top-k ids per query plus per-query latency, searching one query at a time."""
+    ids = np.empty((len(queries), k), dtype=np.int64)
+    latencies = np.empty(len(queries))
+    for i in range(len(queries)):
+        t0 = time.perf_counter()
+        _, found = index.search(queries[i:i + 1], k)
+        latencies[i] = (time.perf_counter() - t0) * 1000
+        ids[i] = found[0]
+    return ids, latencies
+
+
+def recall_at_k(found: np.ndarray, truth: np.ndarray) -> float:
+    k = truth.shape[1]
+    return float(np.mean([len(set(f) & set(t)) / k for f, t in zip(found, truth)]))
+
+
+def _report(row: dict, k: int) -> None:
+    print(
+        f"  {row['type']:<14} {row['factory']:<14} build {row['build_s']:>8.2f}s  "
+        f"{row['size_mb']:>8.1f} MB  recall@{k} {row[f'recall@{k}']:.4f}  "
+        f"p50 {row['p50_ms']:.3f} ms  p99 {row['p99_ms']:.3f} ms"
+    )
+
+
+def bench_size(size: str, types: list[str], coarse_modes: list[str], n_queries: int, k: int, seed: int) -> list[dict]:
+    if size == "catalog":
+        base, queries = catalog_dataset(n_queries, seed)
+    else:
+        base, queries = make_dataset(int(size), OUTPUT_DIM, n_queries, seed)
+    n = len(base)
+    print(f"\n== {size}: {n:,} vectors x {base.shape[1]} dims ==")
+    exact = faiss.IndexFlatIP(base.shape[1])
+    exact.add(base)
+    _, truth = exact.search(queries, k)
+
+    rows = []
+    for index_type in types:
+        t0 = time.perf_counter()
+        index, info = build_index(base, index_type, seed=seed)
+        build_s = time.perf_counter() - t0
+        found, latencies = search_latencies_ms(index, queries, k)
+        row = {
+            "size": n,
+            "type": index_type,
+            "factory": info["factory"],
+            "params": info["params"],
+            "build_s": round(build_s, 2),
+            "size_mb": round(serialized_mb(index), 1),
+            f"recall@{k}": round(recall_at_k(found, truth), 4),
+            "p50_ms": round(float(np.percentile(latencies, 50)), 3),
+            "p99_ms": round(float(np.percentile(latencies, 99)), 3),
+        }
+        rows.append(row)
+        _report(row, k)
+        del index
+
+    for mode in coarse_modes:
+        t0 = time.perf_counter()
+        coarse = CoarseIndex(base, mode)
+        build_s = time.perf_counter() - t0
+        found, latencies = search_latencies_ms(coarse, queries, k)
+        row = {
+            "size": n,
+            "type": f"coarse:{mode}",
+            "factory": f"{mode}+rerank",
+            "params": {"overfetch": COARSE_OVERFETCH},
+            "build_s": round(build_s, 2),
+            "size_mb": round(coarse.code_bytes / 1e6, 1),
+            f"recall@{k}": round(recall_at_k(found, truth), 4),
+            "p50_ms": round(float(np.percentile(latencies, 50)), 3),
+            "p99_ms": round(float(np.percentile(latencies, 99)), 3),
+        }
+        rows.append(row)
+        _report(row, k)
+        del coarse
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--sizes", default="10000,100000,1000000", help='comma-separated catalog sizes, or "catalog" for faiss.index'
+    )
+    parser.add_argument("--types", default=",".join(INDEX_TYPES), help="comma-separated index types")
+    parser.add_argument("--coarse", default="", help="comma-separated two-stage modes (mrl128, mrl256, binary)")
+    parser.add_argument("--queries", type=int, default=200, help="queries per size (default 200)")
+    parser.add_argument("--k", type=int, default=10, help="recall@k cutoff (default 10)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--json", type=Path, help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    types = [t.strip() for t in args.types.split(",") if t.strip()]
+    coarse_modes = [m.strip() for m in args.coarse.split(",") if m.strip()]
+    unknown = [t for t in types if t not in INDEX_TYPES]
+    if unknown:
+        parser.error(f"unknown index types: {', '.join(unknown)} (expected {', '.join(INDEX_TYPES)})")
+    unknown = [m for m in coarse_modes if m not in COARSE_MODES or m == "off"]
+    if unknown:
+        parser.error(f"unknown coarse modes: {', '.join(unknown)} (expected {', '.join(COARSE_MODES[1:])})")
+
+    print(f"FAISS {faiss.__version__}, {faiss.omp_get_max_threads()} threads, {args.queries} queries, k={args.k}")
+    results = []
+    for size in sizes:
+        results.extend(bench_size(size, types, coarse_modes, args.queries, args.k, args.seed))
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,14 @@ Offline ingestion: Expert DB table -> FAISS index + metadata JSON.
 Run AFTER scripts/tag_experts.py has tagged experts:
   python scripts/ingest.py
 
-NEVER call this at API startup — it takes 60+ seconds and hits the embedding API.
+NEVER call this at API startup — it hits the embedding API (60+ seconds for a full
+re-embed).
+
+Incremental: each expert's vector is stored keyed by the hash of its embedding text
+(app/services/expert_embedding_store.py), so a rebuild only embeds experts whose text
+changed and assembles the index from stored vectors — seconds after a delete or a
+single edit. To re-embed everything:
+  python scripts/ingest.py --full
 
 Source: SQLAlchemy Expert table (NOT experts.csv — tags written by tag_experts.py
 are included in the embedding text only when reading from DB).
@@ -16,7 +23,18 @@ excluded from tagging and therefore excluded from the FAISS index.
 Index promotion: written to staging path first, count assertion checked,
 then atomically renamed to production path. Prevents a partial write from
 corrupting the production index.
+
+Also writes the read-only server snapshot as a new generation under SNAPSHOT_DIR
+(mmap-able index plus columnar metadata, app/services/index_snapshot.py) and points
+CURRENT at it; older generations stay available for admin rollback. To build it
+from the existing faiss.index / metadata.json without re-embedding:
+  python scripts/ingest.py --snapshot-only
+
+faiss.index is always exact (IndexFlatIP). The snapshot index type defaults to
+INDEX_TYPE and can be chosen per run (app/services/index_factory.py):
+  python scripts/ingest.py --snapshot-only --index-type hnsw
 """
+import argparse
 import json
 import sys
 import time
@@ -38,15 +56,33 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from app.config import (  # noqa: E402
     EMBEDDING_MODEL,
     FAISS_INDEX_PATH,
+    INDEX_TYPE,
     INGEST_BATCH_SIZE,
     METADATA_PATH,
     OUTPUT_DIM,
+    SNAPSHOT_DIR,
 )
-from app.database import SessionLocal  # noqa: E402
+from app.database import Base, SessionLocal, engine  # noqa: E402
 from app.models import Expert  # noqa: E402
+from app.services.expert_embedding_store import (  # noqa: E402
+    content_hash,
+    load_expert_embeddings,
+    prune_expert_embeddings,
+    store_expert_embeddings,
+)
+from app.services.index_factory import INDEX_TYPES  # noqa: E402
+from app.services.index_snapshot import write_snapshot  # noqa: E402
 from sqlalchemy import select  # noqa: E402
 
-client = genai.Client()
+_client: genai.Client | None = None
+
+
+def _get_client() -> genai.Client:
+    """Created on first embed call so --snapshot-only runs without GOOGLE_API_KEY."""
+    global _client
+    if _client is None:
+        _client = genai.Client()
+    return _client
 
 STAGING_PATH = FAISS_INDEX_PATH.with_suffix(".staging")
 
@@ -127,7 +163,7 @@ def embed_batch(texts: list[str]) -> list[list[float]]:
     Embed a batch of texts with tenacity retry for 429 rate limit errors.
     Returns list of OUTPUT_DIM-length float vectors.
     """
-    result = client.models.embed_content(
+    result = _get_client().models.embed_content(
         model=EMBEDDING_MODEL,
         contents=texts,
         config=types.EmbedContentConfig(
@@ -138,47 +174,100 @@ def embed_batch(texts: list[str]) -> list[list[float]]:
     return [e.values for e in result.embeddings]
 
 
-def build_index(experts: list[dict]) -> tuple[faiss.IndexFlatIP, list[dict]]:
+def build_index(experts: list[dict], full: bool = False) -> tuple[faiss.IndexFlatIP, list[dict], set[str]]:
     """
-    Embed all experts in batches and build a FAISS IndexFlatIP.
-    Applies L2 normalization (required for truncated-dim cosine similarity).
+    Assemble a FAISS IndexFlatIP from stored vectors, embedding only changed experts.
+
+    Vectors are looked up in the expert embedding store by the hash of each expert's
+    embedding text; only misses (new or edited experts, or all of them with full=True)
+    are embedded, in batches, and stored as each batch completes so an interrupted run
+    keeps its progress; with full=True the fresh vectors replace the stored ones.
+    Applies L2 normalization (required for truncated-dim cosine similarity). Also
+    returns the content hashes the index uses.
     """
-    all_vectors: list[list[float]] = []
-    total = len(experts)
+    texts = [expert_to_text(e) for e in experts]
+    hashes = [content_hash(t) for t in texts]
+    vectors = {} if full else load_expert_embeddings(list(set(hashes)))
+
+    # One API embedding per distinct changed text
+    to_embed = list({h: t for h, t in zip(hashes, texts) if h not in vectors}.items())
+    reused = sum(h in vectors for h in hashes)
+    print(f"  {reused} experts reuse stored vectors, {len(to_embed)} texts to embed")
 
+    total = len(to_embed)
     for i in range(0, total, INGEST_BATCH_SIZE):
-        batch = experts[i:i + INGEST_BATCH_SIZE]
-        texts = [expert_to_text(e) for e in batch]
+        batch = to_embed[i:i + INGEST_BATCH_SIZE]
 
         try:
-            vectors = embed_batch(texts)
+            embedded = embed_batch([t for _, t in batch])
         except Exception as e:
             print(f"[error] Batch {i}-{i + len(batch)} failed after retries: {e}")
             raise
 
-        all_vectors.extend(vectors)
+        batch_matrix = np.array(embedded, dtype=np.float32)
+        faiss.normalize_L2(batch_matrix)
+        batch_vectors = {h: vec for (h, _), vec in zip(batch, batch_matrix)}
+        store_expert_embeddings(batch_vectors, replace=full)
+        vectors.update(batch_vectors)
 
         done = min(i + INGEST_BATCH_SIZE, total)
-        print(f"  Embedded {done}/{total} experts ({done * 100 // total}%)")
+        print(f"  Embedded {done}/{total} texts ({done * 100 // total}%)")
 
         if i + INGEST_BATCH_SIZE < total:
             time.sleep(0.5)
 
-    matrix = np.array(all_vectors, dtype=np.float32)
+    matrix = np.stack([vectors[h] for h in hashes]).astype(np.float32)
     faiss.normalize_L2(matrix)
 
     index = faiss.IndexFlatIP(OUTPUT_DIM)
     index.add(matrix)
 
-    return index, experts  # Return original experts dicts as metadata
+    return index, experts, set(hashes)  # Return original experts dicts as metadata
+
+
+def snapshot_only(index_type: str) -> None:
+    """Rebuild the server snapshot from the current faiss.index + metadata.json."""
+    index = faiss.read_index(str(FAISS_INDEX_PATH))
+    with open(METADATA_PATH, encoding="utf-8") as f:
+        metadata = json.load(f)
+    assert index.ntotal == len(metadata), f"Index/metadata mismatch: {index.ntotal} != {len(metadata)}"
+    manifest = write_snapshot(index, metadata, index_type=index_type)
+    print(
+        f"Snapshot: {SNAPSHOT_DIR} generation {manifest['generation']} "
+        f"({index.ntotal} vectors, {len(metadata)} records, index {manifest['index']['factory']})"
+    )
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--snapshot-only",
+        action="store_true",
+        help="only rebuild the server snapshot from the existing index and metadata",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="re-embed every expert instead of reusing stored vectors for unchanged ones",
+    )
+    parser.add_argument(
+        "--index-type",
+        choices=INDEX_TYPES,
+        default=INDEX_TYPE,
+        help=f"snapshot index type (default: INDEX_TYPE env, currently {INDEX_TYPE})",
+    )
+    args = parser.parse_args()
+    if args.snapshot_only:
+        snapshot_only(args.index_type)
+        return
+
     # Clean up any stale staging file from a previous crashed run
     if STAGING_PATH.exists():
         STAGING_PATH.unlink()
         print(f"Removed stale staging file: {STAGING_PATH}")
 
+    Base.metadata.create_all(bind=engine)  # expert_embeddings on databases older than the table
+
     print("Loading tagged experts from DB...")
     experts = load_tagged_experts()
     actual_count = len(experts)
@@ -193,7 +282,7 @@ def main() -> None:
     print(f"  Model: {EMBEDDING_MODEL}, dim: {OUTPUT_DIM}")
     print()
 
-    index, metadata = build_index(experts)
+    index, metadata, hashes = build_index(experts, full=args.full)
 
     # Crash-safe promotion: write to staging, assert count, then rename to production path
     FAISS_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -217,6 +306,17 @@ def main() -> None:
         json.dump(metadata, f, ensure_ascii=False, indent=None, default=str)
     print(f"  Metadata: {METADATA_PATH} ({len(metadata)} records)")
 
+    # Vectors of experts that left the index (deleted, untagged, or edited since)
+    pruned = prune_expert_embeddings(hashes)
+    print(f"  Embedding store: {len(hashes)} vectors referenced, {pruned} stale pruned")
+
+    # Server snapshot last — it must be newer than faiss.index / metadata.json to be used
+    manifest = write_snapshot(index, metadata, index_type=args.index_type)
+    print(
+        f"  Snapshot: {SNAPSHOT_DIR} generation {manifest['generation']} "
+        f"(memory-mapped {manifest['index']['factory']} index + columnar metadata)"
+    )
+
     print()
     print(f"Ingestion complete: {index.ntotal} experts indexed at {OUTPUT_DIM} dims.")
 
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Offline batch script: pre-embed the most frequent past queries into the
+persistent query-embedding store (query_embeddings table).
+
+Usage:
+  python scripts/warm_embeddings.py [--top 500] [--days 90]
+
+Prerequisites:
+  1. GOOGLE_API_KEY set in environment (or .env file)
+  2. Run from repo root against the production database (VAR_DIR)
+
+Behavior:
+  - Collects the --top most frequent query texts from user_events
+    (search_query payloads, $.query_text) and conversations.query
+  - Warms each query in both forms it is embedded in live: as typed (chat) and
+    lowercased (explore embeds normalize_query(), the explore cache key)
+  - Skips queries already stored for the current model/dim (idempotent — safe to re-run)
+  - Embeds the rest with batched embed_content calls (INGEST_BATCH_SIZE per call),
+    so the first live request for a popular query never waits on the Google API
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Load .env for local development — no-op in production
+load_dotenv()
+
+# Allow importing from app/ when run from repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import text
+
+from app.database import Base, SessionLocal, engine
+from app.services.embedder import warm_embeddings
+from app.services.embedding_store import normalize_embedding_text
+from app.services.explore_cache import normalize_query
+
+# ── Query sources ──────────────────────────────────────────────────────────────
+
+_TOP_QUERIES_SQL = text("""
+    SELECT q, COUNT(*) AS frequency FROM (
+        SELECT json_extract(payload, '$.query_text') AS q
+        FROM user_events
+        WHERE event_type = 'search_query' AND created_at >= datetime('now', :since)
+        UNION ALL
+        SELECT query AS q
+        FROM conversations
+        WHERE created_at >= datetime('now', :since)
+    )
+    WHERE q IS NOT NULL AND TRIM(q) != ''
+    GROUP BY q
+    ORDER BY frequency DESC
+""")
+
+
+def load_top_queries(top: int, days: int) -> list[str]:
+    """Most frequent distinct query texts (after whitespace normalization), most frequent first."""
+    with SessionLocal() as db:
+        rows = db.execute(_TOP_QUERIES_SQL, {"since": f"-{days} days"}).all()
+    counts: dict[str, int] = {}
+    for query, frequency in rows:
+        key = normalize_embedding_text(query)
+        counts[key] = counts.get(key, 0) + frequency
+    return sorted(counts, key=counts.__getitem__, reverse=True)[:top]
+
+
+def embedding_forms(queries: list[str]) -> list[str]:
+    """Each query as chat embeds it and as explore embeds it; duplicates dropped."""
+    return list(dict.fromkeys(form for query in queries for form in (query, normalize_query(query))))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=500, help="number of most frequent queries to warm")
+    parser.add_argument("--days", type=int, default=90, help="look-back window in days")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)  # query_embeddings on databases older than the table
+
+    queries = load_top_queries(args.top, args.days)
+    print(f"Loaded {len(queries)} distinct top queries from the last {args.days} days")
+    texts = embedding_forms(queries)
+    embedded = warm_embeddings(texts)
+    print(f"Embedded {embedded} new query texts ({len(texts) - embedded} already stored)")
+
+
+if __name__ == "__main__":
+    main()